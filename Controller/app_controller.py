@@ -24,17 +24,28 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
+import os
 import logging
+from os.path import splitext
+from tempfile import gettempdir
 from logging import DEBUG
 from datetime import datetime
-from asyncio import create_task, sleep
-from aioserial import AioSerial
+from asyncio import create_task, sleep, wait
 from PySide2.QtWidgets import QFileDialog
 from PySide2.QtGui import QKeyEvent, QDesktopServices
 from PySide2.QtCore import QSettings, QSize, QUrl, QDir
 from Model.app_model import AppModel
-from Model.app_defs import current_version, log_format, LangEnum
-from Model.app_helpers import setup_log_file, get_disk_usage_stats, format_current_time, end_tasks
+from Model.app_defs import current_version, log_format, shutdown_save_timeout, LangEnum
+from Model.event_bus import EventTopic
+from Model.task_supervisor import get_supervisor, TaskKind
+from Model.app_helpers import setup_log_file, get_disk_usage_stats, format_current_time
+from Model.lifecycle_timer import get_lifecycle_timer
+from Model.tracer import get_tracer, trace
+from Model.app_logging import LogPipeline
+from Model.app_profiler import get_profiler
+from Model.loop_monitor import get_loop_monitor
+from Model.metrics import get_metrics, MetricsServer
+from Model.pipeline_trace import get_pipeline_tracer
 from Resources.Strings.app_strings import strings, StringsEnum, company_name, app_name
 from View.HelpWidgets.output_window import OutputWindow
 from View.MainWindow.main_window import AppMainWindow
@@ -42,6 +53,7 @@ from View.ControlWidgets.menu_bar import AppMenuBar
 from View.ControlWidgets.button_box import ButtonBox
 from View.InfoWidgets.info_box import InfoBox
 from View.InfoWidgets.drive_info_box import DriveInfoBox
+from View.InfoWidgets.loop_lag_box import LoopLagBox
 from View.InfoWidgets.flag_box import FlagBox
 from View.ControlWidgets.note_box import NoteBox
 from View.DeviceDisplayWidgets.mdi_area import MDIArea
@@ -49,7 +61,10 @@ from View.DeviceDisplayWidgets.mdi_area import MDIArea
 
 class AppController:
     """ The main controller for this app. """
-    def __init__(self):
+    def __init__(self, profile: bool = False):
+        """
+        :param profile: Profile the app from launch, as well as when the profiling setting is on.
+        """
         # App settings and logging.
         self._settings = QSettings(company_name, app_name)
 
@@ -61,22 +76,33 @@ class AppController:
         self._settings.beginGroup("logging")
         if not self._settings.contains("level"):
             self._settings.setValue("level", DEBUG)
-        log_level = self._settings.value('level')
+        log_level = self._settings.value('level', type=int)
+        if not self._settings.contains("trace"):
+            self._settings.setValue("trace", False)
+        get_tracer().set_enabled(self._settings.value("trace", type=bool))
+        if not self._settings.contains("pipeline_sample"):
+            self._settings.setValue("pipeline_sample", 1)
+        get_pipeline_tracer().set_sample_every(self._settings.value("pipeline_sample", type=int))
+        self._settings.endGroup()
+
+        if not self._settings.contains("profiling/at_launch"):
+            self._settings.setValue("profiling/at_launch", False)
+        profile = profile or self._settings.value("profiling/at_launch", type=bool)
+
+        self._settings.beginGroup("metrics")
+        if not self._settings.contains("port"):
+            self._settings.setValue("port", 0)
+        if not self._settings.contains("save_with_exp"):
+            self._settings.setValue("save_with_exp", True)
+        self._metrics_port = self._settings.value("port", type=int)  # 0 means no metrics server.
+        save_metrics = self._settings.value("save_with_exp", type=bool)
         self._settings.endGroup()
 
         log_file = setup_log_file(self._strings[StringsEnum.LOG_OUT_NAME], self._strings[StringsEnum.PROG_OUT_HDR])
-        logging.basicConfig(filename=log_file, filemode='w', level=log_level, format=log_format)
+        self._log_pipeline = LogPipeline(log_file, log_level, log_format)
         self._logger = logging.getLogger(__name__)
         self.log_output = OutputWindow(self._lang)
-        self.formatter = logging.Formatter(log_format)
-        self.app_lh = logging.StreamHandler(self.log_output)
-        self.app_lh.setLevel(log_level)
-        self.app_lh.setFormatter(self.formatter)
-        self.stderr_lh = logging.StreamHandler()
-        self.stderr_lh.setLevel(logging.WARNING)
-        self.stderr_lh.setFormatter(self.formatter)
-        self._logger.addHandler(self.app_lh)
-        self._logger.addHandler(self.stderr_lh)
+        self._log_pipeline.set_ui_writer(self.log_output.add_records)
         self._logger.info(self._strings[StringsEnum.LOG_VER_ID] + str(current_version))
 
         self._logger.debug("Initializing")
@@ -88,19 +114,28 @@ class AppController:
         flag_box_size = QSize(80, 120)
         note_box_size = QSize(250, 120)
         drive_info_box_size = QSize(200, 120)
+        loop_lag_box_size = QSize(200, 120)
         mdi_area_min_size = QSize(500, 300)
-        self.main_window = AppMainWindow(ui_min_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.menu_bar = AppMenuBar(self.main_window, [self.app_lh, self.stderr_lh], self._lang)
-        self.button_box = ButtonBox(self.main_window, button_box_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.info_box = InfoBox(self.main_window, info_box_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.d_info_box = DriveInfoBox(self.main_window, drive_info_box_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.flag_box = FlagBox(self.main_window, flag_box_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.note_box = NoteBox(self.main_window, note_box_size, [self.app_lh, self.stderr_lh], self._lang)
-        self.mdi_area = MDIArea(self.main_window, mdi_area_min_size, [self.app_lh, self.stderr_lh])
+        self.main_window = AppMainWindow(ui_min_size, self._lang)
+        self.menu_bar = AppMenuBar(self.main_window, self._lang)
+        self.button_box = ButtonBox(self.main_window, button_box_size, self._lang)
+        self.info_box = InfoBox(self.main_window, info_box_size, self._lang)
+        self.d_info_box = DriveInfoBox(self.main_window, drive_info_box_size, self._lang)
+        self.lag_box = LoopLagBox(self.main_window, loop_lag_box_size, self._lang)
+        self.flag_box = FlagBox(self.main_window, flag_box_size, self._lang)
+        self.note_box = NoteBox(self.main_window, note_box_size, self._lang)
+        self.mdi_area = MDIArea(self.main_window, mdi_area_min_size)
+        self.diagnostics = None  # Built the first time it is opened. See _get_diagnostics().
         self._file_dialog = QFileDialog(self.main_window)
 
         # Model
-        self._model = AppModel([self.app_lh, self.stderr_lh], self._lang)
+        get_profiler().install()  # Before any tasks are made so profiling started later still times them.
+        self._model = AppModel(self._lang)
+        self._model.set_save_metrics(save_metrics)
+        self._new_view_queue = self._model.subscribe(EventTopic.VIEW_ADD)
+        self._remove_view_queue = self._model.subscribe(EventTopic.VIEW_REMOVE)
+        self._conn_err_queue = self._model.subscribe(EventTopic.DEVICE_CONN_ERR)
+        self._start_err_queue = self._model.subscribe(EventTopic.EXP_START_ERR)
 
         # from PySide2.QtWidgets import QMdiSubWindow
         # for i in range(6):
@@ -111,19 +146,22 @@ class AppController:
         self._save_file_name = str()
         self._save_dir = str()
         self._tasks = []
+        self._shutdown_task = None
         self._setup_handlers()
         self._initialize_view()
+        if profile:
+            self.profile_handler(True)
         self._start()
         self._logger.debug("Initialized")
         self._drive_updater_task = None
         self._curr_cond_name = ""
 
+    @trace
     def language_change_handler(self, lang: LangEnum) -> None:
         """
         Sets the app language to the user selection.
         :return None:
         """
-        self._logger.debug("running")
         self._settings.setValue("language", lang)
         self._strings = strings[lang]
         self.main_window.set_lang(lang)
@@ -131,10 +169,12 @@ class AppController:
         self.button_box.set_lang(lang)
         self.info_box.set_lang(lang)
         self.d_info_box.set_lang(lang)
+        self.lag_box.set_lang(lang)
         self.flag_box.set_lang(lang)
         self.note_box.set_lang(lang)
+        if self.diagnostics:
+            self.diagnostics.set_lang(lang)
         self._model.change_lang(lang)
-        self._logger.debug("done")
 
     def debug_change_handler(self, debug_level: str) -> None:
         """
@@ -145,12 +185,12 @@ class AppController:
         self._settings.setValue("logging/level", debug_level)
         self.main_window.show_help_window(self._strings[StringsEnum.APP_NAME], self._strings[StringsEnum.RESTART_PROG])
 
+    @trace
     def create_end_exp_handler(self) -> None:
         """
         Handler for create/end button.
         :return None:
         """
-        self._logger.debug("running")
         if not self._model.exp_created:
             self._logger.debug("creating experiment")
             if not self._get_save_file_name():
@@ -158,54 +198,44 @@ class AppController:
                 return
             self._create_exp()
             self.main_window.set_close_check(True)
-            self._logger.debug("done")
         else:
             self._logger.debug("ending experiment")
             self._end_exp()
             self.main_window.set_close_check(False)
             self._save_file_name = ""
-        self._logger.debug("done")
 
+    @trace
     def start_stop_exp_handler(self) -> None:
         """
         Handler play/pause button.
         :return None:
         """
-        self._logger.debug("running")
         if self._model.exp_running:
             self._logger.debug("stopping experiment")
             self._stop_exp()
         else:
             self._logger.debug("starting experiment")
             self._start_exp()
-        self._logger.debug("done")
 
+    @trace
     async def new_device_view_handler(self) -> None:
         """
-        Check for and handle any new device view objects from model.
+        Wait for and handle any new device view objects from model.
         :return None:
         """
-        self._logger.debug("running")
-        dev_type: str
-        dev_port: AioSerial
         while True:
-            await self._model.await_new_view()
-            ret, view = self._model.get_next_new_view()
-            while ret:
-                self.mdi_area.add_window(view)
-                ret, view = self._model.get_next_new_view()
+            view = await self._new_view_queue.get()
+            self.mdi_area.add_window(view)
+            self._model.view_shown(view)
 
     async def remove_device_view_handler(self) -> None:
         """
-        Check for and handle any device views to remove from model.
+        Wait for and handle any device views to remove from model.
         :return None:
         """
         while True:
-            await self._model.await_remove_view()
-            ret, view = self._model.get_next_view_to_remove()
-            while ret:
-                self.mdi_area.remove_window(view)
-                ret, view = self._model.get_next_view_to_remove()
+            view = await self._remove_view_queue.get()
+            self.mdi_area.remove_window(view)
 
     async def device_conn_error_handler(self) -> None:
         """
@@ -213,47 +243,65 @@ class AppController:
         :return None:
         """
         while True:
-            await self._model.await_dev_con_err()
+            await self._conn_err_queue.get()
             self.main_window.show_help_window("Error", self._strings[StringsEnum.DEV_CON_ERR])
 
+    @trace
+    async def exp_start_error_handler(self) -> None:
+        """
+        Put the view back to stopped and alert user when an experiment could not be started on every device.
+        :return None:
+        """
+        while True:
+            await self._start_err_queue.get()
+            block = max(int(self.info_box.get_block_num()) - 1, 0)
+            self.info_box.set_block_num(str(block))
+            self.button_box.set_start_button_state(2 if block > 0 else 0)
+            self.button_box.set_condition_name_box_enabled(True)
+            self.main_window.show_help_window("Error", self._strings[StringsEnum.EXP_START_ERR])
+
+    @trace
     def post_handler(self) -> None:
         """
         Handler for post button.
         :return:
         """
-        self._logger.debug("running")
         note = self.note_box.get_note()
         self.note_box.clear_note()
         self._model.save_note(note)
-        self._logger.debug("done")
 
+    @trace
     def about_rs_handler(self) -> None:
         """
         Handler for about company button.
         :return None:
         """
-        self._logger.debug("running")
         self.main_window.show_help_window(self._strings[StringsEnum.APP_NAME],
                                           self._strings[StringsEnum.ABOUT_COMPANY])
-        self._logger.debug("done")
 
+    @trace
     def about_app_handler(self) -> None:
         """
         Handler for about app button.
         :return None:
         """
-        self._logger.debug("running")
         self.main_window.show_help_window(self._strings[StringsEnum.APP_NAME],
                                           self._strings[StringsEnum.ABOUT_APP])
-        self._logger.debug("done")
 
     def check_for_updates_handler(self) -> None:
         """
         Handler for update button.
         :return None:
         """
-        self._logger.debug("running")
-        ret = self._model.check_version()
+        get_supervisor().spawn(TaskKind.NET, self._check_for_updates, key="update button")
+
+    @trace
+    async def _check_for_updates(self) -> None:
+        """
+        Check for a newer version and tell the user the result.
+        :return None:
+        """
+        ret = await self._model.check_version()
         if ret == 1:
             self.main_window.show_help_window(self._strings[StringsEnum.UPDATE_HDR],
                                               self._strings[StringsEnum.UPDATE_AVAILABLE])
@@ -263,38 +311,103 @@ class AppController:
         elif ret == -1:
             self.main_window.show_help_window(self._strings[StringsEnum.UPDATE_HDR_ERR],
                                               self._strings[StringsEnum.ERR_UPDATE_CHECK])
-        self._logger.debug("done")
 
+    @trace
     def log_window_handler(self) -> None:
         """
         Handler for output log button.
         :return None:
         """
-        self._logger.debug("running")
         self.log_output.show()
-        self._logger.debug("done")
 
+    @trace
+    def diagnostics_window_handler(self) -> None:
+        """
+        Handler for diagnostics window button.
+        :return None:
+        """
+        self.diagnostics_refresh_handler()
+        self._get_diagnostics().show()
+
+    @trace
+    def profile_handler(self, profiling: bool) -> None:
+        """
+        Handler for profile button. Starts profiling, or stops it and saves the reports next to the experiment.
+        :param profiling: Whether profiling should be on.
+        :return None:
+        """
+        profiler = get_profiler()
+        if profiling:
+            profiler.start()
+        else:
+            profiler.stop(self._get_profile_base_name())
+        self.menu_bar.set_profile_checked(profiler.is_running())
+
+    @trace
+    def diagnostics_refresh_handler(self) -> None:
+        """
+        Handler for diagnostics refresh button.
+        :return None:
+        """
+        timer = get_lifecycle_timer()
+        rows = []
+        for span in timer.get_spans():
+            duration = span.get_duration()
+            rows.append((span.device, span.phase.name, str(round((span.start - timer.get_origin()) * 1000, 2)),
+                         str(round(duration * 1000, 2)) if duration >= 0 else "-"))
+        diagnostics = self._get_diagnostics()
+        diagnostics.set_timing_rows(rows)
+        diagnostics.set_event_rows([tuple(str(x) for x in row) for row in self._model.get_event_bus().get_stats()])
+        diagnostics.set_task_rows([tuple(str(x) for x in row) for row in get_supervisor().get_stats()])
+        diagnostics.set_metric_rows(get_metrics().get_rows())
+
+    def _get_diagnostics(self):
+        """
+        Build the diagnostics window if it has not been opened yet. It is left out of startup since most sessions
+        never open it.
+        :return DiagnosticsWindow: The diagnostics window.
+        """
+        if self.diagnostics is None:
+            from View.HelpWidgets.diagnostics_window import DiagnosticsWindow
+            self.diagnostics = DiagnosticsWindow(self._settings.value("language"))
+            self.diagnostics.add_refresh_handler(self.diagnostics_refresh_handler)
+            self.diagnostics.add_export_handler(self.diagnostics_export_handler)
+        return self.diagnostics
+
+    @trace
+    def diagnostics_export_handler(self) -> None:
+        """
+        Handler for diagnostics export button.
+        :return None:
+        """
+        filename = self._file_dialog.getSaveFileName(filter="*.csv")[0]
+        if len(filename) > 1:
+            get_lifecycle_timer().export_csv(filename)
+            tracer = get_tracer()
+            if tracer.enabled:
+                tracer.export_csv(splitext(filename)[0] + "_trace.csv")
+            if get_pipeline_tracer().get_traces():
+                get_pipeline_tracer().export_json(splitext(filename)[0] + "_pipeline.json")
+
+    @trace
     def last_save_dir_handler(self) -> None:
         """
         Handler for last save dir button.
         :return None:
         """
-        self._logger.debug("running")
         if self._save_dir == "":
             QDesktopServices.openUrl(QUrl.fromLocalFile(QDir().homePath()))
         else:
             QDesktopServices.openUrl(QUrl.fromLocalFile(self._save_dir))
-        self._logger.debug("done")
 
     # TODO: Implement
+    @trace
     def toggle_cam_handler(self) -> None:
         """
         Handler for use cam button.
         :return None:
         """
-        self._logger.debug("running")
         print("Implement handling for this button")
-        self._logger.debug("done")
 
     async def _update_drive_info_box(self):
         while True:
@@ -305,31 +418,41 @@ class AppController:
             self.d_info_box.set_mb_val(str(info[3]))
             await sleep(3)
 
+    async def _update_lag_box(self) -> None:
+        """
+        Show the event loop monitor's latest numbers in the lag box once a second.
+        :return None:
+        """
+        monitor = get_loop_monitor()
+        while True:
+            self.lag_box.set_values(monitor.get_current() * 1000, monitor.get_worst() * 1000,
+                                    len(monitor.get_stalls()), monitor.get_histogram(), monitor.get_slow_bucket())
+            await sleep(1)
+
+    @trace
     def _create_exp(self) -> None:
         """
         Create an experiment. Signal devices and update view.
         :return None:
         """
-        self._logger.debug("running")
         self._model.signal_create_exp(self._save_file_name)
         if self._model.exp_created:
             self.button_box.set_start_button_enabled(True)
             self.button_box.set_create_button_state(1)
             self._check_toggle_post_button()
             if self._set_drive_updater():
-                self._drive_updater_task = create_task(self._update_drive_info_box())
+                self._drive_updater_task = get_supervisor().spawn(TaskKind.LOOP, self._update_drive_info_box)
             self.info_box.set_start_time(format_current_time(datetime.now(), time=True))
         else:
             self.button_box.set_create_button_state(0)
-        self._logger.debug("done")
 
+    @trace
     def _end_exp(self, save: bool = True) -> None:
         """
         End an experiment. Stop experiment if running then signal devices and update view.
         :param save: Save exp data.
         :return None:
         """
-        self._logger.debug("running")
         if self._model.exp_running:
             self._stop_exp()
         self._model.signal_end_exp(save)
@@ -341,14 +464,13 @@ class AppController:
         self.button_box.set_create_button_state(0)
         self.button_box.set_start_button_enabled(False)
         self.button_box.set_start_button_state(0)
-        self._logger.debug("done")
 
+    @trace
     def _start_exp(self) -> None:
         """
         Start an experiment if one has been created. Signal devices and update view.
         :return None:
         """
-        self._logger.debug("running")
         self._model.signal_start_exp()
         if not self._model.exp_running:
             return
@@ -356,18 +478,16 @@ class AppController:
         self.button_box.set_start_button_state(1)
         self.button_box.set_condition_name_box_enabled(False)
         self._curr_cond_name = self.button_box.get_condition_name()
-        self._logger.debug("done")
 
+    @trace
     def _stop_exp(self) -> None:
         """
         Stop an experiment. Signal devices and update view.
         :return None:
         """
-        self._logger.debug("running")
         self._model.signal_stop_exp()
         self.button_box.set_start_button_state(2)
         self.button_box.set_condition_name_box_enabled(True)
-        self._logger.debug("done")
 
     def _set_drive_updater(self, filename: str = None) -> bool:
         """
@@ -384,63 +504,69 @@ class AppController:
             ret = False
         return ret
 
+    @trace
     def _check_toggle_post_button(self) -> None:
         """
         If an experiment is created and running and there is a note then allow user access to post button.
         :return None:
         """
-        self._logger.debug("running")
         if self._model.exp_created and len(self.note_box.get_note()) > 0:
             self._logger.debug("button = true")
             self.note_box.set_post_button_enabled(True)
         else:
             self._logger.debug("button = false")
             self.note_box.set_post_button_enabled(False)
-        self._logger.debug("done")
 
+    @trace
     def _get_save_file_name(self) -> bool:
         """
         Gets a new filename from the user for the current experiment to be saved as.
         :return bool: True if the file name is longer than 1 character
         """
-        self._logger.debug("running")
         self._save_file_name = self._file_dialog.getSaveFileName(filter="*.rs")[0]
         valid = len(self._save_file_name) > 1
         if valid:
             self._save_dir = self._dir_name_from_file_name(self._save_file_name)
-        self._logger.debug("done")
         return valid
 
+    def _get_profile_base_name(self) -> str:
+        """
+        :return str: Path and start of profile report names. Next to the experiment if there is one, else in the
+        temp folder.
+        """
+        stamp = format_current_time(datetime.now(), save=True)
+        if self._save_file_name:
+            return splitext(self._save_file_name)[0] + "_" + stamp
+        return os.path.join(gettempdir(), app_name + "_" + stamp)
+
+    @trace
     def _dir_name_from_file_name(self, filename: str) -> str:
         """
         Get directory name from filename.
         :param filename: The absolute path filename.
         :return str: The resulting directory name.
         """
-        self._logger.debug("running")
         dir_name = filename[:filename.rindex("/")]
-        self._logger.debug("done")
         return dir_name
 
+    @trace
     def _keypress_handler(self, event: QKeyEvent) -> None:
         """
         Handle any keypress event and intercept alphabetical keypresses, then set flag_box to that key.
         :param event: The keypress event.
         :return None:
         """
-        self._logger.debug("running")
         if 0x41 <= event.key() <= 0x5a:
             self.flag_box.set_flag(chr(event.key()))
             self._model.save_flag(self.flag_box.get_flag())
         event.accept()
-        self._logger.debug("done")
 
+    @trace
     def _setup_handlers(self) -> None:
         """
         Attach events to handlers
         :return None:
         """
-        self._logger.debug("running")
         # Experiment controls
         self.button_box.add_create_button_handler(self.create_end_exp_handler)
         self.button_box.add_start_button_handler(self.start_stop_exp_handler)
@@ -461,19 +587,20 @@ class AppController:
         self.menu_bar.add_about_app_handler(self.about_app_handler)
         self.menu_bar.add_update_handler(self.check_for_updates_handler)
         self.menu_bar.add_log_window_handler(self.log_window_handler)
+        self.menu_bar.add_diagnostics_window_handler(self.diagnostics_window_handler)
+        self.menu_bar.add_profile_handler(self.profile_handler)
 
         # Close app button
         self.main_window.add_close_handler(self._cleanup)
+        self.main_window.add_force_quit_handler(self._force_quit_handler)
 
-        self._logger.debug("done")
-
+    @trace
     def _initialize_view(self) -> None:
         """
         Put the different components of the view together and then show the view.
         :return None:
         """
-        self._logger.debug("running")
-        self.menu_bar.set_debug_action(self._settings.value("logging/level"))
+        self.menu_bar.set_debug_action(self._settings.value("logging/level", type=int))
         self.main_window.add_menu_bar(self.menu_bar)
         self.main_window.add_control_bar_widget(self.button_box)
         self.main_window.add_control_bar_widget(self.flag_box)
@@ -481,6 +608,7 @@ class AppController:
         self.main_window.add_spacer_item(1)
         self.main_window.add_control_bar_widget(self.info_box)
         self.main_window.add_control_bar_widget(self.d_info_box)
+        self.main_window.add_control_bar_widget(self.lag_box)
         self.main_window.add_mdi_area(self.mdi_area)
         self.main_window.show()
 
@@ -489,18 +617,57 @@ class AppController:
         Start all recurring functions.
         :return None:
         """
-        self._tasks.append(create_task(self.new_device_view_handler()))
-        self._tasks.append(create_task(self.device_conn_error_handler()))
-        self._tasks.append(create_task(self.remove_device_view_handler()))
+        supervisor = get_supervisor()
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self._log_pipeline.run_ui_flush))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, get_loop_monitor().run))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self._update_lag_box))
+        if self._metrics_port > 0:
+            self._tasks.append(supervisor.spawn(TaskKind.LOOP, MetricsServer(get_metrics(), self._metrics_port).run))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self.new_device_view_handler))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self.device_conn_error_handler))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self.exp_start_error_handler))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self.remove_device_view_handler))
         self._model.start()
 
     def _cleanup(self) -> None:
         """
-        Cleanup any code that would cause problems for shutdown and prep for app closure.
+        Start app shutdown. The main window is closed once shutdown finishes.
+        :return None:
+        """
+        if self._shutdown_task is None:
+            self._shutdown_task = create_task(self._shutdown())
+
+    @trace
+    def _force_quit_handler(self) -> None:
+        """
+        Handler for when the user does not want to wait for saving to finish.
         :return None:
         """
+        self._model.cancel_save()
+
+    @trace
+    async def _shutdown(self) -> None:
+        """
+        Stop capture, wait for experiment data to be saved while showing progress, close devices then close app.
+        :return None:
+        """
+        if get_profiler().is_running():
+            self.profile_handler(False)
         if self._model.exp_created:
-            self._end_exp(False)
-        self._model.cleanup()
-        create_task(end_tasks(self._tasks))
+            self._end_exp()
+        model_shutdown = create_task(self._model.shutdown(shutdown_save_timeout))
+        if self._model.is_saving():
+            self.main_window.show_save_progress()
+        while not model_shutdown.done():
+            self.main_window.set_save_progress(*self._model.get_save_progress())
+            await wait([model_shutdown], timeout=.1)
+        if not model_shutdown.result():
+            self._logger.warning("App closed before experiment data was saved.")
+        for task in self._tasks:
+            task.cancel()
+        await get_supervisor().shutdown()
+        self._log_pipeline.stop()
+        if self.diagnostics:
+            self.diagnostics.close()
         self.log_output.close()
+        self.main_window.close_now()
@@ -0,0 +1,173 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import signal
+from logging import getLogger, INFO
+from asyncio import Event, Queue, get_running_loop, sleep, wait_for, TimeoutError
+from time import perf_counter
+from Model.app_model import AppModel
+from Model.event_bus import EventTopic
+from Model.app_defs import current_version, log_format, shutdown_save_timeout, LangEnum
+from Model.app_helpers import setup_log_file
+from Model.app_logging import LogPipeline
+from Model.task_supervisor import get_supervisor, TaskKind
+from Model.metrics import get_metrics, MetricsServer
+from Model.loop_monitor import get_loop_monitor
+from Model.pipeline_trace import get_pipeline_tracer
+from Resources.Strings.app_strings import strings, StringsEnum
+from Model.tracer import trace
+
+# How often to check whether enough devices have connected, in seconds.
+device_poll_interval = 0.1
+
+
+class HeadlessController:
+    """
+    Records an experiment from connected devices without Qt. No views or graphs are built, so it suits rigs that run
+    unattended and only need data capture.
+    """
+    def __init__(self, save_path: str, devices: int = 1, wait: float = 0, duration: float = 0, log_level=INFO,
+                 metrics_port: int = 0, lang: LangEnum = LangEnum.ENG):
+        """
+        :param save_path: The .rs file to save the experiment to.
+        :param devices: How many devices must connect before recording starts.
+        :param wait: Most seconds to wait for devices. 0 waits until stopped.
+        :param duration: Seconds to record for. 0 records until stopped.
+        :param log_level: The lowest level to log. The log is written to stderr as well as the log file.
+        :param metrics_port: Port to serve metrics on. 0 means no metrics server.
+        :param lang: The language device save file headers are written in.
+        """
+        self._strings = strings[lang]
+        log_file = setup_log_file(self._strings[StringsEnum.LOG_OUT_NAME], self._strings[StringsEnum.PROG_OUT_HDR])
+        self._log_pipeline = LogPipeline(log_file, log_level, log_format, stderr_level=log_level, ui=False)
+        self._logger = getLogger(__name__)
+        self._logger.info(self._strings[StringsEnum.LOG_VER_ID] + str(current_version))
+        self._save_path = save_path
+        self._devices = devices
+        self._wait = wait
+        self._duration = duration
+        self._metrics_port = metrics_port
+        self._lang = lang
+        self._model = None
+        self._stop_event = None  # Made in run() so it belongs to the running loop.
+        self._start_failed = False
+        self._tasks = []
+
+    def stop(self) -> None:
+        """
+        Stop waiting for devices or stop recording. The experiment is saved before run() returns.
+        :return None:
+        """
+        if self._stop_event:
+            self._stop_event.set()
+
+    @trace
+    async def run(self) -> bool:
+        """
+        Wait for devices, record until the duration is up or stop() is called, then save and shut down.
+        :return bool: True if an experiment was recorded and saved.
+        """
+        self._stop_event = Event()
+        self._add_signal_handlers()
+        get_pipeline_tracer().set_sample_every(0)  # Nothing shows data, so traces would never finish.
+        self._model = AppModel(self._lang, headless=True)
+        supervisor = get_supervisor()
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, self._stop_on_start_err,
+                                            self._model.subscribe(EventTopic.EXP_START_ERR)))
+        self._tasks.append(supervisor.spawn(TaskKind.LOOP, get_loop_monitor().run))  # Fills loop_lag.csv.
+        if self._metrics_port > 0:
+            self._tasks.append(supervisor.spawn(TaskKind.LOOP, MetricsServer(get_metrics(), self._metrics_port).run))
+        self._model.start()
+
+        recorded = False
+        if await self._wait_for_devices():
+            self._model.signal_create_exp(self._save_path)
+            if self._model.exp_created:
+                self._model.signal_start_exp()
+                self._logger.info("Recording from " + str(self._model.get_device_count()) + " devices to "
+                                  + self._save_path)
+                await self._wait_for_stop()
+                self._model.signal_stop_exp()
+                self._model.signal_end_exp()
+                recorded = not self._start_failed
+        else:
+            self._logger.warning("Stopped before " + str(self._devices) + " devices connected. Nothing recorded.")
+
+        saved = await self._model.shutdown(shutdown_save_timeout)
+        if recorded and not saved:
+            self._logger.warning("Closed before experiment data was saved. It will be finished on next start.")
+        elif recorded:
+            self._logger.info("Saved " + self._save_path)
+        for task in self._tasks:
+            task.cancel()
+        await supervisor.shutdown()
+        self._log_pipeline.stop()
+        return recorded and saved
+
+    async def _wait_for_devices(self) -> bool:
+        """
+        :return bool: True once enough devices have connected, False if stopped or timed out first.
+        """
+        self._logger.info("Waiting for " + str(self._devices) + " devices")
+        start = perf_counter()
+        while self._model.get_device_count() < self._devices:
+            if self._stop_event.is_set() or (self._wait > 0 and perf_counter() - start > self._wait):
+                return False
+            await sleep(device_poll_interval)
+        return True
+
+    async def _wait_for_stop(self) -> None:
+        """
+        Wait until the duration is up or stop() is called.
+        :return None:
+        """
+        try:
+            await wait_for(self._stop_event.wait(), self._duration if self._duration > 0 else None)
+        except TimeoutError:
+            pass
+
+    async def _stop_on_start_err(self, queue: Queue) -> None:
+        """
+        Stop if not every device could be started. The model has already stopped the devices that did start.
+        :param queue: The EXP_START_ERR subscription.
+        :return None:
+        """
+        failed = await queue.get()
+        self._logger.error("Could not start " + ", ".join(failed) + ". Nothing was recorded.")
+        self._start_failed = True
+        self.stop()
+
+    def _add_signal_handlers(self) -> None:
+        """
+        Stop cleanly on SIGINT and SIGTERM, so a service manager or Ctrl+C still saves the experiment. Not
+        available on Windows, where an interrupted save is finished on next start instead.
+        :return None:
+        """
+        loop = get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, AttributeError):
+                pass
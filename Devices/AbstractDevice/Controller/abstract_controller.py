@@ -24,22 +24,45 @@ https://redscientific.com/index.html
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+from datetime import datetime
 from Model.app_defs import LangEnum
+from Model.event_bus import EventBus, EventTopic
 from aioserial import AioSerial
-from Devices.AbstractDevice.View.abstract_view import AbstractView
+if TYPE_CHECKING:  # Views need Qt, which headless recorders never load.
+    from Devices.AbstractDevice.View.abstract_view import AbstractView
 
 
 class AbstractController(ABC):
     def __init__(self, view):
         super().__init__()
         self.view = view
+        self._bus = None
 
-    def get_view(self) -> AbstractView:
+    def get_view(self) -> 'AbstractView':
         """
-        :return AbstractView: This device's view object.
+        :return AbstractView: This device's view object, or None for headless recorders.
         """
         return self.view
 
+    def set_event_bus(self, bus: EventBus) -> None:
+        """
+        Set where this device publishes its data events.
+        :param bus: The app event bus.
+        :return: None.
+        """
+        self._bus = bus
+
+    def publish_data(self, values: dict, timestamp: datetime) -> None:
+        """
+        Publish a data event for any listeners interested in this device's data.
+        :param values: The data from the device.
+        :param timestamp: When the data was received.
+        :return: None.
+        """
+        if self._bus:
+            self._bus.publish_nowait(EventTopic.DEVICE_DATA, (self.get_conn().port, values, timestamp))
+
     @abstractmethod
     def cleanup(self) -> None:
         """
@@ -91,3 +114,42 @@ class AbstractController(ABC):
         :return: None.
         """
         pass
+
+    def get_start_cmd(self) -> bytes:
+        """
+        The command written to this device's com port to start an experiment. Devices that return a command are
+        started together with every other device by the app and then told through exp_started().
+        :return: The encoded start command or None to have start_exp() called instead.
+        """
+        return None
+
+    def get_stop_cmd(self) -> bytes:
+        """
+        The command written to this device's com port to stop an experiment.
+        :return: The encoded stop command or None to have stop_exp() called instead.
+        """
+        return None
+
+    def exp_started(self, timestamp: datetime) -> None:
+        """
+        Logic for after this device's start command has been sent by the app.
+        :param timestamp: When the experiment was started.
+        :return: None.
+        """
+        pass
+
+    def exp_stopped(self, timestamp: datetime) -> None:
+        """
+        Logic for after this device's stop command has been sent by the app.
+        :param timestamp: When the experiment was stopped.
+        :return: None.
+        """
+        pass
+
+    def add_marker(self, timestamp: datetime) -> None:
+        """
+        Logic for if this device shows experiment events such as flags on its graph.
+        :param timestamp: When the event happened.
+        :return: None.
+        """
+        pass
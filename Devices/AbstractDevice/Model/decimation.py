@@ -0,0 +1,82 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import numpy as np
+
+
+def min_max(times: np.ndarray, values: np.ndarray, buckets: int) -> (np.ndarray, np.ndarray):
+    """
+    Reduce a series to the smallest and largest value in each of a number of equal width time buckets, usually one
+    per pixel. Gaps (NaN values) are always kept so lines still break where they should.
+    :param times: Sorted times.
+    :param values: The values at those times.
+    :param buckets: How many buckets to split the time range into.
+    :return tuple: (times, values) of the kept points in time order.
+    """
+    if len(times) <= buckets * 2 or buckets < 1:
+        return times, values
+    span = times[-1] - times[0]
+    if span <= 0:
+        return times, values
+    bucket = np.minimum(((times - times[0]) / span * buckets).astype(np.int64), buckets - 1)
+    order = np.lexsort((values, bucket))  # NaN values sort last within their bucket.
+    sorted_buckets = bucket[order]
+    starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    finite = np.isfinite(values[order]).astype(np.int64)
+    # The last finite value in each bucket is its max. Buckets with only NaN fall back to their first point.
+    maxes = starts + np.maximum(np.add.reduceat(finite, starts) - 1, 0)
+    keep = np.union1d(np.concatenate((order[starts], order[maxes])), np.flatnonzero(np.isnan(values)))
+    return times[keep], values[keep]
+
+
+def lttb(times: np.ndarray, values: np.ndarray, threshold: int) -> (np.ndarray, np.ndarray):
+    """
+    Reduce a series with Largest Triangle Three Buckets, which keeps the points that most change the line's shape.
+    Gaps (NaN values) are always kept so lines still break where they should.
+    :param times: Sorted times.
+    :param values: The values at those times.
+    :param threshold: How many points to keep.
+    :return tuple: (times, values) of the kept points in time order.
+    """
+    gaps = np.flatnonzero(np.isnan(values))
+    finite = np.flatnonzero(~np.isnan(values))
+    if len(finite) <= threshold or threshold < 3:
+        return times, values
+    x = times[finite]
+    y = values[finite]
+    edges = np.linspace(1, len(x) - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = len(x) - 1
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else len(x)
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        prev_x, prev_y = x[keep[i]], y[keep[i]]
+        area = np.abs((prev_x - next_x) * (y[start:end] - prev_y) - (prev_x - x[start:end]) * (next_y - prev_y))
+        keep[i + 1] = start + np.argmax(area)
+    keep = np.union1d(finite[keep], gaps)
+    return times[keep], values[keep]
@@ -0,0 +1,149 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import numpy as np
+from datetime import datetime, timezone
+
+default_capacity = 16384  # Points kept per series. At one trial per second this is over four hours.
+
+
+def to_epoch(timestamp: datetime) -> float:
+    """
+    Convert a datetime to epoch seconds. Naive datetimes are read as wall clock time, the same way matplotlib
+    reads them, so converted values line up with the times shown on graph axes.
+    :param timestamp: The datetime to convert.
+    :return float: Seconds since 1970-01-01.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+class TimeSeriesBuffer:
+    """
+    Fixed capacity store for one series of timestamped values. Once full, the oldest points are dropped.
+    Every point is written twice, capacity apart, so the newest points are always one contiguous slice and can be
+    returned as views without copying.
+    """
+    def __init__(self, capacity: int = default_capacity):
+        """
+        :param capacity: The most points kept.
+        """
+        self._capacity = capacity
+        self._times = np.full(capacity * 2, np.nan)
+        self._values = np.full(capacity * 2, np.nan)
+        self._next = 0  # Where the next point goes in the first half.
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        :return int: The most points this buffer keeps.
+        """
+        return self._capacity
+
+    def append(self, time: float, value: float) -> None:
+        """
+        Add a point. Times must not go backwards.
+        :param time: Epoch seconds.
+        :param value: The value, or NaN for a gap.
+        :return None:
+        """
+        i = self._next
+        self._times[i] = self._times[i + self._capacity] = time
+        self._values[i] = self._values[i + self._capacity] = value
+        self._next = (i + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def append_gap(self, time: float) -> None:
+        """
+        Add a point that breaks the line drawn through this series.
+        :param time: Epoch seconds.
+        :return None:
+        """
+        self.append(time, np.nan)
+
+    def clear(self) -> None:
+        """
+        Remove all points.
+        :return None:
+        """
+        self._next = 0
+        self._size = 0
+
+    def get_times(self) -> np.ndarray:
+        """
+        :return ndarray: A read only view of every stored time, oldest first.
+        """
+        return self._view(self._times)
+
+    def get_values(self) -> np.ndarray:
+        """
+        :return ndarray: A read only view of every stored value, oldest first.
+        """
+        return self._view(self._values)
+
+    def get_window(self, start: float, end: float) -> (np.ndarray, np.ndarray):
+        """
+        Get the points between two times.
+        :param start: Epoch seconds of the earliest point wanted.
+        :param end: Epoch seconds of the latest point wanted.
+        :return tuple: Read only views of (times, values).
+        """
+        times = self.get_times()
+        first = np.searchsorted(times, start, side="left")
+        last = np.searchsorted(times, end, side="right")
+        return times[first:last], self.get_values()[first:last]
+
+    def get_first_time(self) -> float:
+        """
+        :return float: The oldest stored time or NaN if empty.
+        """
+        if self._size == 0:
+            return np.nan
+        return self.get_times()[0]
+
+    def get_last_time(self) -> float:
+        """
+        :return float: The newest stored time or NaN if empty.
+        """
+        if self._size == 0:
+            return np.nan
+        return self.get_times()[-1]
+
+    def _view(self, array: np.ndarray) -> np.ndarray:
+        """
+        :param array: One of the doubled storage arrays.
+        :return ndarray: A read only view of the stored points, oldest first.
+        """
+        if self._size < self._capacity:
+            view = array[:self._size]
+        else:
+            view = array[self._next:self._next + self._capacity]
+        view = view.view()
+        view.flags.writeable = False
+        return view
@@ -35,27 +35,51 @@ from enum import Enum, auto
 class StringsEnum(Enum):
     EXAMPLE_ENTRY = auto()
     GRAPH_TS = auto()
+    BACKEND_MENU = auto()
+    BACKEND_PAINTER = auto()
+    BACKEND_MPL = auto()
+    BACKEND_THREADED = auto()
 
 
 # Define languages like this.
 english = {StringsEnum.EXAMPLE_ENTRY: "Implement this language.",
            StringsEnum.GRAPH_TS: "Timestamp",
+           StringsEnum.BACKEND_MENU: "Draw graphs with (used when the device next connects):",
+           StringsEnum.BACKEND_PAINTER: "Fast drawing",
+           StringsEnum.BACKEND_MPL: "Matplotlib, with pan, zoom and save",
+           StringsEnum.BACKEND_THREADED: "Matplotlib on a worker thread",
            }
 
 french = {StringsEnum.EXAMPLE_ENTRY: "Implémentez ce langage.",
           StringsEnum.GRAPH_TS: "Horodatage",
+          StringsEnum.BACKEND_MENU: "Dessiner les graphiques avec (à la prochaine connexion de l'appareil) :",
+          StringsEnum.BACKEND_PAINTER: "Dessin rapide",
+          StringsEnum.BACKEND_MPL: "Matplotlib, avec déplacement, zoom et enregistrement",
+          StringsEnum.BACKEND_THREADED: "Matplotlib dans un thread séparé",
           }
 
 german = {StringsEnum.EXAMPLE_ENTRY: "Implementieren Sie diese Sprache.",
           StringsEnum.GRAPH_TS: "Zeitstempel",
+          StringsEnum.BACKEND_MENU: "Diagramme zeichnen mit (ab der nächsten Verbindung des Geräts):",
+          StringsEnum.BACKEND_PAINTER: "Schnelles Zeichnen",
+          StringsEnum.BACKEND_MPL: "Matplotlib, mit Verschieben, Zoomen und Speichern",
+          StringsEnum.BACKEND_THREADED: "Matplotlib in einem eigenen Thread",
           }
 
 spanish = {StringsEnum.EXAMPLE_ENTRY: "Implementa este lenguaje.",
            StringsEnum.GRAPH_TS: "marca de tiempo",
+           StringsEnum.BACKEND_MENU: "Dibujar gráficos con (al volver a conectar el dispositivo):",
+           StringsEnum.BACKEND_PAINTER: "Dibujo rápido",
+           StringsEnum.BACKEND_MPL: "Matplotlib, con desplazamiento, zoom y guardado",
+           StringsEnum.BACKEND_THREADED: "Matplotlib en un hilo aparte",
            }
 
 chinese = {StringsEnum.EXAMPLE_ENTRY: "实施这种语言。",
            StringsEnum.GRAPH_TS: "时间戳记",
+           StringsEnum.BACKEND_MENU: "绘图方式（设备下次连接时生效）:",
+           StringsEnum.BACKEND_PAINTER: "快速绘图",
+           StringsEnum.BACKEND_MPL: "Matplotlib，可平移、缩放和保存",
+           StringsEnum.BACKEND_THREADED: "Matplotlib（后台线程）",
            }
 
 # Add defined languages to strings dictionary.
@@ -26,7 +26,7 @@ https://redscientific.com/index.html
 
 
 from abc import ABCMeta, ABC
-from Model.app_helpers import EasyFrame
+from View.view_helpers import EasyFrame
 from PySide2.QtWidgets import QMdiSubWindow, QHBoxLayout, QGridLayout, QLayout
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QCloseEvent, QMoveEvent
@@ -23,177 +23,221 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from abc import ABCMeta, ABC, abstractmethod
-from asyncio import create_task, sleep
-from logging import getLogger, StreamHandler
+from abc import abstractmethod
+from collections import deque
+from logging import getLogger
 from datetime import datetime
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavBar
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as Canvas
-from matplotlib.figure import Figure
+from time import perf_counter
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QMenu
+from PySide2.QtGui import QContextMenuEvent
+from PySide2.QtCore import QEvent
+from Devices.AbstractDevice.Model.decimation import min_max
+from Devices.AbstractDevice.Model.time_series_buffer import TimeSeriesBuffer, to_epoch
+from Devices.AbstractDevice.View.graph_backend import AbstractMeta, make_graph_backend, get_backend_setting, \
+    set_backend_setting, backend_kinds, MATPLOTLIB, PAINTER, THREADED_MATPLOTLIB
+from Devices.AbstractDevice.View.render_scheduler import get_render_scheduler
 from Devices.AbstractDevice.Resources.abstract_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
+from Model.metrics import get_metrics
+from Model.pipeline_trace import Stage, MessageTrace
 
+marker_capacity = 4096  # Most marked times kept per graph.
+trace_capacity = 1000  # Most traced messages kept per graph while waiting to be shown. Older ones are never marked.
 
-class AbstractMeta(ABCMeta, type(Canvas)):
-    pass
 
-
-class BaseGraph(Canvas, ABC, metaclass=AbstractMeta):
-    """ Generic device data graphing class. """
-    def __init__(self, parent, log_handlers: [StreamHandler]):
+class BaseGraph(QWidget, metaclass=AbstractMeta):
+    """ Generic device data graphing class. Subclasses provide the data and a backend draws it. """
+    def __init__(self, parent, backend: str = MATPLOTLIB, decimate=min_max,
+                 window: float = 120, dev_type: str = None):
+        """
+        :param parent: The parent widget.
+        :param backend: Which graph backend to draw with.
+        :param decimate: How to reduce data to the visible width.
+        :param window: Seconds of the most recent data to show.
+        :param dev_type: The device type. If given, the user can pick a backend for this device type from the
+        graph's right click menu, and that pick is used instead of backend.
+        """
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
-        super().__init__(Figure(figsize=(5, 5)))
-        self.setParent(parent)
+        super().__init__(parent)
+        if dev_type:
+            backend = get_backend_setting(dev_type, backend)
+        self._dev_type = dev_type
+        self._backend_kind = backend
+        self.setLayout(QVBoxLayout(self))
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self._backend = make_graph_backend(backend, self)
+        self._backend.set_view_changed_handler(self.refresh_self)
+        self._backend.set_painted_handler(self._mark_traces_shown)
+        self.layout().addWidget(self._backend)
+        self._backend.installEventFilter(self)
         self._new = True
-        self._nav_bar = NavBar(self, parent)
-        self._nav_bar.update()
-        # self._leg_plot_links = dict()
-        self._plots = list()  # name, coords, active
-        self._v_lines = list()
+        self._plots = list()  # names
+        self._layout_dirty = True
+        self._decimate = decimate
+        self._window = window
+        self._markers = TimeSeriesBuffer(marker_capacity)  # Marked times. Values are unused so stored as gaps.
         self._base_strings = dict()
-        # self.figure.canvas.mpl_connect('pick_event', self._onpick)
+        self._pending_traces = deque(maxlen=trace_capacity)  # Traced messages waiting to be drawn.
+        self._drawn_traces = deque(maxlen=trace_capacity)  # Traced messages drawn but not yet painted.
+        self._redraw_ms = get_metrics().histogram("graph_redraw_ms", "Time to update and draw one graph, in ms.",
+                                                  backend=backend)
         self._logger.debug("Initialized")
 
-    def get_nav_bar(self) -> NavBar:
+    def get_nav_bar(self) -> QWidget:
         """
         Get this graph's nav bar.
-        :return NavBar: This graph's nav bar.
+        :return QWidget: This graph's nav bar or None if its backend has none.
+        """
+        return self._backend.get_nav_bar()
+
+    def get_backend(self):
         """
-        return self._nav_bar
+        :return GraphBackend: What this graph draws with.
+        """
+        return self._backend
 
     def refresh_self(self):
-        """ Redraw the canvas. """
-        self._logger.debug("running")
-        try:
-            self.figure.canvas.draw()
-        except Exception as e:
-            self._logger.exception("issue with drawing canvas.")
-        self._logger.debug("done")
+        """ Redraw this graph on the next frame. """
+        get_render_scheduler().mark_dirty(self)
 
+    def is_on_screen(self) -> bool:
+        """
+        :return bool: Whether any part of this graph can be seen. False if it or its window is hidden or minimized
+        or it is completely covered by other windows.
+        """
+        return self.isVisible() and not self.window().isMinimized() and not self._backend.visibleRegion().isEmpty()
+
+    def eventFilter(self, watched, event: QEvent) -> bool:
+        """
+        Catch up on any skipped redraws when the backend is shown or uncovered.
+        :param watched: The backend widget.
+        :param event: The event sent to the backend.
+        :return bool: False so the backend still handles the event.
+        """
+        if event.type() in (QEvent.Show, QEvent.Paint):
+            get_render_scheduler().mark_shown(self)
+        return False
+
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        """
+        Let the user pick which backend this device type's graphs are made with. Graphs already made keep theirs.
+        :param event: The right click.
+        :return None:
+        """
+        if not self._dev_type:
+            super().contextMenuEvent(event)
+            return
+        picked = get_backend_setting(self._dev_type, self._backend_kind)
+        labels = {PAINTER: StringsEnum.BACKEND_PAINTER, MATPLOTLIB: StringsEnum.BACKEND_MPL,
+                  THREADED_MATPLOTLIB: StringsEnum.BACKEND_THREADED}
+        menu = QMenu(self)
+        menu.addAction(self._base_strings[StringsEnum.BACKEND_MENU]).setEnabled(False)
+        menu.addSeparator()
+        for kind in backend_kinds:
+            action = menu.addAction(self._base_strings[labels[kind]])
+            action.setCheckable(True)
+            action.setChecked(kind == picked)
+            action.setData(kind)
+        chosen = menu.exec_(event.globalPos())
+        if chosen and chosen.data():
+            set_backend_setting(self._dev_type, chosen.data())
+            self._logger.info(self._dev_type + " graphs will be drawn with " + chosen.data())
+
+    @trace
     def set_lang(self, lang: LangEnum) -> None:
         """
         Set this base graph's language.
         :param lang: The lang enum to use.
         :return None:
         """
-        self._logger.debug("running")
         self._base_strings = strings[lang]
-        self._logger.debug("done")
+        self._layout_dirty = True
 
+    @trace
     def set_new(self, is_new: bool) -> None:
         """ If graph is new then there is no data to display. """
-        self._logger.debug("running")
         self._new = is_new
-        self._logger.debug("done")
 
     def get_new(self):
         return self._new
 
     @abstractmethod
-    async def plot_device_data(self, axes, name) -> []:  #, show_in_legend) -> []:
+    def get_series(self, name: str) -> TimeSeriesBuffer:
         """
-        How this specific device should plot its data.
-        :param axes: The current graph.
-        :param name: A given plot_name as passed in at initialization.
-        :param show_in_legend: Whether to show this line in the legend.
-        :return list: A list of graph lines.
+        :param name: A given plot_name as passed in to set_subplots.
+        :return TimeSeriesBuffer: The data for that subplot.
         """
         pass
 
-    async def plot(self, new=False):
-        """ Reset all subplots to empty then call subclass's plot function for each subplot """
-        self._logger.debug("running")
-        lines = {}
-        # self._leg_plot_links = {}
-        self.figure.clear()
-        self.figure.set_tight_layout(True)
-        num_plots = len(self._plots)
-        for i in range(num_plots):
-            plot = self._plots[i]
-            name = plot[0]
-            active = plot[2]
-            lines[name] = []
-            if active:
-                coords = plot[1]
-                axes = self.figure.add_subplot(coords[0], coords[1], coords[2])
-                axes.tick_params(axis='x', labelrotation=30)
-                axes.set_ylabel(name)
-                await sleep(.001)
-                # if i == 0:
-                #     show_in_legend = False
-                # else:
-                #     show_in_legend = False
-                if i == num_plots - 1:
-                    await sleep(.001)
-                    axes.set_xlabel(self._base_strings[StringsEnum.GRAPH_TS])
-                    await sleep(.001)
-                if not new:
-                    lines[name] = await create_task(self.plot_device_data(axes, name))  #, show_in_legend))
-        if not new:
-            # legend = self.figure.legend(loc='upper left', framealpha=0.4)
-            # legend.set_draggable(True)
-            # self._match_legend_plot_lines(legend, lines)
-            self.add_vert_lines()
-        await sleep(.001)
-        self.figure.canvas.draw()
-        self._logger.debug("done")
-
-    def add_vert_lines(self, timestamp: datetime = None):
-        self._logger.debug("running")
-        for axes in self.figure.get_axes():
-            if timestamp:
-                self._vlines.append(timestamp)
-                axes.axvline(timestamp)
-                self.refresh_self()
-            else:
-                for line in self._v_lines:
-                    axes.axvline(line)
-        self._logger.debug("done")
+    @trace
+    async def plot(self):
+        """ Rebuild the subplots if their layout changed then update every subplot with the latest data. """
+        start = perf_counter()
+        if self._layout_dirty:
+            self._backend.set_layout(self._plots, self._base_strings[StringsEnum.GRAPH_TS])
+            self._layout_dirty = False
+        for name in self._plots:
+            series = self.get_series(name)
+            self._backend.set_x_window(name, *self._get_follow_window(series))
+            times, values = series.get_window(*self._backend.get_x_window(name))
+            self._backend.set_data(name, *self._decimate(times, values, self._backend.get_width(name)))
+            self._backend.set_markers(name, self._markers.get_window(*self._backend.get_x_window(name))[0])
+        await self._backend.render()
+        self._redraw_ms.observe((perf_counter() - start) * 1000)
+        if self._pending_traces:
+            self._drawn_traces.extend(self._pending_traces)
+            self._pending_traces.clear()
+
+    def add_pending_trace(self, msg_trace: MessageTrace) -> None:
+        """
+        Mark a traced message as shown once the next draw has been painted to the screen.
+        :param msg_trace: The message's pipeline trace.
+        :return None:
+        """
+        self._pending_traces.append(msg_trace)
 
-    def set_subplots(self, names: [str]):
-        self._plots = list()
-        self._logger.debug("running")
-        if len(names) < 1:
-            return
-        r = len(names)
-        c = 1
-        for i in range(0, r):
-            self._plots.append((names[i], (r, c, i + 1), True))
-        self._logger.debug("done")
-
-    def _match_legend_plot_lines(self, legend, lines):
-        """ Attach lines in all subplots to appropriate marker in legend """
-        self._logger.debug("running")
-        for legend_line in legend.get_lines():
-            self._leg_plot_links[legend_line] = []
-            legend_line.set_picker(5)
-            for plot in lines:
-                for line in lines[plot]:
-                    if line[0] == legend_line.get_label():
-                        self._leg_plot_links[legend_line].append(line[1])
-        self._logger.debug("done")
-
-    def _onpick(self, event) -> None:
-        """
-        Show or hide lines in subplots based on which marker in legend was clicked
-        :param event: The click event.
+    def _mark_traces_shown(self) -> None:
+        """
+        Called by the backend after it paints. Messages drawn by the last render are now on screen.
         :return None:
         """
-        self._logger.debug("running")
-        legend_line = event.artist
-        if legend_line in self._legend_plot_links:
-            plot_lines = self._legend_plot_links[legend_line]
-        else:
-            self._logger.debug("done, no matched lines")
-            return
-        for line in plot_lines:
-            visible = not line.get_visible()
-            line.set_visible(visible)
-        if visible:
-            legend_line.set_alpha(1.0)
+        for msg_trace in self._drawn_traces:
+            msg_trace.mark(Stage.SHOWN)
+        self._drawn_traces.clear()
+
+    @trace
+    def add_vert_lines(self, timestamp: datetime) -> None:
+        """
+        Mark a time, such as a block start or a flag, on every subplot.
+        :param timestamp: The time to mark.
+        :return None:
+        """
+        self._markers.append_gap(to_epoch(timestamp))
+        self.refresh_self()
+
+    def clear_vert_lines(self) -> None:
+        """
+        Remove all marked times.
+        :return None:
+        """
+        self._markers.clear()
+        self.refresh_self()
+
+    @trace
+    def set_subplots(self, names: [str]):
+        if names != self._plots:
+            self._plots = list(names)
+            self._layout_dirty = True
+
+    def _get_follow_window(self, series: TimeSeriesBuffer) -> (float, float):
+        """
+        :param series: The data of a subplot.
+        :return tuple: Epoch seconds of the range that keeps the most recent data in view.
+        """
+        if len(series) > 0:
+            right = series.get_last_time()
+            left = max(series.get_first_time(), right - self._window)
         else:
-            legend_line.set_alpha(0.2)
-        self.figure.canvas.draw()
-        self._logger.debug("done")
+            left = right = to_epoch(datetime.now())
+        return left - 10, right + 10
@@ -24,15 +24,14 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QTabWidget, QWidget
+from Model.tracer import trace
 
 
 class CollapsingTab(QTabWidget):
-    def __init__(self, parent, contents: QWidget, log_handlers: [StreamHandler], max_width: int = 350):
+    def __init__(self, parent, contents: QWidget, max_width: int = 350):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         self._vis = True
@@ -44,23 +43,22 @@ class CollapsingTab(QTabWidget):
         self.tabBarClicked.connect(self._toggle_collapse)
         self._logger.debug("Initialized")
 
+    @trace
     def set_tab_text(self, text: str) -> None:
         """
         Change the text of this tab.
         :param text: The new text to use.
         :return None:
         """
-        self._logger.debug("running")
         self.setTabText(self.tab_index, text)
-        self._logger.debug("done")
 
+    @trace
     def _toggle_collapse(self) -> None:
         """
         Toggle whether this tab is collapsed or not.
         :param collapsed: If this is collapsed.
         :return None:
         """
-        self._logger.debug("running")
         if self._vis:
             self.contents.hide()
             self.setMaximumWidth(self.tab_collapsed_width)
@@ -68,6 +66,5 @@ class CollapsingTab(QTabWidget):
             self.contents.show()
             self.setMaximumWidth(self.tab_extended_width)
         self._vis = not self._vis
-        self._logger.debug("done")
 
 
@@ -0,0 +1,187 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from abc import ABCMeta, ABC, abstractmethod
+from PySide2.QtWidgets import QWidget
+from PySide2.QtCore import QSettings
+from Resources.Strings.app_strings import company_name, app_name
+
+MATPLOTLIB = "matplotlib"  # Full featured with pan and zoom. Slower to build and update.
+PAINTER = "painter"  # Plain QPainter drawing for fast live views.
+THREADED_MATPLOTLIB = "threaded_matplotlib"  # Matplotlib drawn on a worker thread. No pan or zoom.
+backend_kinds = [PAINTER, MATPLOTLIB, THREADED_MATPLOTLIB]
+
+
+class AbstractMeta(ABCMeta, type(QWidget)):
+    pass
+
+
+class GraphBackend(ABC, metaclass=AbstractMeta):
+    """
+    What BaseGraph draws with. A backend shows one subplot per plot name stacked vertically, each with a single
+    line of time series data. All times are epoch seconds as made by to_epoch().
+    """
+    _painted_handler = None
+
+    @abstractmethod
+    def get_nav_bar(self) -> QWidget:
+        """
+        :return QWidget: This backend's navigation tools, or None if it has none.
+        """
+        pass
+
+    @abstractmethod
+    def set_layout(self, names: [str], x_label: str) -> None:
+        """
+        Replace all subplots.
+        :param names: One subplot is made for each name, top to bottom. The name is used as the y label.
+        :param x_label: The label under the bottom subplot.
+        :return None:
+        """
+        pass
+
+    @abstractmethod
+    def set_x_window(self, name: str, left: float, right: float) -> None:
+        """
+        Ask for a range of time to be shown. A backend may show more than asked for.
+        :param name: The subplot.
+        :param left: The earliest time that must be visible.
+        :param right: The latest time that must be visible.
+        :return None:
+        """
+        pass
+
+    @abstractmethod
+    def get_x_window(self, name: str) -> (float, float):
+        """
+        :param name: The subplot.
+        :return tuple: The earliest and latest time actually shown.
+        """
+        pass
+
+    @abstractmethod
+    def get_width(self, name: str) -> int:
+        """
+        :param name: The subplot.
+        :return int: The width in pixels of the subplot's data area.
+        """
+        pass
+
+    @abstractmethod
+    def set_data(self, name: str, times, values) -> None:
+        """
+        Replace the data shown in a subplot. NaN values break the line.
+        :param name: The subplot.
+        :param times: Sorted times.
+        :param values: The values at those times.
+        :return None:
+        """
+        pass
+
+    @abstractmethod
+    def set_markers(self, name: str, times) -> None:
+        """
+        Replace the vertical marker lines shown in a subplot.
+        :param name: The subplot.
+        :param times: Sorted times of the markers inside the subplot's x range.
+        :return None:
+        """
+        pass
+
+    @abstractmethod
+    async def render(self) -> None:
+        """
+        Show the latest data.
+        :return None:
+        """
+        pass
+
+    def is_navigating(self) -> bool:
+        """
+        :return bool: Whether the user is moving the view, in which case set_x_window is ignored.
+        """
+        return False
+
+    def set_view_changed_handler(self, func) -> None:
+        """
+        Set what is called when the user moves the view.
+        :param func: Takes no arguments.
+        :return None:
+        """
+        pass
+
+    def set_painted_handler(self, func) -> None:
+        """
+        Set what is called each time the backend finishes painting to the screen.
+        :param func: Takes no arguments.
+        :return None:
+        """
+        self._painted_handler = func
+
+    def _painted(self) -> None:
+        """
+        Call at the end of paintEvent.
+        :return None:
+        """
+        if self._painted_handler:
+            self._painted_handler()
+
+
+def make_graph_backend(kind: str, parent) -> GraphBackend:
+    """
+    Create a graph backend. Backends are imported only when used so devices that do not use matplotlib
+    never load it.
+    :param kind: MATPLOTLIB, PAINTER or THREADED_MATPLOTLIB.
+    :param parent: The widget the backend is shown in.
+    :return GraphBackend: The new backend, which is also a QWidget.
+    """
+    if kind == PAINTER:
+        from Devices.AbstractDevice.View.painter_graph_backend import PainterGraphBackend
+        return PainterGraphBackend(parent)
+    if kind == THREADED_MATPLOTLIB:
+        from Devices.AbstractDevice.View.threaded_mpl_graph_backend import ThreadedMplGraphBackend
+        return ThreadedMplGraphBackend(parent)
+    from Devices.AbstractDevice.View.mpl_graph_backend import MplGraphBackend
+    return MplGraphBackend(parent)
+
+
+def get_backend_setting(dev_type: str, default: str) -> str:
+    """
+    :param dev_type: The device type, for example "DRT".
+    :param default: The backend to use if the user has not picked one for this device type.
+    :return str: The graph backend this device type's graphs are made with.
+    """
+    kind = QSettings(company_name, app_name).value("graph_backend/" + dev_type, default)
+    return kind if kind in backend_kinds else default
+
+
+def set_backend_setting(dev_type: str, kind: str) -> None:
+    """
+    Save which graph backend this device type's graphs are made with from now on.
+    :param dev_type: The device type, for example "DRT".
+    :param kind: One of backend_kinds.
+    :return None:
+    """
+    QSettings(company_name, app_name).setValue("graph_backend/" + dev_type, kind)
@@ -23,18 +23,17 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from Devices.AbstractDevice.View.base_graph import BaseGraph
 from PySide2.QtWidgets import QFrame, QVBoxLayout, QSizePolicy
-from Model.app_helpers import ClickAnimationButton
+from View.view_helpers import ClickAnimationButton
+from Model.tracer import trace
 
 
 class GraphFrame(QFrame):
     """ This code is to contain and properly size graph widgets. """
-    def __init__(self, parent, graph: BaseGraph, log_handlers: [StreamHandler]):
+    def __init__(self, parent, graph: BaseGraph):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         size_policy = QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Fixed)
@@ -56,19 +55,19 @@ class GraphFrame(QFrame):
         self._navbar_height = 100
         self._graph_height = 400
         self.layout().addWidget(self._graph)
-        self.layout().addWidget(self._graph.get_nav_bar())
+        if self._graph.get_nav_bar():
+            self.layout().addWidget(self._graph.get_nav_bar())
         self.setFixedHeight(self._navbar_height + self._graph_height)
         self._logger.debug("Initialized")
 
+    @trace
     def set_graph_height(self, height):
         """ Each display type will be a different size. """
-        self._logger.debug("running")
         self._graph_height = height
-        self._logger.debug("done")
 
+    @trace
     def _set_graph_visibility(self):
         """ Show or hide the graph in the display area. """
-        self._logger.debug("running")
         self._visible = not self._visible
         if self._visible:
             self.layout().removeWidget(self._graph.get_nav_bar())
@@ -81,7 +80,6 @@ class GraphFrame(QFrame):
             self.layout().removeWidget(self._graph.get_nav_bar())
             self.setFixedHeight(40)
             self._show_hide_button.setText("Show " + self._graph.get_title() + " graph")
-        self._logger.debug("done")
 
     def get_graph(self):
         return self._graph
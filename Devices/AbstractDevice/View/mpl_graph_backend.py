@@ -0,0 +1,301 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import numpy as np
+from logging import getLogger
+from datetime import datetime
+from math import isfinite
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavBar
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as Canvas
+from matplotlib.figure import Figure
+from matplotlib.dates import date2num
+from matplotlib.collections import LineCollection
+from Devices.AbstractDevice.View.graph_backend import GraphBackend
+from Model.tracer import trace
+
+seconds_per_day = 86400
+_epoch_num = date2num(datetime(1970, 1, 1))
+
+
+def epoch_to_num(seconds):
+    """
+    :param seconds: Epoch seconds as made by to_epoch(). Can be a single value or an array.
+    :return: The same times as matplotlib date numbers.
+    """
+    return seconds / seconds_per_day + _epoch_num
+
+
+def num_to_epoch(num):
+    """
+    :param num: Matplotlib date numbers. Can be a single value or an array.
+    :return: The same times as epoch seconds.
+    """
+    return (num - _epoch_num) * seconds_per_day
+
+
+class MplGraphBackend(Canvas, GraphBackend):
+    """ Draws graphs with matplotlib. Keeps its axes and lines between draws and can blit only the lines. """
+    def __init__(self, parent, blit: bool = True):
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__(Figure(figsize=(5, 5)))
+        self.setParent(parent)
+        self._nav_bar = NavBar(self, parent)
+        self._nav_bar.update()
+        self._axes = dict()  # name: axes
+        self._lines = dict()  # name: line
+        self._blit = blit
+        self._backgrounds = dict()  # name: saved pixels of the axes without its line
+        self._bg_limits = dict()  # name: (xlim, ylim) when background was saved
+        self._markers = dict()  # name: LineCollection of marker lines
+        self._marker_times = dict()  # name: times the marker lines were last set to
+        self._view_changed_handler = None
+        self.mpl_connect('draw_event', self._on_draw)
+        self._logger.debug("Initialized")
+
+    def get_nav_bar(self) -> NavBar:
+        """
+        Get this graph's nav bar.
+        :return NavBar: This graph's nav bar.
+        """
+        return self._nav_bar
+
+    def get_blit(self) -> bool:
+        """
+        :return bool: Whether this graph only redraws its lines on top of a saved background.
+        """
+        return self._blit
+
+    @trace
+    def set_layout(self, names: [str], x_label: str) -> None:
+        """
+        Reset all subplots to empty then create the axes and lines that later updates reuse.
+        :param names: The subplot names.
+        :param x_label: The label under the bottom subplot.
+        :return None:
+        """
+        self._axes = dict()
+        self._lines = dict()
+        self._markers = dict()
+        self._marker_times = dict()
+        self._backgrounds = dict()
+        self._bg_limits = dict()
+        self.figure.clear()
+        self.figure.set_tight_layout(True)
+        num_plots = len(names)
+        for i in range(num_plots):
+            name = names[i]
+            axes = self.figure.add_subplot(num_plots, 1, i + 1)
+            axes.tick_params(axis='x', labelrotation=30)
+            axes.set_ylabel(name)
+            if i == num_plots - 1:
+                axes.set_xlabel(x_label)
+            axes.xaxis_date()
+            line, = axes.plot([], [], marker='o')
+            line.set_animated(self._blit)
+            # Marker x values are data coordinates and y values go from the bottom (0) to the top (1) of the axes.
+            markers = LineCollection([], colors="grey", linewidths=1, transform=axes.get_xaxis_transform())
+            markers.set_animated(self._blit)
+            axes.add_collection(markers, autolim=False)
+            self._markers[name] = markers
+            axes.callbacks.connect('xlim_changed', self._on_view_changed)
+            self._axes[name] = axes
+            self._lines[name] = line
+
+    def set_x_window(self, name: str, left: float, right: float, headroom: float = 30) -> None:
+        """
+        Set the x range of a subplot. When blitting, the range is padded on the right and only moved once the data
+        leaves it so the saved background stays valid for as long as possible.
+        :param name: The subplot.
+        :param left: Epoch seconds of the leftmost time that must be visible.
+        :param right: Epoch seconds of the rightmost time that must be visible.
+        :param headroom: Seconds of padding added on the right when blitting.
+        :return None:
+        """
+        if self.is_navigating():
+            return
+        axes = self._axes[name]
+        left, right = epoch_to_num(left), epoch_to_num(right)
+        if not self._blit:
+            axes.set_xlim(left=left, right=right)
+            return
+        headroom = headroom / seconds_per_day
+        cur_left, cur_right = axes.get_xlim()
+        if cur_left <= left <= cur_left + headroom and right <= cur_right <= right + headroom:
+            return
+        axes.set_xlim(left=left, right=right + headroom)
+
+    def get_x_window(self, name: str) -> (float, float):
+        """
+        :param name: The subplot.
+        :return tuple: Epoch seconds of the left and right edges of the subplot.
+        """
+        left, right = self._axes[name].get_xlim()
+        return num_to_epoch(left), num_to_epoch(right)
+
+    def get_width(self, name: str) -> int:
+        """
+        :param name: The subplot.
+        :return int: The width of the subplot in pixels.
+        """
+        return max(int(self._axes[name].bbox.width), 1)
+
+    def set_data(self, name: str, times, values) -> None:
+        """
+        Put new data into a subplot's line and fit the y axis to it.
+        :param name: The subplot.
+        :param times: Epoch seconds.
+        :param values: The values at those times.
+        :return None:
+        """
+        axes = self._axes[name]
+        self._lines[name].set_data(epoch_to_num(times), values)
+        axes.relim()
+        if self.is_navigating():
+            return
+        if self._blit:
+            self._grow_y_range(axes)
+        else:
+            axes.autoscale_view(scalex=False)
+
+    def set_markers(self, name: str, times) -> None:
+        """
+        Update a subplot's marker lines if the visible markers changed.
+        :param name: The subplot.
+        :param times: Epoch seconds of the visible markers.
+        :return None:
+        """
+        last = self._marker_times.get(name)
+        if last is not None and np.array_equal(last, times):
+            return
+        self._marker_times[name] = np.array(times)
+        x = epoch_to_num(self._marker_times[name])
+        segments = np.stack((np.column_stack((x, np.zeros(len(x)))), np.column_stack((x, np.ones(len(x))))), axis=1)
+        self._markers[name].set_segments(segments)
+
+    async def render(self) -> None:
+        """
+        Blit the lines if the saved backgrounds still match, otherwise redraw everything.
+        :return None:
+        """
+        if self._blit and self._can_blit():
+            self._blit_lines()
+        else:
+            try:
+                self.figure.canvas.draw()
+            except Exception as e:
+                self._logger.exception("issue with drawing canvas.")
+
+    def is_navigating(self) -> bool:
+        """
+        :return bool: Whether the user has the pan or zoom tool selected, in which case the view is left alone.
+        """
+        return str(self._nav_bar.mode) != ""
+
+    def set_view_changed_handler(self, func) -> None:
+        """
+        :param func: Called when the user pans or zooms.
+        :return None:
+        """
+        self._view_changed_handler = func
+
+    @staticmethod
+    def _grow_y_range(axes) -> None:
+        """
+        Rescale the y axis of a subplot only if its data no longer fits, with padding so it grows in steps.
+        :param axes: The subplot.
+        :return None:
+        """
+        low, high = axes.dataLim.intervaly
+        if not (isfinite(low) and isfinite(high)):
+            return
+        cur_low, cur_high = axes.get_ylim()
+        if cur_low <= low and high <= cur_high:
+            return
+        pad = (high - low) * 0.1 or 1
+        axes.set_ylim(bottom=low - pad, top=high + pad)
+
+    def _get_limits(self, name: str) -> tuple:
+        """
+        :param name: The subplot name.
+        :return tuple: The subplot's current x and y range.
+        """
+        axes = self._axes[name]
+        return tuple(axes.get_xlim()), tuple(axes.get_ylim())
+
+    def _can_blit(self) -> bool:
+        """
+        :return bool: Whether every subplot has a saved background matching its current range.
+        """
+        for name in self._axes:
+            if name not in self._backgrounds or self._bg_limits.get(name) != self._get_limits(name):
+                return False
+        return True
+
+    def _blit_lines(self) -> None:
+        """
+        Restore each subplot's saved background and draw only its line over it.
+        :return None:
+        """
+        for name in self._axes:
+            axes = self._axes[name]
+            self.restore_region(self._backgrounds[name])
+            axes.draw_artist(self._markers[name])
+            axes.draw_artist(self._lines[name])
+            self.blit(axes.bbox)
+
+    def _on_view_changed(self, axes) -> None:
+        """
+        Redraw with data chosen for the new view when the user pans or zooms.
+        :param axes: The subplot whose view changed.
+        :return None:
+        """
+        if self.is_navigating() and self._view_changed_handler:
+            self._view_changed_handler()
+
+    def paintEvent(self, event) -> None:
+        """
+        Paint the canvas then let listeners know it is on screen.
+        :param event: The Qt paint event.
+        :return None:
+        """
+        super().paintEvent(event)
+        self._painted()
+
+    def _on_draw(self, event) -> None:
+        """
+        After a full draw, save each subplot's background then draw the lines, which full draws skip when blitting.
+        :param event: The matplotlib draw event.
+        :return None:
+        """
+        if not self._blit:
+            return
+        self._backgrounds = dict()
+        self._bg_limits = dict()
+        for name in self._axes:
+            self._backgrounds[name] = self.copy_from_bbox(self._axes[name].bbox)
+            self._bg_limits[name] = self._get_limits(name)
+            self._axes[name].draw_artist(self._markers[name])
+            self._axes[name].draw_artist(self._lines[name])
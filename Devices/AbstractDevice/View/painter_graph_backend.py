@@ -0,0 +1,226 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import numpy as np
+from logging import getLogger
+from datetime import datetime, timezone
+from PySide2.QtWidgets import QWidget
+from PySide2.QtGui import QPainter, QPen, QColor, QPolygonF
+from PySide2.QtCore import Qt, QPointF, QRectF
+from Devices.AbstractDevice.View.graph_backend import GraphBackend
+
+left_margin = 70  # Room for y tick labels and the y label.
+right_margin = 30  # Room for half of the last x tick label.
+top_margin = 10
+bottom_margin = 45  # Room for x tick labels and the x label under the last subplot.
+subplot_gap = 25
+num_ticks = 5
+point_size = 3
+font_size = 8
+
+
+class _Subplot:
+    """ What the painter backend knows about a single subplot. """
+    def __init__(self, name: str):
+        self.name = name
+        self.left = 0.0
+        self.right = 1.0
+        self.times = np.empty(0)
+        self.values = np.empty(0)
+        self.markers = np.empty(0)
+        self.low = 0.0
+        self.high = 1.0
+
+
+class PainterGraphBackend(QWidget, GraphBackend):
+    """ Draws graphs directly with QPainter. Has no navigation but is cheap to create and to update. """
+    def __init__(self, parent):
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__(parent)
+        self.setMinimumHeight(200)
+        self._subplots = dict()  # name: _Subplot
+        self._x_label = str()
+        self._line_pen = QPen(QColor(31, 119, 180), 1.5)
+        self._marker_pen = QPen(QColor(127, 127, 127), 1)
+        self._axis_pen = QPen(Qt.black, 1)
+        self._font = self.font()
+        self._font.setPointSize(font_size)
+        self._logger.debug("Initialized")
+
+    def get_nav_bar(self) -> QWidget:
+        """
+        :return None: This backend has no nav bar.
+        """
+        return None
+
+    def set_layout(self, names: [str], x_label: str) -> None:
+        """
+        Replace all subplots with empty ones.
+        :param names: The subplot names.
+        :param x_label: The label under the bottom subplot.
+        :return None:
+        """
+        self._subplots = dict()
+        for name in names:
+            self._subplots[name] = _Subplot(name)
+        self._x_label = x_label
+
+    def set_x_window(self, name: str, left: float, right: float) -> None:
+        """
+        :param name: The subplot.
+        :param left: Epoch seconds of the left edge.
+        :param right: Epoch seconds of the right edge.
+        :return None:
+        """
+        subplot = self._subplots[name]
+        subplot.left = left
+        subplot.right = right if right > left else left + 1
+
+    def get_x_window(self, name: str) -> (float, float):
+        """
+        :param name: The subplot.
+        :return tuple: Epoch seconds of the left and right edges of the subplot.
+        """
+        subplot = self._subplots[name]
+        return subplot.left, subplot.right
+
+    def get_width(self, name: str) -> int:
+        """
+        :param name: The subplot.
+        :return int: The width of the subplot in pixels.
+        """
+        return max(self.width() - left_margin - right_margin, 1)
+
+    def set_data(self, name: str, times, values) -> None:
+        """
+        Store a copy of the data to draw and fit the y range to it.
+        :param name: The subplot.
+        :param times: Epoch seconds.
+        :param values: The values at those times.
+        :return None:
+        """
+        subplot = self._subplots[name]
+        subplot.times = np.array(times, dtype=float)
+        subplot.values = np.array(values, dtype=float)
+        finite = subplot.values[np.isfinite(subplot.values)]
+        if len(finite) > 0:
+            low, high = finite.min(), finite.max()
+            pad = (high - low) * 0.1 or 1
+            subplot.low, subplot.high = low - pad, high + pad
+
+    def set_markers(self, name: str, times) -> None:
+        """
+        :param name: The subplot.
+        :param times: Epoch seconds of the visible markers.
+        :return None:
+        """
+        self._subplots[name].markers = np.array(times, dtype=float)
+
+    async def render(self) -> None:
+        """
+        Ask Qt to repaint this widget.
+        :return None:
+        """
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        """
+        Draw every subplot.
+        :param event: The Qt paint event.
+        :return None:
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        painter.setFont(self._font)
+        painter.setRenderHint(QPainter.Antialiasing)
+        num_plots = len(self._subplots)
+        if num_plots > 0:
+            height = (self.height() - top_margin - bottom_margin - subplot_gap * (num_plots - 1)) / num_plots
+            width = self.get_width("")
+            top = top_margin
+            names = list(self._subplots)
+            for i in range(num_plots):
+                rect = QRectF(left_margin, top, width, max(height, 1))
+                self._paint_subplot(painter, self._subplots[names[i]], rect, i == num_plots - 1)
+                top += height + subplot_gap
+        painter.end()
+        self._painted()
+
+    def _paint_subplot(self, painter: QPainter, subplot: _Subplot, rect: QRectF, last: bool) -> None:
+        """
+        Draw the axes, ticks, line, points and marker lines of one subplot.
+        :param painter: The painter to draw with.
+        :param subplot: The subplot to draw.
+        :param rect: Where to draw the subplot's data area.
+        :param last: Whether this is the bottom subplot, which gets the x label.
+        :return None:
+        """
+        x_scale = rect.width() / (subplot.right - subplot.left)
+        y_scale = rect.height() / (subplot.high - subplot.low)
+        painter.setPen(self._axis_pen)
+        painter.drawRect(rect)
+        metrics = painter.fontMetrics()
+        for i in range(num_ticks):
+            value = subplot.low + (subplot.high - subplot.low) * i / (num_ticks - 1)
+            y = rect.bottom() - (value - subplot.low) * y_scale
+            painter.drawLine(QPointF(rect.left() - 4, y), QPointF(rect.left(), y))
+            text = "{:g}".format(round(value, 2))
+            painter.drawText(QPointF(rect.left() - 6 - metrics.width(text), y + metrics.ascent() / 2), text)
+            time = subplot.left + (subplot.right - subplot.left) * i / (num_ticks - 1)
+            x = rect.left() + (time - subplot.left) * x_scale
+            painter.drawLine(QPointF(x, rect.bottom()), QPointF(x, rect.bottom() + 4))
+            text = datetime.fromtimestamp(time, timezone.utc).strftime("%H:%M:%S")
+            painter.drawText(QPointF(x - metrics.width(text) / 2, rect.bottom() + 4 + metrics.ascent()), text)
+        painter.save()
+        painter.translate(metrics.height(), rect.center().y() + metrics.width(subplot.name) / 2)
+        painter.rotate(-90)
+        painter.drawText(0, 0, subplot.name)
+        painter.restore()
+        if last:
+            painter.drawText(QPointF(rect.center().x() - metrics.width(self._x_label) / 2,
+                                     rect.bottom() + 6 + metrics.height() * 2), self._x_label)
+        painter.setClipRect(rect)
+        painter.setPen(self._marker_pen)
+        for time in subplot.markers:
+            x = rect.left() + (time - subplot.left) * x_scale
+            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+        xs = rect.left() + (subplot.times - subplot.left) * x_scale
+        ys = rect.bottom() - (subplot.values - subplot.low) * y_scale
+        painter.setPen(self._line_pen)
+        painter.setBrush(self._line_pen.color())
+        finite = np.isfinite(ys)
+        # Each run of finite values between gaps is its own polyline.
+        breaks = np.flatnonzero(~finite)
+        for segment in np.split(np.arange(len(ys)), breaks):
+            segment = segment[finite[segment]]
+            if len(segment) == 0:
+                continue
+            points = [QPointF(xs[j], ys[j]) for j in segment]
+            painter.drawPolyline(QPolygonF(points))
+            for point in points:
+                painter.drawEllipse(point, point_size, point_size)
+        painter.setClipping(False)
+        painter.setBrush(Qt.NoBrush)
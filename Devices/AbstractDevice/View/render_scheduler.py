@@ -0,0 +1,150 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from logging import getLogger
+from time import perf_counter
+from weakref import WeakKeyDictionary
+from asyncio import Event, sleep
+from Model.task_supervisor import get_supervisor, TaskKind
+
+max_fps = 20  # Most times per second a single graph is redrawn.
+min_fps = 2  # Fewest times per second a dirty graph is redrawn no matter how busy the app is.
+render_share = 0.5  # Most of the event loop's time that drawing may use.
+lag_limit = 0.05  # Seconds of event loop lag after which redraws are slowed.
+
+
+class RenderScheduler:
+    """
+    Redraws graphs for the whole app. Graphs are marked dirty when they get new data and each dirty graph is drawn
+    once per frame however many times it was marked. The frame interval grows when drawing takes too long or the
+    event loop falls behind so device messages are always handled first. Graphs that are not on screen are not
+    drawn until they are shown again.
+    """
+    def __init__(self):
+        self._logger = getLogger(__name__)
+        self._dirty = WeakKeyDictionary()
+        self._hidden = WeakKeyDictionary()  # Dirty graphs waiting to be shown.
+        self._wake = None
+        self._task = None
+        self._interval = 1 / max_fps
+        self._draw_time = 0.0  # Running average of seconds per graph draw.
+        self._lag = 0.0  # Running average of how late frames start.
+
+    def mark_dirty(self, graph) -> None:
+        """
+        Ask for graph to be redrawn on the next frame.
+        :param graph: The graph to redraw. Must have an async plot() method and an is_on_screen() method.
+        :return None:
+        """
+        self._dirty[graph] = True
+        if self._task is None or self._task.done():
+            self._wake = Event()
+            self._task = get_supervisor().spawn(TaskKind.LOOP, self._run)
+        self._wake.set()
+
+    def mark_shown(self, graph) -> None:
+        """
+        Redraw graph if it was skipped while it was not on screen.
+        :param graph: The graph that may now be seen.
+        :return None:
+        """
+        if self._hidden.pop(graph, None):
+            self.mark_dirty(graph)
+
+    def get_interval(self) -> float:
+        """
+        :return float: The current seconds between frames.
+        """
+        return self._interval
+
+    def get_stats(self) -> (float, float, float):
+        """
+        :return tuple: (frames per second, average ms per graph draw, average ms of event loop lag)
+        """
+        return 1 / self._interval, self._draw_time * 1000, self._lag * 1000
+
+    async def _run(self) -> None:
+        """
+        Draw dirty graphs at most once per frame interval.
+        :return None:
+        """
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            frame_start = perf_counter()
+            graphs = list(self._dirty.keys())
+            self._dirty.clear()
+            graphs = [graph for graph in graphs if self._check_on_screen(graph)]
+            for graph in graphs:
+                draw_start = perf_counter()
+                try:
+                    await graph.plot()
+                except Exception as e:
+                    self._logger.exception("Failed drawing graph.")
+                self._draw_time = self._average(self._draw_time, perf_counter() - draw_start)
+                await sleep(0)
+            self._adapt(len(graphs))
+            wait = max(0.0, self._interval - (perf_counter() - frame_start))
+            sleep_start = perf_counter()
+            await sleep(wait)
+            self._lag = self._average(self._lag, perf_counter() - sleep_start - wait)
+
+    def _check_on_screen(self, graph) -> bool:
+        """
+        :param graph: A dirty graph.
+        :return bool: Whether graph should be drawn now. If not, it is drawn once mark_shown() is called for it.
+        """
+        if graph.is_on_screen():
+            return True
+        self._hidden[graph] = True
+        return False
+
+    def _adapt(self, num_graphs: int) -> None:
+        """
+        Set the frame interval from how long drawing takes and how far behind the event loop is.
+        :param num_graphs: How many graphs were drawn in the last frame.
+        :return None:
+        """
+        interval = max(1 / max_fps, self._draw_time * num_graphs / render_share)
+        if self._lag > lag_limit:
+            interval = max(interval, self._interval * 1.5)
+        self._interval = min(interval, 1 / min_fps)
+
+    @staticmethod
+    def _average(current: float, new: float) -> float:
+        """
+        :return float: Exponential moving average of current with new.
+        """
+        return current * 0.8 + new * 0.2
+
+
+_scheduler = RenderScheduler()
+
+
+def get_render_scheduler() -> RenderScheduler:
+    """
+    :return RenderScheduler: The app wide render scheduler.
+    """
+    return _scheduler
@@ -0,0 +1,240 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import numpy as np
+from logging import getLogger
+from weakref import finalize
+from concurrent.futures import ThreadPoolExecutor
+from asyncio import get_running_loop
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from PySide2.QtWidgets import QWidget
+from PySide2.QtGui import QPainter, QImage
+from PySide2.QtCore import Qt
+from Devices.AbstractDevice.View.graph_backend import GraphBackend
+from Devices.AbstractDevice.View.mpl_graph_backend import epoch_to_num
+
+
+class _RenderJob:
+    """ Everything the worker needs to draw one frame, copied so the GUI thread can keep changing its own state. """
+    def __init__(self, width: int, height: int, dpi: float, layout: tuple, windows: dict, data: dict,
+                 markers: dict):
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.layout = layout  # (names, x label) if the subplots must be rebuilt, otherwise None.
+        self.windows = windows
+        self.data = data
+        self.markers = markers
+
+
+class ThreadedMplGraphBackend(QWidget, GraphBackend):
+    """
+    Draws graphs with matplotlib's Agg renderer on a worker thread. Each graph has its own figure and worker so no
+    matplotlib state is shared between threads. The GUI thread only paints the finished image.
+    """
+    def __init__(self, parent):
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__(parent)
+        self.setMinimumHeight(200)
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        finalize(self, self._worker.shutdown, False)
+        # Only touched by the worker.
+        self._figure = Figure(figsize=(5, 5))
+        self._canvas = FigureCanvasAgg(self._figure)
+        self._axes = dict()  # name: axes
+        self._lines = dict()  # name: line
+        self._markers = dict()  # name: LineCollection of marker lines
+        self._size = None  # (width, height, dpi) the subplots were last laid out for.
+        # Only touched by the GUI thread.
+        self._names = list()
+        self._layout = None
+        self._windows = dict()  # name: (left, right)
+        self._data = dict()  # name: (times, values)
+        self._widths = dict()  # name: pixel width of the subplot in the last frame
+        self._marker_times = dict()  # name: times of the visible markers
+        self._image = None
+        self._logger.debug("Initialized")
+
+    def get_nav_bar(self) -> QWidget:
+        """
+        :return None: This backend has no nav bar.
+        """
+        return None
+
+    def set_layout(self, names: [str], x_label: str) -> None:
+        """
+        Replace all subplots on the next render.
+        :param names: The subplot names.
+        :param x_label: The label under the bottom subplot.
+        :return None:
+        """
+        self._names = list(names)
+        self._layout = (list(names), x_label)
+        self._windows = dict()
+        self._data = dict()
+        self._marker_times = dict()
+
+    def set_x_window(self, name: str, left: float, right: float) -> None:
+        """
+        :param name: The subplot.
+        :param left: Epoch seconds of the left edge.
+        :param right: Epoch seconds of the right edge.
+        :return None:
+        """
+        self._windows[name] = (left, right if right > left else left + 1)
+
+    def get_x_window(self, name: str) -> (float, float):
+        """
+        :param name: The subplot.
+        :return tuple: Epoch seconds of the left and right edges of the subplot.
+        """
+        return self._windows.get(name, (0.0, 1.0))
+
+    def get_width(self, name: str) -> int:
+        """
+        :param name: The subplot.
+        :return int: The width of the subplot in pixels as of the last render.
+        """
+        return self._widths.get(name, max(self.width(), 1))
+
+    def set_data(self, name: str, times, values) -> None:
+        """
+        Store a copy of the data to draw on the next render.
+        :param name: The subplot.
+        :param times: Epoch seconds.
+        :param values: The values at those times.
+        :return None:
+        """
+        self._data[name] = (np.array(times, dtype=float), np.array(values, dtype=float))
+
+    def set_markers(self, name: str, times) -> None:
+        """
+        Store a copy of the visible markers to draw on the next render.
+        :param name: The subplot.
+        :param times: Epoch seconds of the visible markers.
+        :return None:
+        """
+        self._marker_times[name] = np.array(times, dtype=float)
+
+    async def render(self) -> None:
+        """
+        Draw the figure on the worker thread then show the result.
+        :return None:
+        """
+        job = _RenderJob(max(self.width(), 1), max(self.height(), 1), self.logicalDpiX(), self._layout,
+                         dict(self._windows), dict(self._data), dict(self._marker_times))
+        self._layout = None  # Cleared now so a layout set while this frame draws is kept for the next one.
+        try:
+            self._image, self._widths = await get_running_loop().run_in_executor(self._worker, self._draw, job)
+        except Exception as e:
+            self._logger.exception("issue with drawing figure.")
+            if self._layout is None:
+                self._layout = job.layout  # Rebuild on the next render instead of drawing on stale axes.
+            return
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        """
+        Paint the last finished frame.
+        :param event: The Qt paint event.
+        :return None:
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        if self._image:
+            painter.drawImage(0, 0, self._image)
+        painter.end()
+        self._painted()
+
+    def _draw(self, job: _RenderJob) -> (QImage, dict):
+        """
+        Runs on the worker thread. Apply job to the figure and rasterize it.
+        :param job: What to draw.
+        :return tuple: (the finished image, pixel width of each subplot)
+        """
+        if job.layout:
+            self._build(*job.layout)
+        size = (job.width, job.height, job.dpi)
+        relayout = size != self._size
+        if relayout:
+            self._figure.set_size_inches(job.width / job.dpi, job.height / job.dpi)
+            self._figure.set_dpi(job.dpi)
+            self._size = size
+        for name in self._axes:
+            axes = self._axes[name]
+            if name in job.data:
+                times, values = job.data[name]
+                self._lines[name].set_data(epoch_to_num(times), values)
+            if name in job.markers:
+                x = epoch_to_num(job.markers[name])
+                self._markers[name].set_segments([[(time, 0), (time, 1)] for time in x])
+            if name in job.windows:
+                left, right = job.windows[name]
+                axes.set_xlim(left=epoch_to_num(left), right=epoch_to_num(right))
+            axes.relim()
+            axes.autoscale_view(scalex=False)
+        if relayout:
+            # Laying out every frame costs more than the rest of the draw, so it is only done when needed.
+            self._figure.tight_layout()
+        self._canvas.draw()
+        buffer = self._canvas.buffer_rgba()
+        height, width = buffer.shape[0], buffer.shape[1]
+        data = bytes(buffer)
+        # QImage does not own data passed to it so copy it before data is freed.
+        image = QImage(data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+        widths = dict()
+        for name in self._axes:
+            widths[name] = max(int(self._axes[name].bbox.width), 1)
+        return image, widths
+
+    def _build(self, names: [str], x_label: str) -> None:
+        """
+        Runs on the worker thread. Replace all subplots.
+        :param names: The subplot names.
+        :param x_label: The label under the bottom subplot.
+        :return None:
+        """
+        self._axes = dict()
+        self._lines = dict()
+        self._markers = dict()
+        self._figure.clear()
+        self._size = None  # New subplots need laying out.
+        num_plots = len(names)
+        for i in range(num_plots):
+            axes = self._figure.add_subplot(num_plots, 1, i + 1)
+            axes.tick_params(axis='x', labelrotation=30)
+            axes.set_ylabel(names[i])
+            if i == num_plots - 1:
+                axes.set_xlabel(x_label)
+            axes.xaxis_date()
+            line, = axes.plot([], [], marker='o')
+            markers = LineCollection([], colors="grey", linewidths=1, transform=axes.get_xaxis_transform())
+            axes.add_collection(markers, autolim=False)
+            self._axes[names[i]] = axes
+            self._lines[names[i]] = line
+            self._markers[names[i]] = markers
@@ -0,0 +1,197 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import os
+from datetime import datetime
+from aioserial import AioSerial
+from Model.lifecycle_timer import get_lifecycle_timer, TimingPhase
+from Model.task_supervisor import get_supervisor, TaskKind
+from Devices.AbstractDevice.Controller.abstract_controller import AbstractController
+from Devices.DRT.Model.drt_model import DRTModel
+from Devices.DRT.Resources.drt_strings import LangEnum
+from Model.tracer import trace
+from Model.pipeline_trace import MessageTrace
+
+# Setting names sent by the device and the DRTModel.set_current_vals() argument each one fills.
+settings_args = {"stimDur": "duration", "intensity": "intensity", "upperISI": "upper_isi", "lowerISI": "lower_isi"}
+
+
+def get_device_name(conn: AioSerial) -> str:
+    """
+    :param conn: The device's connection.
+    :return str: The name this device's files and graphs use.
+    """
+    return "DRT_" + os.path.basename(conn.port).strip("COM")  # Linux ports are paths.
+
+
+class DRTBase(AbstractController):
+    """
+    Message and experiment handling shared by the DRT Controller and Recorder. Loads no Qt, so anything shown to
+    the user is left to the hooks subclasses override.
+    """
+    def __init__(self, conn: AioSerial, view=None):
+        """
+        :param conn: The device's connection.
+        :param view: This device's view, or None for headless recorders.
+        """
+        super().__init__(view)
+        self._device_name = get_device_name(conn)
+        self._model = DRTModel(self._device_name, conn)
+        self._timer = get_lifecycle_timer()
+        self._exp = False
+        self._init_values()
+        # Only runs once the constructor returns, so subclasses can finish setting up after this.
+        self._msg_handler_task = get_supervisor().spawn(TaskKind.LOOP, self.msg_handler)
+
+    @trace
+    def cleanup(self) -> None:
+        """
+        Cleanup this code for removal or app closure.
+        :return: None.
+        """
+        if self._exp:
+            self.stop_exp()
+        self._msg_handler_task.cancel()
+        self._model.cleanup()
+
+    def set_lang(self, lang: LangEnum) -> None:
+        """
+        Set the language of this device's save file header.
+        :param lang: The enum for the language.
+        :return: None.
+        """
+        self._model.set_lang(lang)
+
+    def get_conn(self) -> AioSerial:
+        """
+        :return: The AioSerial connection passed in at creation.
+        """
+        return self._model.get_conn()
+
+    @trace
+    async def msg_handler(self) -> None:
+        """
+        Handle messages sent from device.
+        :return: None.
+        """
+        while True:
+            msg, timestamp = await self._model.get_msg()
+            msg_type = msg['type']
+            if msg_type == "data":
+                self._timer.stop(self.get_conn().port, TimingPhase.FIRST_TRIAL)
+                self._show_data(msg['values'], timestamp, msg.get('trace'))
+                self._model.save_data(msg['values'], timestamp, msg.get('trace'))
+                self.publish_data(msg['values'], timestamp)
+            elif msg_type == "settings":
+                self._timer.stop(self.get_conn().port, TimingPhase.FIRST_CONFIG)
+                self._update_config(msg['values'])
+
+    @trace
+    def create_exp(self, path: str) -> None:
+        """
+        Set this device's save dir.
+        :param path: The save dir.
+        :return None:
+        """
+        self._model.update_save_info(path)
+        self._model.add_save_hdr()
+
+    @trace
+    def start_exp(self) -> None:
+        """
+        Start this device.
+        :return: None.
+        """
+        self._model.send_start()
+        self.exp_started(datetime.now())
+
+    @trace
+    def stop_exp(self) -> None:
+        """
+        Stop this device.
+        :return: None.
+        """
+        self._model.send_stop()
+        self.exp_stopped(datetime.now())
+
+    def get_start_cmd(self) -> bytes:
+        """
+        :return bytes: The encoded start command for this device.
+        """
+        return self._model.get_start_cmd()
+
+    def get_stop_cmd(self) -> bytes:
+        """
+        :return bytes: The encoded stop command for this device.
+        """
+        return self._model.get_stop_cmd()
+
+    @trace
+    def exp_started(self, timestamp: datetime) -> None:
+        """
+        Update this device's state after it has been told to start.
+        :param timestamp: When the experiment was started.
+        :return: None.
+        """
+        self._exp = True
+        if not self._timer.has_span(self.get_conn().port, TimingPhase.FIRST_TRIAL):
+            self._timer.start(self.get_conn().port, TimingPhase.FIRST_TRIAL)
+
+    def exp_stopped(self, timestamp: datetime) -> None:
+        """
+        Update this device's state after it has been told to stop.
+        :param timestamp: When the experiment was stopped.
+        :return: None.
+        """
+        self._exp = False
+
+    @trace
+    def _init_values(self) -> None:
+        """
+        Send for device config.
+        :return: None.
+        """
+        self._timer.start(self.get_conn().port, TimingPhase.FIRST_CONFIG)
+        self._model.query_config()
+
+    def _show_data(self, values: dict, timestamp: datetime, msg_trace: MessageTrace = None) -> None:
+        """
+        Show data from device to the user. Does nothing here since there is nothing to show it on.
+        :param values: The data to show.
+        :param timestamp: When the data was received.
+        :param msg_trace: The message's pipeline trace, if it is being traced.
+        :return: None.
+        """
+        pass
+
+    def _update_config(self, msg: dict) -> None:
+        """
+        Keep the device's current settings.
+        :param msg: The current device settings.
+        :return: None.
+        """
+        for key in msg:
+            if key in settings_args:
+                self._model.set_current_vals(**{settings_args[key]: msg[key]})
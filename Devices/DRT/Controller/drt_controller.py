@@ -23,122 +23,89 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from datetime import datetime
-from asyncio import create_task
 from aioserial import AioSerial
-from Devices.AbstractDevice.Controller.abstract_controller import AbstractController
 from Devices.AbstractDevice.View.graph_frame import GraphFrame
+from Devices.DRT.Controller.drt_base import DRTBase, get_device_name
 from Devices.DRT.View.drt_view import DRTView
 from Devices.DRT.View.drt_graph import DRTGraph
-from Devices.DRT.Model.drt_model import DRTModel
 from Devices.DRT.Model import drt_defs as defs
 from Devices.DRT.Resources.drt_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
+from Model.pipeline_trace import MessageTrace
 
 
-class Controller(AbstractController):
-    def __init__(self, conn: AioSerial, lang: LangEnum, log_handlers: [StreamHandler]):
+class Controller(DRTBase):
+    def __init__(self, conn: AioSerial, lang: LangEnum):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
-        device_name = "DRT_" + conn.port.strip("COM")
-        super().__init__(DRTView(device_name, log_handlers))
-        self._model = DRTModel(device_name, conn, log_handlers)
-        self._graph = DRTGraph(None, device_name, log_handlers)
-        self.view.add_graph(GraphFrame(None, self._graph, log_handlers))
-        self._exp = False
+        device_name = get_device_name(conn)
+        super().__init__(conn, DRTView(device_name))
+        self._graph = DRTGraph(None, device_name)
+        self.view.add_graph(GraphFrame(None, self._graph))
         self._updating_config = False
         self._setup_handlers()
-        self._init_values()
-        self._msg_handler_task = create_task(self.msg_handler())
         self._strings = dict()
         self.set_lang(lang)
         self._logger.debug("Initialized")
 
-    def cleanup(self) -> None:
-        """
-        Cleanup this code for removal or app closure.
-        :return: None.
-        """
-        self._logger.debug("running")
-        if self._exp:
-            self.stop_exp()
-        self._msg_handler_task.cancel()
-        self._model.cleanup()
-        self._logger.debug("done")
-
+    @trace
     def set_lang(self, lang: LangEnum) -> None:
         """
         Set this device's view language.
         :param lang: The enum for the language.
         :return: None.
         """
-        self._logger.debug("running")
+        super().set_lang(lang)
         self._strings = strings[lang]
-        self._model.set_lang(lang)
         self.view.set_lang(lang)
         self._graph.set_lang(lang)
-        self._logger.debug("done")
-
-    def get_conn(self) -> AioSerial:
-        """
-        :return: The AioSerial connection passed in at creation.
-        """
-        return self._model.get_conn()
-
-    async def msg_handler(self) -> None:
-        """
-        Handle messages sent from device.
-        :return: None.
-        """
-        self._logger.debug("running")
-        while True:
-            msg, timestamp = await self._model.get_msg()
-            msg_type = msg['type']
-            if msg_type == "data":
-                self._update_view_data(msg['values'], timestamp)
-                self._model.save_data(msg['values'], timestamp)
-            elif msg_type == "settings":
-                self._update_view_config(msg['values'])
 
+    @trace
     def create_exp(self, path: str) -> None:
         """
         Set this device's save dir.
         :param path: The save dir.
         :return None:
         """
-        self._logger.debug("running")
-        self._model.update_save_info(path)
-        self._model.add_save_hdr()
+        super().create_exp(path)
         self._graph.clear_graph()
-        self._logger.debug("done")
 
-    def start_exp(self) -> None:
+    @trace
+    def exp_started(self, timestamp: datetime) -> None:
+        """
+        Update this device's state after it has been told to start.
+        :param timestamp: When the experiment was started.
+        :return: None.
+        """
+        super().exp_started(timestamp)
+        self._graph.add_empty_point(timestamp)
+        self._graph.add_vert_lines(timestamp)
+
+    def exp_stopped(self, timestamp: datetime) -> None:
         """
-        Start this device.
+        Update this device's state after it has been told to stop.
+        :param timestamp: When the experiment was stopped.
         :return: None.
         """
-        self._logger.debug("running")
-        self._model.send_start()
-        self._graph.add_empty_point(datetime.now())
-        self._logger.debug("done")
+        super().exp_stopped(timestamp)
+        self._graph.add_vert_lines(timestamp)
 
-    def stop_exp(self) -> None:
+    def add_marker(self, timestamp: datetime) -> None:
         """
-        Stop this device.
+        Mark an experiment event on this device's graph.
+        :param timestamp: When the event happened.
         :return: None.
         """
-        self._logger.debug("running")
-        self._model.send_stop()
-        self._logger.debug("done")
+        self._graph.add_vert_lines(timestamp)
 
+    @trace
     def _setup_handlers(self) -> None:
         """
         Attach handlers to view.
         :return: None.
         """
-        self._logger.debug("running")
         # button handlers
         self.view.set_iso_button_handler(self._iso)
         self.view.set_upload_button_handler(self._update_device)
@@ -148,24 +115,14 @@ class Controller(AbstractController):
         self.view.set_stim_intens_entry_changed_handler(self._stim_int_entry_changed_handler)
         self.view.set_upper_isi_entry_changed_handler(self._isi_entry_changed_handler)
         self.view.set_lower_isi_entry_changed_handler(self._isi_entry_changed_handler)
-        self._logger.debug("done")
-
-    def _init_values(self):
-        """
-        Send for device config.
-        :return: None.
-        """
-        self._logger.debug("running")
-        self._model.query_config()
-        self._logger.debug("done")
 
+    @trace
     def _update_device(self) -> None:
         """
         If user input has changed, send updates.
         :return: None.
         """
         changed = False
-        self._logger.debug("running")
         if self._model.dur_changed():
             self._model.send_stim_dur(self.view.get_stim_dur())
             changed = True
@@ -182,34 +139,34 @@ class Controller(AbstractController):
             self.view.set_config_val(self.view.strings[StringsEnum.CUSTOM_LABEL])
         self._model.reset_changed()
         self._check_for_upload()
-        self._logger.debug("done")
 
-    def _update_view_data(self, values: dict, timestamp: datetime) -> None:
+    @trace
+    def _show_data(self, values: dict, timestamp: datetime, msg_trace: MessageTrace = None) -> None:
         """
         Display data from device on view.
         :param values: The data to display.
         :param timestamp: When the data was received.
+        :param msg_trace: The message's pipeline trace, if it is being traced.
         :return: None.
         """
-        self._logger.debug("running")
         data1 = [self._strings[StringsEnum.PLOT_NAME_RT], timestamp, values[defs.output_fields[3]]]
         data2 = [self._strings[StringsEnum.PLOT_NAME_CLICKS], timestamp, values[defs.output_fields[2]]]
-        self._graph.add_data([data1, data2])
-        self._logger.debug("done")
+        self._graph.add_data([data1, data2], msg_trace)
 
-    def _update_view_config(self, msg: dict) -> None:
+    @trace
+    def _update_config(self, msg: dict) -> None:
         """
-        Send device config updates to the view.
+        Keep the device's current settings and show them on the view.
         :param msg: The current device settings.
         :return: None.
         """
-        self._logger.debug("running")
+        super()._update_config(msg)
         self._updating_config = True
         for key in msg:
             self._set_view_val(key, msg[key])
         self._updating_config = False
-        self._logger.debug("done")
 
+    @trace
     def _set_view_val(self, var: str, val: int) -> None:
         """
         Set the value for the config field in the view.
@@ -217,53 +174,45 @@ class Controller(AbstractController):
         :param val: The new value.
         :return: None.
         """
-        self._logger.debug("running")
         if var == "stimDur":
-            self._model.set_current_vals(duration=val)
             self.view.set_stim_dur(val)
             self.view.set_stim_dur_err(False)
         elif var == "intensity":
-            self._model.set_current_vals(intensity=val)
             self.view.set_stim_intens(self._model.calc_val_to_percent(val))
         elif var == "upperISI":
-            self._model.set_current_vals(upper_isi=val)
             self.view.set_upper_isi(val)
             self.view.set_upper_isi_err(False)
         elif var == "lowerISI":
-            self._model.set_current_vals(lower_isi=val)
             self.view.set_lower_isi(val)
             self.view.set_lower_isi_err(False)
-        self._logger.debug("done")
 
+    @trace
     def _stim_dur_entry_changed_handler(self) -> None:
         """
         Handle when the user changes the value in stim duration.
         :return: None.
         """
-        self._logger.debug("running")
         if not self._updating_config:
             self.view.set_stim_dur_err(not self._model.check_stim_dur_entry(self.view.get_stim_dur()))
             self._check_for_upload()
-        self._logger.debug("done")
 
+    @trace
     def _stim_int_entry_changed_handler(self) -> None:
         """
         Handle when the user changes the value in stim intensity.
         :return: None.
         """
-        self._logger.debug("running")
         if not self._updating_config:
             self._model.check_stim_int_entry(self.view.get_stim_intens())
             self.view.update_stim_intens_val_tooltip()
             self._check_for_upload()
-        self._logger.debug("done")
 
+    @trace
     def _isi_entry_changed_handler(self) -> None:
         """
         Handle when the user changes the value in upper or lower isi.
         :return: None.
         """
-        self._logger.debug("running")
         if not self._updating_config:
             upper = self.view.get_upper_isi()
             lower = self.view.get_lower_isi()
@@ -272,24 +221,21 @@ class Controller(AbstractController):
             self.view.set_upper_isi_err(err_upper)
             self.view.set_lower_isi_err(err_lower)
             self._check_for_upload()
-        self._logger.debug("done")
 
+    @trace
     def _check_for_upload(self) -> None:
         """
         Set view upload button depending on if upload is possible.
         :return: None.
         """
-        self._logger.debug("running")
         self.view.set_upload_button(self._model.check_current_input())
-        self._logger.debug("done")
 
+    @trace
     def _iso(self) -> None:
         """
         Set the values of the device to iso standard.
         :return: None.
         """
-        self._logger.debug("running")
         self.view.set_config_val(self.view.strings[StringsEnum.ISO_LABEL])
         self._model.send_iso()
         self.view.set_upload_button(False)
-        self._logger.debug("done")
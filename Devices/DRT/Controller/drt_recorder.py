@@ -0,0 +1,49 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from logging import getLogger
+from aioserial import AioSerial
+from Devices.DRT.Controller.drt_base import DRTBase
+from Devices.DRT.Resources.drt_strings import LangEnum
+
+
+class Recorder(DRTBase):
+    """ Saves a DRT's data without a view or graph. Used instead of Controller when the app runs headless. """
+    def __init__(self, conn: AioSerial, lang: LangEnum):
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__(conn)
+        self.set_lang(lang)
+        self._logger.debug("Initialized")
+
+    def _update_config(self, msg: dict) -> None:
+        """
+        Keep the device's current settings and log them, since there is no view to show them in.
+        :param msg: The current device settings.
+        :return: None.
+        """
+        super()._update_config(msg)
+        for key in msg:
+            self._logger.info(self._device_name + " " + key + ": " + str(msg[key]))
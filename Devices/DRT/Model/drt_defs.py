@@ -26,6 +26,10 @@ https://redscientific.com/index.html
 
 profile = {"DRT": {"vid": 9114, "pid": 32798}}
 
+# Which graph backend draws this device's live data until the user picks one from the graph's right click menu.
+# "painter", "matplotlib" or "threaded_matplotlib".
+graph_backend = "painter"
+
 config_fields = ['lowerISI', 'upperISI', 'stimDur', 'intensity']
 output_fields = ['startMillis', 'trial', 'clicks', 'rt']
 save_fields = ['trial', 'clicks', 'startMillis', 'rt']
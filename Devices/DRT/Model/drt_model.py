@@ -23,21 +23,27 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
-from asyncio import create_task
+from logging import getLogger
 from aioserial import AioSerial
 from math import trunc, ceil
 from datetime import datetime
+from time import perf_counter
+from collections import deque
 from Model.app_helpers import write_line_to_file, format_current_time
+from Model.task_supervisor import get_supervisor, TaskKind
 from Devices.DRT.Model import drt_defs as defs
 from Devices.DRT.Resources.drt_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
+from Model.metrics import get_metrics
+from Model.pipeline_trace import get_pipeline_tracer, Stage, MessageTrace
+
+# Most unanswered get_ and set_ commands remembered per setting.
+reply_backlog = 16
 
 
 class DRTModel:
-    def __init__(self, dev_name: str, conn: AioSerial, log_handlers: [StreamHandler]):
+    def __init__(self, dev_name: str, conn: AioSerial):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         self._dev_name = dev_name
         self._conn = conn
@@ -47,6 +53,16 @@ class DRTModel:
         self._current_vals = [0, 0, 0, 0]  # dur, int, upper, lower
         self._errs = [False, False, False, False]  # dur, upper, lower
         self._changed = [False, False, False, False]
+        self._start_cmd = str.encode(self._prepare_msg("exp_start"))
+        self._stop_cmd = str.encode(self._prepare_msg("exp_stop"))
+        metrics = get_metrics()
+        self._msg_count = metrics.counter("device_messages_total", "Messages received from a device.",
+                                          device=dev_name)
+        self._bytes_read = metrics.counter("device_bytes_read_total", "Bytes received from a device.", device=dev_name)
+        self._round_trip = metrics.histogram("device_round_trip_ms", "Time from sending a get_ query to a device "
+                                             "until its reply arrives, in ms. Replies are matched to commands in "
+                                             "order for each setting.", device=dev_name)
+        self._pending_replies = dict()  # setting or "config": deque of (perf_counter when sent, whether a get_)
         self._logger.debug("Initialized")
 
     def get_conn(self) -> AioSerial:
@@ -64,6 +80,7 @@ class DRTModel:
         self._save_dir = path
         self._save_filename = self._dev_name + "_" + format_current_time(datetime.now(), save=True) + ".csv"
 
+    @trace
     def set_current_vals(self, duration: int = None, intensity: int = None, upper_isi: int = None,
                          lower_isi: int = None) -> None:
         """
@@ -74,7 +91,6 @@ class DRTModel:
         :param lower_isi: The lower_isi value.
         :return: None.
         """
-        self._logger.debug("running")
         if duration:
             self._current_vals[0] = duration
         if intensity:
@@ -83,7 +99,6 @@ class DRTModel:
             self._current_vals[2] = upper_isi
         if lower_isi:
             self._current_vals[3] = lower_isi
-        self._logger.debug("done")
 
     def reset_changed(self) -> None:
         """
@@ -114,24 +129,51 @@ class DRTModel:
         self.send_upper_isi(str(defs.iso_standards["upperISI"]))
         self.send_lower_isi(str(defs.iso_standards["lowerISI"]))
 
+    @trace
     async def get_msg(self) -> (dict, datetime):
         """
-        Get next message from device.
+        Get next message from device. Data messages that are sampled by the pipeline tracer carry their
+        MessageTrace under 'trace'.
         :return: (The next message from device, when the message was received.)
         """
-        self._logger.debug("running")
         line = await self._conn.readline_async()
+        received = perf_counter()
         msg = self._parse_msg(line.decode("utf-8"))
         timestamp = datetime.now()
+        if msg.get('type') == "data":
+            msg['trace'] = get_pipeline_tracer().begin(self._dev_name, received)
+            if msg['trace']:
+                msg['trace'].mark(Stage.PARSED)
+        self._msg_count.inc()
+        self._bytes_read.inc(len(line))
+        if msg.get('type') == "settings":
+            self._match_reply(msg['values'], received)
         return msg, timestamp
 
+    def _match_reply(self, values: dict, received: float) -> None:
+        """
+        Pair a settings reply with the oldest unanswered command for the same setting and record the round trip
+        if that command was a query. Replies to set_ commands are paired but not recorded.
+        :param values: The settings in the reply. All of them for get_config, otherwise one.
+        :param received: perf_counter when the reply was read.
+        :return None:
+        """
+        key = "config" if len(values) > 1 else next(iter(values), None)
+        pending = self._pending_replies.get(key)
+        if not pending:
+            return
+        sent, query = pending.popleft()
+        if query:
+            self._round_trip.observe((received - sent) * 1000)
+
+    @trace
     def cleanup(self) -> None:
         """
         Cleanup this code for code removal or app closure.
         :return: None.
         """
-        self._logger.debug("running")
-        self._logger.debug("done")
+        if self._conn.is_open:
+            self._conn.close()
 
     def dur_changed(self) -> bool:
         """
@@ -157,116 +199,119 @@ class DRTModel:
         """
         return self._changed[3]
 
+    @trace
     def query_config(self) -> None:
         """
         Ask device for all current configurations.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("get_config"))
-        self._logger.debug("done")
 
+    @trace
     def query_stim_dur(self) -> None:
         """
         Ask device for current stim duration value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("get_stimDur"))
-        self._logger.debug("done")
 
+    @trace
     def send_stim_dur(self, val: str) -> None:
         """
         Send new value to device.
         :param val: The new value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("set_stimDur", str(val)))
-        self._logger.debug("done")
 
+    @trace
     def query_stim_intesity(self) -> None:
         """
         Ask device for current stim intensity value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("get_intensity"))
-        self._logger.debug("done")
 
+    @trace
     def send_stim_intensity(self, val: int) -> None:
         """
         Send new value to device.
         :param val: The new value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("set_intensity", str(self.calc_percent_to_val(val))))
-        self._logger.debug("done")
 
+    @trace
     def query_upper_isi(self) -> None:
         """
         Ask device for current upper isi value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("get_upperISI"))
-        self._logger.debug("done")
 
+    @trace
     def send_upper_isi(self, val: str) -> None:
         """
         Send new value to device.
         :param val: The new value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("set_upperISI", str(val)))
-        self._logger.debug("done")
 
+    @trace
     def query_lower_isi(self) -> None:
         """
         Ask device for current lower isi value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("get_lowerISI"))
-        self._logger.debug("done")
 
+    @trace
     def send_lower_isi(self, val: str) -> None:
         """
         Send new value to device.
         :param val: The new value.
         :return: None.
         """
-        self._logger.debug("running")
         self.send_msg(self._prepare_msg("set_lowerISI", str(val)))
-        self._logger.debug("done")
 
+    @trace
     def send_start(self) -> None:
         """
         Tell device to start running experiment.
         :return: None.
         """
-        self._logger.debug("running")
-        self.send_msg(self._prepare_msg("exp_start"))
-        self._logger.debug("done")
+        if self._conn.is_open:
+            self._conn.write(self._start_cmd)
 
+    @trace
     def send_stop(self) -> None:
         """
         Tel device to stop running experiment.
         :return: None.
         """
-        self._logger.debug("running")
-        self.send_msg(self._prepare_msg("exp_stop"))
-        self._logger.debug("done")
+        if self._conn.is_open:
+            self._conn.write(self._stop_cmd)
+
+    def get_start_cmd(self) -> bytes:
+        """
+        :return bytes: The encoded command that starts an experiment on the device.
+        """
+        return self._start_cmd
 
+    def get_stop_cmd(self) -> bytes:
+        """
+        :return bytes: The encoded command that stops an experiment on the device.
+        """
+        return self._stop_cmd
+
+    @trace
     def check_stim_dur_entry(self, entry: str) -> bool:
         """
         Check user input for validity.
         :param entry: The user input.
         :return: validity.
         """
-        self._logger.debug("running with entry: " + entry)
         ret = False
         if entry.isdigit():
             val = int(entry)
@@ -278,9 +323,9 @@ class DRTModel:
                 self._changed[0] = changed
                 ret = True
         self._errs[0] = not ret
-        self._logger.debug("done with: " + str(ret))
         return ret
 
+    @trace
     def check_stim_int_entry(self, entry: int) -> bool:
         """
         Check user input for validity.
@@ -288,7 +333,6 @@ class DRTModel:
         :return: validity.
         """
         ret = False
-        self._logger.debug("running with entry: " + str(entry))
         val = self.calc_percent_to_val(int(entry))
         if defs.intensity_max >= val >= defs.intensity_min:
             if val == self._current_vals[1]:
@@ -296,12 +340,11 @@ class DRTModel:
             else:
                 changed = True
             self._changed[1] = changed
-            self._logger.debug("done with true")
             ret = True
         self._errs[1] = not ret
-        self._logger.debug("done with: " + str(ret))
         return ret
 
+    @trace
     def check_upper_isi_entry(self, upper_entry: str, lower_entry: str) -> bool:
         """
         Check user input for validity.
@@ -309,7 +352,6 @@ class DRTModel:
         :param lower_entry: The current input for lower_isi.
         :return: validity.
         """
-        self._logger.debug("running with upper: " + upper_entry + ", and lower: " + lower_entry)
         ret = False
         if upper_entry.isdigit() and lower_entry.isdigit():
             upper_val = int(upper_entry)
@@ -322,9 +364,9 @@ class DRTModel:
                 self._changed[2] = changed
                 ret = True
         self._errs[2] = not ret
-        self._logger.debug("done with: " + str(ret))
         return ret
 
+    @trace
     def check_lower_isi_entry(self, upper_entry: str, lower_entry: str) -> bool:
         """
         Check user input for validity.
@@ -332,7 +374,6 @@ class DRTModel:
         :param lower_entry: The user input.
         :return: validity.
         """
-        self._logger.debug("running with upper: " + upper_entry + ", and lower: " + lower_entry)
         ret = False
         if upper_entry.isdigit() and lower_entry.isdigit():
             upper_val = int(upper_entry)
@@ -345,7 +386,6 @@ class DRTModel:
                 self._changed[3] = changed
                 ret = True
         self._errs[3] = not ret
-        self._logger.debug("done with: " + str(ret))
         return ret
 
     def check_current_input(self) -> bool:
@@ -362,26 +402,49 @@ class DRTModel:
                 ret = False
         return ret
 
-    def save_data(self, data: dict, timestamp: datetime) -> None:
+    @trace
+    def save_data(self, data: dict, timestamp: datetime, msg_trace: MessageTrace = None) -> None:
         """
         Save data to output file.
+        :param data: The values from the device.
+        :param timestamp: When the values were received.
+        :param msg_trace: The message's pipeline trace, if it is being traced.
         :return: None
         """
-        self._logger.debug("running")
-        self._output_save_data(self._format_save_data(data, timestamp))
-        self._logger.debug("done")
+        self._output_save_data(self._format_save_data(data, timestamp), msg_trace)
 
     def send_msg(self, msg):
         if self._conn.is_open:
+            cmd = msg.split()[0] if msg.strip() else ""
+            if cmd.startswith(("get_", "set_")):
+                self._pending_replies.setdefault(cmd[4:], deque(maxlen=reply_backlog)).append(
+                    (perf_counter(), cmd.startswith("get_")))
             self._conn.write(str.encode(msg))
 
-    def _output_save_data(self, line: str) -> None:
+    def _output_save_data(self, line: str, msg_trace: MessageTrace = None) -> None:
         """
         Write data to save file.
         :param line: The data to write.
+        :param msg_trace: The message's pipeline trace, if it is being traced.
+        :return: None.
+        """
+        if msg_trace is None:
+            get_supervisor().spawn(TaskKind.SAVE, write_line_to_file, self._save_dir + self._save_filename, line)
+            return
+        get_supervisor().spawn(TaskKind.SAVE, self._write_traced, self._save_dir + self._save_filename, line, msg_trace)
+        msg_trace.mark(Stage.SAVE_QUEUED)
+
+    @staticmethod
+    async def _write_traced(filename: str, line: str, msg_trace: MessageTrace) -> None:
+        """
+        Write a line to file then mark its message as on disk.
+        :param filename: The file to write to.
+        :param line: The data to write.
+        :param msg_trace: The message's pipeline trace.
         :return: None.
         """
-        create_task(write_line_to_file(self._save_dir + self._save_filename, line))
+        await write_line_to_file(filename, line)
+        msg_trace.mark(Stage.ON_DISK)
 
     @staticmethod
     def _parse_msg(msg_string: str) -> dict:
@@ -23,108 +23,97 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
-from asyncio import create_task, sleep
-from datetime import datetime, timedelta
+from logging import getLogger
+from Devices.AbstractDevice.Model.time_series_buffer import TimeSeriesBuffer, to_epoch
 from Devices.AbstractDevice.View.base_graph import BaseGraph
+from Devices.DRT.Model import drt_defs as defs
 from Devices.DRT.Resources.drt_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
+from Model.pipeline_trace import MessageTrace
 
 
 class DRTGraph(BaseGraph):
-    def __init__(self, parent, dev_name: str, log_handlers: [StreamHandler]):
+    def __init__(self, parent, dev_name: str, backend: str = None):
+        """
+        :param parent: The parent widget.
+        :param dev_name: The device this graph shows.
+        :param backend: Draw with this graph backend instead of the one picked for DRTs.
+        """
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
-        super().__init__(parent, log_handlers)
-        self._data = list()
+        if backend:
+            super().__init__(parent, backend)
+        else:
+            super().__init__(parent, defs.graph_backend, dev_type="DRT")
+        self._data = list()  # name, TimeSeriesBuffer
         self._strings = dict()
         self._dev_name = dev_name
         self._logger.debug("Initialized")
 
-    async def show(self) -> None:
+    def _refresh_subplots(self) -> None:
+        """
+        Match subplots to the current plot names and redraw.
+        :return None:
+        """
         self.set_subplots([x[0] for x in self._data])
-        await create_task(self.plot(self.get_new()))
+        self.refresh_self()
 
     def clear_graph(self) -> None:
         """
         Clear this graph of any device data.
         :return None:
         """
-        for i in range(len(self._data)):
-            self._data[i] = [self._data[i][0], [], []]
+        for data in self._data:
+            data[1].clear()
+        self.clear_vert_lines()
         self.set_new(True)
-        create_task(self.show())
+        self._refresh_subplots()
 
+    @trace
     def set_lang(self, lang: LangEnum) -> None:
         """
         Set this device graph's language.
         :param lang: The lang enum to use.
         :return None:
         """
-        self._logger.debug("running")
         super(DRTGraph, self).set_lang(lang)
         self._strings = strings[lang]
         self._change_plot_names([self._strings[StringsEnum.PLOT_NAME_RT], self._strings[StringsEnum.PLOT_NAME_CLICKS]])
-        create_task(self.show())
-        self._logger.debug("done")
+        self._refresh_subplots()
 
-    async def plot_device_data(self, axes, name) -> []:  #, show_in_legend) -> []:
-        self._logger.debug("running")
-        data = list()
+    def get_series(self, name: str) -> TimeSeriesBuffer:
+        """
+        :param name: The plot name.
+        :return TimeSeriesBuffer: The data for that plot.
+        """
         for x in self._data:
             if x[0] == name:
-                data = x
-        lines = []
-        left = datetime.now()
-        right = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        # if show_in_legend:
-        #     the_label = self._dev_name
-        # else:
-        #     the_label = "_nolegend_"
-        await sleep(.001)
-        line, = axes.plot(data[1], data[2], marker='o')  #, label=the_label)
-        await sleep(.001)
-        lines.append((self._dev_name, line))
-        if len(data[1]) > 0:
-            if right < data[1][-1]:
-                right = data[1][-1]
-            if left > data[1][0]:
-                left = data[1][0]
-        temp_left = right - timedelta(minutes=2)
-        if left < temp_left:
-            left = temp_left
-        await sleep(.001)
-        axes.set_xlim(left=left - timedelta(seconds=10), right=right + timedelta(seconds=10))
-        await sleep(.001)
-        self._logger.debug("done")
-        return lines
+                return x[1]
 
-    def add_data(self, data: []) -> None:
-        """ Ensure data comes in as type, x, y """
-        self._logger.debug("running")
+    @trace
+    def add_data(self, data: [], msg_trace: MessageTrace = None) -> None:
+        """ Ensure data comes in as type, x, y. msg_trace is the message's pipeline trace, if it is being traced. """
         self.set_new(False)
+        if msg_trace:
+            self.add_pending_trace(msg_trace)
         for item in data:
             for i in range(len(self._data)):
                 if item[0] == self._data[i][0]:
-                    self._data[i][1].append(item[1])
-                    self._data[i][2].append(item[2])
+                    self._data[i][1].append(to_epoch(item[1]), item[2])
                     break
-        create_task(self.plot())
-        self._logger.debug("done")
+        self.refresh_self()
 
     def add_empty_point(self, timestamp):
         if self.get_new():
             return
         for data in self._data:
-            data[1].append(timestamp)
-            data[2].append(None)
+            data[1].append_gap(to_epoch(timestamp))
         self.refresh_self()
 
     def _change_plot_names(self, names) -> None:
         if len(self._data) == 0:
             for name in names:
-                self._data.append([name, [], []])
+                self._data.append([name, TimeSeriesBuffer()])
         else:
             for i in range(len(names)):
                 self._data[i][0] = names[i]
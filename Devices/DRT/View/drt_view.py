@@ -24,21 +24,20 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QHBoxLayout, QLabel, QSlider, QGridLayout, QLineEdit, QVBoxLayout, QTabWidget
 from PySide2.QtCore import Qt, QSize
-from Model.app_helpers import ClickAnimationButton, EasyFrame
+from View.view_helpers import ClickAnimationButton, EasyFrame
 from Model.app_defs import tab_line_edit_compliant_style, tab_line_edit_error_style
 from Devices.DRT.Resources.drt_strings import strings, StringsEnum, LangEnum
 from Devices.AbstractDevice.View.abstract_view import AbstractView
 from Devices.AbstractDevice.View.collapsible_tab_widget import CollapsingTab
+from Model.tracer import trace
 
 
 class DRTView(AbstractView):
-    def __init__(self, name, log_handlers: [StreamHandler]):
+    def __init__(self, name):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(name)
 
@@ -125,7 +124,7 @@ class DRTView(AbstractView):
         self.dev_sets_layout.addWidget(EasyFrame(line=True))
 
         # Show/Hide Configuration tab
-        self.config_tab = CollapsingTab(self, self.dev_sets_frame, log_handlers)
+        self.config_tab = CollapsingTab(self, self.dev_sets_frame)
         self.layout().addWidget(self.config_tab, 0, 1, Qt.AlignRight)
 
         self.strings = dict()
@@ -146,45 +145,41 @@ class DRTView(AbstractView):
     def add_graph(self, graph):
         self.layout().addWidget(graph, 0, 0)
 
+    @trace
     def set_stim_dur_entry_changed_handler(self, func: classmethod) -> None:
         """
         Add handler for when user changes input value in this field.
         :param func: The handler.
         :return: None.
         """
-        self._logger.debug("running")
         self.stim_dur_line_edit.textChanged.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def set_stim_intens_entry_changed_handler(self, func: classmethod) -> None:
         """
         Add handler for when user changes input value in this field.
         :param func: The handler.
         :return: None.
         """
-        self._logger.debug("running")
         self.stim_intens_slider.valueChanged.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def set_upper_isi_entry_changed_handler(self, func: classmethod) -> None:
         """
         Add handler for when user changes input value in this field.
         :param func: The handler.
         :return: None.
         """
-        self._logger.debug("running")
         self.upper_isi_line_edit.textChanged.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def set_lower_isi_entry_changed_handler(self, func: classmethod) -> None:
         """
         Add handler for when user changes input value in this field.
         :param func: The handler.
         :return: None.
         """
-        self._logger.debug("running")
         self.lower_isi_line_edit.textChanged.connect(func)
-        self._logger.debug("done")
 
     def set_iso_button_handler(self, func: classmethod) -> None:
         """
@@ -202,15 +197,14 @@ class DRTView(AbstractView):
         """
         self.upload_settings_button.clicked.connect(func)
 
+    @trace
     def set_config_val(self, val: str) -> None:
         """
 
         :param val:
         :return:
         """
-        self._logger.debug("running")
         self.config_val.setText(val)
-        self._logger.debug("done")
 
     def get_stim_dur(self):
         """
@@ -219,28 +213,26 @@ class DRTView(AbstractView):
         """
         return self.stim_dur_line_edit.text()
 
+    @trace
     def set_stim_dur(self, val: str) -> None:
         """
         Set display value of stim duration
         :param val:
         :return:
         """
-        self._logger.debug("running")
         self.stim_dur_line_edit.setText(str(val))
-        self._logger.debug("done")
 
+    @trace
     def set_stim_dur_err(self, is_error) -> None:
         """
         Set display of error in stim duration
         :param is_error:
         :return:
         """
-        self._logger.debug("running")
         if is_error:
             self.stim_dur_line_edit.setStyleSheet(tab_line_edit_error_style)
         else:
             self.stim_dur_line_edit.setStyleSheet(tab_line_edit_compliant_style)
-        self._logger.debug("done")
 
     def get_stim_intens(self):
         """
@@ -249,25 +241,23 @@ class DRTView(AbstractView):
         """
         return self.stim_intens_slider.value()
 
+    @trace
     def set_stim_intens(self, val: int) -> None:
         """
         Set display value of stim intensity
         :param val:
         :return:
         """
-        self._logger.debug("running")
         self.stim_intens_slider.setValue(int(val))
         self.update_stim_intens_val_tooltip()
-        self._logger.debug("done")
 
+    @trace
     def update_stim_intens_val_tooltip(self) -> None:
         """
         Update slider tooltip.
         :return: None.
         """
-        self._logger.debug("running")
         self.stim_intens_slider.setToolTip(str(self.stim_intens_slider.value()) + "%")
-        self._logger.debug("done")
 
     def get_upper_isi(self):
         """
@@ -276,28 +266,26 @@ class DRTView(AbstractView):
         """
         return self.upper_isi_line_edit.text()
 
+    @trace
     def set_upper_isi(self, val: str) -> None:
         """
         Set display value of upper isi
         :param val:
         :return:
         """
-        self._logger.debug("running")
         self.upper_isi_line_edit.setText(str(val))
-        self._logger.debug("done")
 
+    @trace
     def set_upper_isi_err(self, is_error) -> None:
         """
         Set display of error in upper isi line edit
         :param is_error:
         :return:
         """
-        self._logger.debug("running")
         if is_error:
             self.upper_isi_line_edit.setStyleSheet(tab_line_edit_error_style)
         else:
             self.upper_isi_line_edit.setStyleSheet(tab_line_edit_compliant_style)
-        self._logger.debug("done")
 
     def get_lower_isi(self):
         """
@@ -306,37 +294,34 @@ class DRTView(AbstractView):
         """
         return self.lower_isi_line_edit.text()
 
+    @trace
     def set_lower_isi(self, val: str) -> None:
         """
         Set display value of lower isi
         :param val:
         :return:
         """
-        self._logger.debug("running")
         self.lower_isi_line_edit.setText(str(val))
-        self._logger.debug("done")
 
+    @trace
     def set_lower_isi_err(self, is_error) -> None:
         """
         Set display of error in lower isi line edit
         :param is_error:
         :return:
         """
-        self._logger.debug("running")
         if is_error:
             self.lower_isi_line_edit.setStyleSheet(tab_line_edit_error_style)
         else:
             self.lower_isi_line_edit.setStyleSheet(tab_line_edit_compliant_style)
-        self._logger.debug("done")
 
+    @trace
     def set_upload_button(self, is_active) -> None:
         """
 
         :return:
         """
-        self._logger.debug("running")
         self.upload_settings_button.setEnabled(is_active)
-        self._logger.debug("done")
 
     def set_lang(self, lang: LangEnum) -> None:
         """
@@ -348,8 +333,8 @@ class DRTView(AbstractView):
         self._set_texts()
         self._set_tooltips()
 
+    @trace
     def _set_texts(self):
-        self._logger.debug("running")
         self.config_label.setText(self.strings[StringsEnum.CONFIG_LABEL])
         self.config_val.setText(self.strings[StringsEnum.ISO_LABEL])
         self.iso_button.setText(self.strings[StringsEnum.ISO_BUTTON_LABEL])
@@ -359,10 +344,9 @@ class DRTView(AbstractView):
         self.lower_isi_label.setText(self.strings[StringsEnum.LOWER_ISI_LABEL])
         self.upload_settings_button.setText(self.strings[StringsEnum.UPLOAD_BUTTON_LABEL])
         self.config_tab.set_tab_text(self.strings[StringsEnum.CONFIG_TAB_LABEL])
-        self._logger.debug("done")
 
+    @trace
     def _set_tooltips(self):
-        self._logger.debug("running")
         self.config_label.setToolTip(self.strings[StringsEnum.CONFIG_LABEL_TOOLTIP])
         self.iso_button.setToolTip(self.strings[StringsEnum.ISO_BUTTON_TOOLTIP])
         self.upper_isi_label.setToolTip(self.strings[StringsEnum.UPPER_ISI_TOOLTIP])
@@ -371,4 +355,3 @@ class DRTView(AbstractView):
         self.stim_intens_label.setToolTip(self.strings[StringsEnum.INTENSITY_TOOLTIP])
         self.upload_settings_button.setToolTip(self.strings[StringsEnum.UPLOAD_BUTTON_TOOLTIP])
         self.stim_intens_slider.setToolTip(str(self.stim_intens_slider.value()) + "%")
-        self._logger.debug("done")
@@ -24,7 +24,6 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from cv2 import VideoWriter_fourcc, CAP_DSHOW
 from enum import Enum, auto
 
 
@@ -36,6 +35,14 @@ from enum import Enum, auto
 
 version_url = "https://raw.githubusercontent.com/redscientific/CompanionApp/master/Version.txt"
 log_format = '%(levelname)s - %(name)s - %(funcName)s: %(message)s'
+pending_saves_filename = "companion_pending_saves.json"
+version_cache_filename = "companion_version_cache.json"
+# How long in seconds a fetched version number is trusted before the site is asked again.
+version_cache_ttl = 24 * 60 * 60
+# Longest time in seconds a version check may take.
+version_check_timeout = 5
+# Longest time in seconds app closure will wait for experiment data to be saved.
+shutdown_save_timeout = 60
 # TODO: Switch image_file_path for build
 image_file_path = '../asyncCompanion/Resources/Images/'
 # image_file_path = 'Images/'
@@ -0,0 +1,132 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import logging
+from queue import SimpleQueue
+from threading import Lock
+from asyncio import sleep
+from logging.handlers import QueueHandler, QueueListener
+
+# How often batched log records are handed to the ui, in seconds.
+ui_flush_interval = 0.1
+
+
+class _BatchHandler(logging.Handler):
+    """ Collects (level, logger name, formatted message) on the listener thread until the ui takes them. """
+    def __init__(self):
+        super().__init__()
+        self._batch = list()
+        self._batch_lock = Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = (record.levelno, record.name, self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        with self._batch_lock:
+            self._batch.append(entry)
+
+    def take(self) -> [tuple]:
+        """
+        :return list: All records collected since the last call.
+        """
+        with self._batch_lock:
+            batch = self._batch
+            self._batch = list()
+        return batch
+
+
+class LogPipeline:
+    """
+    App wide logging. Every logger propagates to a single queue handler on the root logger. A listener thread takes
+    records off the queue and writes them to the log file, to stderr for warnings and up, and into a batch for the
+    ui. Loggers never need handlers of their own.
+    """
+    def __init__(self, log_file: str, level, log_format: str, stderr_level=logging.WARNING, ui: bool = True):
+        """
+        Set up the root logger. Handlers already on the root logger are removed.
+        :param log_file: The file to append the log to.
+        :param level: The lowest level to record.
+        :param log_format: The format used for every handler.
+        :param stderr_level: The lowest level also written to stderr.
+        :param ui: Whether records are batched for a ui. Without a ui nothing would ever take the batches.
+        """
+        formatter = logging.Formatter(log_format)
+        self._file_handler = logging.FileHandler(log_file, mode="a")
+        self._file_handler.setFormatter(formatter)
+        self._stderr_handler = logging.StreamHandler()
+        self._stderr_handler.setLevel(stderr_level)
+        self._stderr_handler.setFormatter(formatter)
+        self._ui_handler = _BatchHandler()
+        self._ui_handler.setFormatter(formatter)
+        self._queue = SimpleQueue()
+        handlers = [self._file_handler, self._stderr_handler]
+        if ui:
+            handlers.append(self._ui_handler)
+        self._listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(QueueHandler(self._queue))
+        root.setLevel(level)
+        self._ui_writer = None
+        self._listener.start()
+
+    def set_ui_writer(self, writer) -> None:
+        """
+        Set where batched records for the ui go.
+        :param writer: Callable taking a list of (level, logger name, formatted message). Called on the event loop
+        thread.
+        :return None:
+        """
+        self._ui_writer = writer
+
+    def flush_ui(self) -> None:
+        """
+        Hand all waiting records to the ui writer in one call.
+        :return None:
+        """
+        batch = self._ui_handler.take()
+        if batch and self._ui_writer:
+            self._ui_writer(batch)
+
+    async def run_ui_flush(self) -> None:
+        """
+        Flush records to the ui every ui_flush_interval seconds.
+        :return None:
+        """
+        while True:
+            await sleep(ui_flush_interval)
+            self.flush_ui()
+
+    def stop(self) -> None:
+        """
+        Write out everything still queued and stop the listener thread.
+        :return None:
+        """
+        self._listener.stop()
+        self.flush_ui()
+        self._file_handler.close()
@@ -26,68 +26,92 @@ https://redscientific.com/index.html
 
 import os
 import glob
+import json
 import importlib.util
 import zipfile
 import tempfile
-from logging import StreamHandler, getLogger
+from shutil import rmtree
+from threading import Event
+from logging import getLogger
 from datetime import datetime
-from asyncio import Event, create_task, futures, get_running_loop
+from asyncio import Queue, Task, get_running_loop, sleep
+from time import perf_counter
 from aioserial import AioSerial
+from serial.tools.list_ports_common import ListPortInfo
 from Model.rs_device_com_scanner import RSDeviceCommScanner
-from Model.app_defs import LangEnum
-from Model.app_helpers import await_event, end_tasks, write_line_to_file, format_current_time
+from Model.app_defs import LangEnum, pending_saves_filename
+from Model.app_helpers import write_line_to_file, format_current_time
+from Model.event_bus import EventBus, EventTopic
+from Model.task_supervisor import get_supervisor, TaskKind
 from Model.version_checker import VersionChecker
-from Devices.AbstractDevice.View.abstract_view import AbstractView
+from Model.lifecycle_timer import get_lifecycle_timer, TimingPhase
+from Model.exp_coordinator import ExpCoordinator, get_skew
+from Model.loop_monitor import get_loop_monitor
+from Model.metrics import get_metrics
+from Model.tracer import trace
 
 
 class AppModel:
-    def __init__(self, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, lang: LangEnum, headless: bool = False):
+        """
+        :param lang: The language new devices are initialized with.
+        :param headless: Use each device's Recorder, which has no view, instead of its Controller.
+        """
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
-        self._controllers = self.get_controllers()
-        self._scanner = RSDeviceCommScanner(self.get_profiles(), log_handlers)
-        self._ver_check = VersionChecker(log_handlers)
-        self._log_handlers = log_handlers
-        self._new_dev_view_flag = Event()
-        self._remove_dev_view_flag = Event()
+        self._headless = headless
+        self._controllers = self.get_controllers(headless)
+        self._controller_classes = dict()
+        self._bus = EventBus()
+        self._connect_queue = self._bus.subscribe(EventTopic.DEVICE_CONNECTED)
+        self._disconnect_queue = self._bus.subscribe(EventTopic.DEVICE_LOST)
+        self._scanner = RSDeviceCommScanner(self.get_profiles(), self._bus)
+        self._ver_check = VersionChecker()
+        self._coordinator = ExpCoordinator()
         self._current_lang = lang
         self._temp_folder = None
         self._save_path = str()
         self._devs = dict()
         self._dev_inits = dict()
-        self._new_dev_views = []
-        self._remove_dev_views = []
         self._gatherable_tasks = []
         self._cancelable_tasks = []
         self._note_filename = "notes.csv"
         self._flag_filename = "flags.csv"
+        self._metadata_filename = "metadata.csv"
+        self._loop_lag_filename = "loop_lag.csv"
+        self._metrics_filename = "metrics.json"
+        self._save_metrics = True
+        get_metrics().gauge("save_queue_depth", "Experiment file writes waiting or running.").set_function(
+            lambda: get_supervisor().get_count(TaskKind.SAVE))
+        self._pending_saves_file = os.path.join(tempfile.gettempdir(), pending_saves_filename)
+        self._cancel_save = Event()
+        self._save_interrupted = False
+        self._save_progress = (0, 0)
         self.exp_created = False
         self.exp_running = False
-        self.saving = False
         self._logger.debug("Initialized")
 
-    def await_new_view(self) -> futures:
+    def set_save_metrics(self, save: bool) -> None:
         """
-        Signal when there is a new view event.
-        :return futures: If the flag is set.
+        Set whether a snapshot of the app's metrics is saved with each experiment.
+        :param save: Whether to save metrics.
+        :return None:
         """
-        return await_event(self._new_dev_view_flag)
+        self._save_metrics = save
 
-    def await_remove_view(self) -> futures:
+    def get_event_bus(self) -> EventBus:
         """
-        Signal when there is a remove view event.
-        :return futures: If the flag is set.
+        :return EventBus: The bus device and view events are published on.
         """
-        return await_event(self._remove_dev_view_flag)
+        return self._bus
 
-    def await_dev_con_err(self) -> futures:
+    def subscribe(self, topic: EventTopic) -> Queue:
         """
-        Signal when there is a remove view event.
-        :return futures: If the flag is set.
+        Listen for events from this model.
+        :param topic: The topic to listen to.
+        :return Queue: The queue events will be put in.
         """
-        return self._scanner.await_err()
+        return self._bus.subscribe(topic)
 
     def change_lang(self, lang: LangEnum) -> None:
         """
@@ -107,30 +131,34 @@ class AppModel:
         for controller in self._devs.values():
             controller.set_lang(lang)
 
-    def check_version(self) -> int:
+    async def check_version(self) -> int:
         """
-
-        :return bool: 1: update available, 0: up to date, -1: error checking.
+        Ask the site for the latest version, skipping the cache since the user asked.
+        :return int: 1: update available, 0: up to date, -1: error checking.
         """
+        await self._ver_check.update(use_cache=False)
         return self._ver_check.check_version()
 
-    def get_next_new_view(self) -> (bool, AbstractView):
+    @trace
+    async def _check_version_at_start(self) -> None:
         """
-        Return the next new view if there is one.
-        :return bool, AbstractView: If there is an element to return, The next element to return.
+        Check for a newer version in the background. Uses the cached result on most launches.
+        :return None:
         """
-        if len(self._new_dev_views) > 0:
-            return True, self._new_dev_views.pop(0)
-        return False, None
+        await self._ver_check.update()
+        if self._ver_check.check_version() == 1:
+            self._logger.info("newer version available: " + str(self._ver_check.latest_version))
 
-    def get_next_view_to_remove(self) -> (bool, AbstractView):
+    def view_shown(self, view) -> None:
         """
-        Return the next view to remove if there is one.
-        :return bool, AbstractView: If there is an element to return, The next element to return.
+        Record that a device view has been added to the display.
+        :param view: The view that is now shown.
+        :return None:
         """
-        if len(self._remove_dev_views) > 0:
-            return True, self._remove_dev_views.pop(0)
-        return False, None
+        for port, controller in self._devs.items():
+            if controller.get_view() is view:
+                get_lifecycle_timer().stop(port, TimingPhase.VIEW_CREATION)
+                return
 
     def save_note(self, note: str) -> None:
         """
@@ -139,10 +167,10 @@ class AppModel:
         :return None:
         """
         if self.exp_created:
-            print(__name__, "Got note:", note, " Saving note to:", self._temp_folder.name + self._note_filename)
             timestamp = format_current_time(datetime.now(), True, True, True)
             line = timestamp + ", " + note
-            create_task(write_line_to_file(self._temp_folder.name + "/" + self._note_filename, line))
+            get_supervisor().spawn(TaskKind.SAVE, write_line_to_file, self._temp_folder + "/" + self._note_filename,
+                                   line)
 
     def save_flag(self, flag: str) -> None:
         """
@@ -151,87 +179,168 @@ class AppModel:
         :return None:
         """
         if self.exp_created:
-            timestamp = format_current_time(datetime.now(), True, True, True)
+            now = datetime.now()
+            for controller in self._devs.values():
+                controller.add_marker(now)
+            timestamp = format_current_time(now, True, True, True)
             line = timestamp + ", " + flag
-            create_task(write_line_to_file(self._temp_folder.name + "/" + self._flag_filename, line))
+            get_supervisor().spawn(TaskKind.SAVE, write_line_to_file, self._temp_folder + "/" + self._flag_filename,
+                                   line)
 
+    @trace
     def signal_create_exp(self, path: str) -> None:
         """
         Call create_exp on all device controllers.
         :param path: The save dir for this experiment.
         :return bool: If there was an error.
         """
-        self._logger.debug("running")
         devices_running = list()
-        self._temp_folder = tempfile.TemporaryDirectory()
+        self._temp_folder = tempfile.mkdtemp()
         self._save_path = path
         try:
             for controller in self._devs.values():
-                controller.create_exp(self._temp_folder.name + "/")
+                controller.create_exp(self._temp_folder + "/")
                 devices_running.append(controller)
-            self._logger.debug("done")
             self.exp_created = True
+            get_loop_monitor().reset()
+            get_supervisor().spawn(TaskKind.SAVE, write_line_to_file,
+                                   self._temp_folder + "/" + self._metadata_filename,
+                                   "timestamp, event, skew (ms), device offsets (ms)")
         except Exception as e:
             self._logger.exception("Failed creating exp on a controller.")
             for controller in devices_running:
                 controller.end_exp()
-            self._temp_folder.cleanup()
+            rmtree(self._temp_folder, ignore_errors=True)
             self.exp_created = False
 
+    @trace
     def signal_end_exp(self, save: bool = True) -> None:
         """
         Call end exp on all device controllers.
         :return bool: If there was an error.
         """
-        self._logger.debug("running")
+        if not self.exp_created:
+            return
         try:
             for controller in self._devs.values():
                 controller.end_exp()
-            self._logger.debug("done")
-            create_task(self._save_exp(save))
+            get_supervisor().spawn(TaskKind.SAVE, write_line_to_file,
+                                   self._temp_folder + "/" + self._loop_lag_filename, get_loop_monitor().get_report(),
+                                   True)
+            if self._save_metrics:
+                get_supervisor().spawn(TaskKind.SAVE, write_line_to_file,
+                                       self._temp_folder + "/" + self._metrics_filename, get_metrics().to_json(), True)
+            # Saves run one at a time in the order spawned, so once this finishes every line above is written.
+            lines_written = get_supervisor().spawn(TaskKind.SAVE, sleep, 0)
+            if save:
+                self._cancel_save.clear()  # An earlier "Quit now" only applies to the saves it interrupted.
+            get_supervisor().spawn(TaskKind.PACKAGE, self._save_exp, self._temp_folder, self._save_path, save,
+                                   lines_written)
         except Exception as e:
             self._logger.exception("Failed ending exp on a controller.")
         self.exp_running = False
+        self.exp_created = False  # The temp folder now belongs to the package task.
+        self._temp_folder = None
 
+    @trace
     def signal_start_exp(self) -> None:
         """
-        Starts an experiment.
-        :return bool: Return false if an experiment failed to start, otherwise return true.
+        Starts an experiment. Every device is prepared first then all are started at once.
+        :return None:
         """
-        self._logger.debug("running")
-        devices = list()
         try:
-            for controller in self._devs.values():
-                controller.start_exp()
-                devices.append(controller)
-                self.exp_running = True
+            to_send, no_cmd = self._coordinator.prepare(list(self._devs.values()), True)
         except Exception as e:
-            self._logger.exception("Failed trying to start exp on controller.")
-            for controller in devices:
-                controller.end_exp()
-                self.exp_running = False
+            self._logger.exception("Failed preparing controllers to start exp.")
+            return
+        self.exp_running = True
+        get_supervisor().spawn(TaskKind.EXP, self._send_lifecycle, to_send, no_cmd, True, self._temp_folder)
 
+    @trace
     def signal_stop_exp(self) -> None:
         """
-        Stops an experiment.
-        :return bool: Return false if an experiment failed to stop, otherwise return true.
+        Stops an experiment. Every device is prepared first then all are stopped at once.
+        :return None:
         """
-        self._logger.debug("running")
         try:
-            for controller in self._devs.values():
-                controller.stop_exp()
+            to_send, no_cmd = self._coordinator.prepare(list(self._devs.values()), False)
+            get_supervisor().spawn(TaskKind.EXP, self._send_lifecycle, to_send, no_cmd, False, self._temp_folder)
         except Exception as e:
-            self._logger.exception("Failed trying to stop exp on controller")
+            self._logger.exception("Failed preparing controllers to stop exp.")
         self.exp_running = False
 
+    async def _send_lifecycle(self, to_send: list, no_cmd: list, start: bool, temp_folder: str) -> None:
+        """
+        Send prepared start or stop commands to all devices together and record how far apart they arrived. If any
+        device does not take its start command the start is undone.
+        :param to_send: Controllers with their prepared commands.
+        :param no_cmd: Controllers that handle start and stop themselves.
+        :param start: True if starting, False if stopping.
+        :param temp_folder: The folder of the experiment being started or stopped.
+        :return None:
+        """
+        offsets = await self._coordinator.send(to_send)
+        # Taken after the send so it is never earlier than data or flags that arrived during it. Graph buffers
+        # need their times in order.
+        timestamp = datetime.now()
+        failed = [controller.get_conn().port for controller, cmd in to_send
+                  if controller.get_conn().port not in offsets]
+        if start and failed:
+            await self._undo_start(to_send, offsets, failed)
+            return
+        for controller, cmd in to_send:
+            if controller.get_conn().port not in offsets:
+                self._logger.error("Could not stop " + controller.get_conn().port)
+                continue
+            try:
+                if start:
+                    controller.exp_started(timestamp)
+                else:
+                    controller.exp_stopped(timestamp)
+            except Exception as e:
+                self._logger.exception("Failed updating controller after exp start or stop.")
+        for controller in no_cmd:
+            try:
+                if start:
+                    controller.start_exp()
+                else:
+                    controller.stop_exp()
+            except Exception as e:
+                self._logger.exception("Failed trying to start or stop exp on controller.")
+        event = "start" if start else "stop"
+        skew = round(get_skew(offsets) * 1000, 3)
+        self._logger.info("Exp " + event + " skew across " + str(len(offsets)) + " devices: " + str(skew) + " ms")
+        if temp_folder:
+            line = format_current_time(timestamp, True, True, True) + ", " + event + ", " + str(skew) + ", " \
+                + " ".join([port + "=" + str(round(offsets[port] * 1000, 3)) for port in offsets])
+            await write_line_to_file(temp_folder + "/" + self._metadata_filename, line)
+
+    async def _undo_start(self, to_send: list, offsets: dict, failed: list) -> None:
+        """
+        Stop the devices that did start when others could not be, so no device records on its own.
+        :param to_send: Controllers with their prepared start commands.
+        :param offsets: The ports that accepted their start command.
+        :param failed: The ports that did not.
+        :return None:
+        """
+        self._logger.error("Could not start " + ", ".join(failed) + ". Stopping the other devices.")
+        self.exp_running = False
+        started = [controller for controller, cmd in to_send if controller.get_conn().port in offsets]
+        try:
+            stop_sends, no_cmd = self._coordinator.prepare(started, False)
+            await self._coordinator.send(stop_sends)
+        except Exception as e:
+            self._logger.exception("Failed stopping controllers after a failed exp start.")
+        await self._bus.publish(EventTopic.EXP_START_ERR, failed)
+
     async def _await_new_devs(self) -> None:
         """
         Wait for and handle new devices.
         :return None:
         """
         while True:
-            await self._scanner.await_connect()
-            self._setup_new_devices()
+            dev_type, connection = await self._connect_queue.get()
+            await self._make_device(dev_type, connection)
 
     async def _await_remove_devs(self) -> None:
         """
@@ -239,37 +348,125 @@ class AppModel:
         :return None:
         """
         while True:
-            await self._scanner.await_disconnect()
-            self._remove_lost_devices()
+            port = await self._disconnect_queue.get()
+            await self._remove_lost_device(port)
 
-    async def _save_exp(self, save: bool) -> None:
+    async def _save_exp(self, temp_folder: str, save_path: str, save: bool, lines_written: Task = None) -> None:
         """
-        Save the latest exp and cleanup temp folder.
+        Save an exp and cleanup its temp folder.
+        :param temp_folder: The folder the exp data was written to.
+        :param save_path: The .rs file to save to.
         :param save: Should experiment data be saved.
+        :param lines_written: A SAVE task that finishes once the exp's queued lines are written.
         :return None:
         """
-        if save:
-            self.saving = True
-            await get_running_loop().run_in_executor(None, self._convert_to_rs_file)
-            self.saving = False
-        self._temp_folder.cleanup()
+        await get_supervisor().drain(TaskKind.EXP, None)
+        if lines_written:
+            await lines_written
+        if not save:
+            rmtree(temp_folder, ignore_errors=True)
+            return
+        self._add_pending_save(temp_folder, save_path)
+        finished = await get_running_loop().run_in_executor(None, self._convert_to_rs_file, temp_folder, save_path)
+        if finished:
+            self._remove_pending_save(temp_folder)
+            rmtree(temp_folder, ignore_errors=True)
+        else:
+            self._save_interrupted = True
+            self._logger.warning("Saving " + save_path + " was interrupted. It will be finished on next start.")
 
     # TODO: Look into async implementation. https://pypi.org/project/aiofile/
-    def _convert_to_rs_file(self) -> None:
+    def _convert_to_rs_file(self, temp_folder: str, save_path: str) -> bool:
+        """
+        Transfer experiment data to .rs file. Data is written to a partial file that replaces save_path only once
+        every file has been added. Runs in an executor so stops between files if asked to.
+        :param temp_folder: The folder the exp data was written to.
+        :param save_path: The .rs file to save to.
+        :return bool: True if the .rs file was finished.
+        """
+        files = os.listdir(temp_folder)
+        self._save_progress = (0, len(files))
+        part_path = save_path + ".part"
+        cancelled = False
+        with zipfile.ZipFile(part_path, "w") as zipper:
+            for i in range(len(files)):
+                if self._cancel_save.is_set():
+                    cancelled = True
+                    break
+                zipper.write(temp_folder + "/" + files[i], files[i])
+                self._save_progress = (i + 1, len(files))
+        if cancelled:
+            os.remove(part_path)
+            return False
+        os.replace(part_path, save_path)
+        return True
+
+    def _read_pending_saves(self) -> dict:
+        """
+        :return dict: Temp folders that still need to be saved and the .rs file each should be saved to.
+        """
+        if not os.path.exists(self._pending_saves_file):
+            return dict()
+        try:
+            with open(self._pending_saves_file, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            self._logger.exception("Could not read pending saves.")
+            return dict()
+
+    def _write_pending_saves(self, pending: dict) -> None:
+        """
+        Record which temp folders still need to be saved.
+        :param pending: Temp folder to .rs file mapping.
+        :return None:
         """
-        Transfer latest experiment data to .rs file.
+        if len(pending) == 0:
+            if os.path.exists(self._pending_saves_file):
+                os.remove(self._pending_saves_file)
+            return
+        with open(self._pending_saves_file, "w") as file:
+            json.dump(pending, file)
+
+    def _add_pending_save(self, temp_folder: str, save_path: str) -> None:
+        """
+        Record that temp_folder is being saved to save_path so it can be finished later if the app is closed.
+        :param temp_folder: The folder the exp data was written to.
+        :param save_path: The .rs file to save to.
+        :return None:
+        """
+        pending = self._read_pending_saves()
+        pending[temp_folder] = save_path
+        self._write_pending_saves(pending)
+
+    def _remove_pending_save(self, temp_folder: str) -> None:
+        """
+        Record that temp_folder has been saved.
+        :param temp_folder: The folder the exp data was written to.
         :return None:
         """
-        with zipfile.ZipFile(self._save_path, "w") as zipper:
-            for file in os.listdir(self._temp_folder.name):
-                zipper.write(self._temp_folder.name + "/" + file, file)
+        pending = self._read_pending_saves()
+        pending.pop(temp_folder, None)
+        self._write_pending_saves(pending)
 
+    def _resume_pending_saves(self) -> None:
+        """
+        Finish saving any experiment that was interrupted when the app last closed.
+        :return None:
+        """
+        pending = self._read_pending_saves()
+        for temp_folder in list(pending.keys()):
+            if os.path.isdir(temp_folder):
+                self._logger.info("Resuming save of " + pending[temp_folder])
+                get_supervisor().spawn(TaskKind.PACKAGE, self._save_exp, temp_folder, pending[temp_folder], True)
+            else:
+                self._remove_pending_save(temp_folder)
+
+    @trace
     def _signal_lang_change(self) -> bool:
         """
         Change language each device is using.
         :return None:
         """
-        self._logger.debug("running")
         try:
             for controller in self._devs.values():
                 controller.set_lang(self._current_lang)
@@ -278,96 +475,117 @@ class AppModel:
             self._logger.exception("Failed trying to stop exp on controller")
             return False
 
-    def _make_device(self, dev_type: str, conn: AioSerial) -> None:
+    @trace
+    async def _make_device(self, dev_type: str, conn: AioSerial) -> None:
         """
         Make new controller for dev_type.
         :param dev_type: The type of device.
         :param conn: The device connection.
         :return None:
         """
-        self._logger.debug("running")
         if dev_type not in self._controllers.keys():
             self._logger.warning("Could not recognize device type")
             return
-        ret = self._make_controller(conn, dev_type)
+        ret = await self._make_controller(conn, dev_type)
         if not ret:
             self._logger.warning("Failed making controller for type: " + dev_type)
             return
-        self._logger.debug("done")
 
-    def _make_controller(self, conn: AioSerial, dev_type) -> bool:
+    @trace
+    async def _make_controller(self, conn: AioSerial, dev_type) -> bool:
         """
         Create controller of type dev_type
         :param conn:
         :param dev_type:
         :return:
         """
-        self._logger.debug("running")
         ret = True
+        timer = get_lifecycle_timer()
         try:
-            controller = self._controllers[dev_type](conn, self._current_lang, self._log_handlers)
+            timer.start(conn.port, TimingPhase.CONTROLLER_INIT)
+            controller = self._get_controller_class(dev_type)(conn, self._current_lang)
+            timer.stop(conn.port, TimingPhase.CONTROLLER_INIT)
+            controller.set_event_bus(self._bus)
             self._devs[conn.port] = controller
-            self._new_dev_views.append(controller.get_view())
-            self._new_dev_view_flag.set()
+            if not self._headless:
+                timer.start(conn.port, TimingPhase.VIEW_CREATION)
+                await self._bus.publish(EventTopic.VIEW_ADD, controller.get_view())  # Never dropped.
         except Exception as e:
             self._logger.exception("Problem making controller")
             ret = False
-        self._logger.debug("done")
         return ret
 
-    def _setup_new_devices(self):
+    @trace
+    async def _remove_lost_device(self, port: ListPortInfo) -> None:
         """
-        Get new device info from new device queue and make new device.
+        Destroy the controller for a lost device and signal view removal.
+        :param port: The port that was lost.
         :return: None.
         """
-        self._logger.debug("running")
-        ret, item = self._scanner.get_next_new_com()
-        while ret:
-            dev_type, connection = item[0], item[1]
-            self._make_device(dev_type, connection)
-            ret, item = self._scanner.get_next_new_com()
-        self._logger.debug("done")
+        for key in self._devs:
+            if self._devs[key].get_conn().port == port.device:
+                controller = self._devs.pop(key)
+                controller.cleanup()
+                if not self._headless:
+                    await self._bus.publish(EventTopic.VIEW_REMOVE, controller.get_view())  # Never dropped.
+                break
 
-    def _remove_lost_devices(self):
+    @trace
+    def start(self):
+        supervisor = get_supervisor()
+        self._gatherable_tasks.append(supervisor.spawn(TaskKind.LOOP, self._await_new_devs))
+        self._gatherable_tasks.append(supervisor.spawn(TaskKind.LOOP, self._await_remove_devs))
+        self._scanner.start()
+        self._resume_pending_saves()
+        supervisor.spawn(TaskKind.NET, self._check_version_at_start, key="version check")
+
+    def is_saving(self) -> bool:
         """
-        For any lost device, destroy controller and signal view removal to controller.
-        :return: None.
+        :return bool: Whether there is experiment data still being written or saved.
         """
-        self._logger.debug("running")
-        ret, item = self._scanner.get_next_lost_com()
-        to_remove = []
-        while ret:
-            for key in self._devs:
-                if self._devs[key].get_conn().port == item.device:
-                    self._remove_dev_views.append(self._devs[key].get_view())
-                    self._devs[key].cleanup()
-                    to_remove.append(key)
-                    self._remove_dev_view_flag.set()
-                    break
-            ret, item = self._scanner.get_next_lost_com()
-        if len(to_remove) > 0:
-            for ele in to_remove:
-                del self._devs[ele]
-        self._logger.debug("done")
+        supervisor = get_supervisor()
+        return supervisor.get_count(TaskKind.SAVE) + supervisor.get_count(TaskKind.PACKAGE) > 0
 
-    def start(self):
-        self._logger.debug("running")
-        self._gatherable_tasks.append(create_task(self._await_new_devs()))
-        self._gatherable_tasks.append(create_task(self._await_remove_devs()))
-        self._scanner.start()
-        self._logger.debug("done")
+    def get_device_count(self) -> int:
+        """
+        :return int: How many devices are connected and set up.
+        """
+        return len(self._devs)
 
-    def cleanup(self):
-        self._logger.debug("running")
+    def get_save_progress(self) -> (int, int):
+        """
+        :return (int, int): Files added to the .rs file being saved, total files to add.
+        """
+        return self._save_progress
+
+    def cancel_save(self) -> None:
+        """
+        Stop saving the current .rs file as soon as possible. It will be finished on next start.
+        :return None:
+        """
+        self._cancel_save.set()
+
+    @trace
+    async def shutdown(self, timeout: float) -> bool:
+        """
+        Stop looking for devices, wait for data to finish saving then close all devices.
+        :param timeout: The most seconds to wait for saving to finish.
+        :return bool: True if all data was saved.
+        """
         self._scanner.cleanup()
-        while self.saving:
-            continue
+        supervisor = get_supervisor()
+        start = perf_counter()
+        finished = await supervisor.drain(TaskKind.SAVE, timeout)
+        finished = finished and await supervisor.drain(TaskKind.PACKAGE, max(timeout - (perf_counter() - start), 0))
+        if not finished:
+            self.cancel_save()
+            await supervisor.drain(TaskKind.SAVE, 2)
+            await supervisor.drain(TaskKind.PACKAGE, 2)
         for dev in self._devs.values():
             dev.cleanup()
-        for task in self._cancelable_tasks:
+        for task in self._cancelable_tasks + self._gatherable_tasks:
             task.cancel()
-        create_task(end_tasks(self._gatherable_tasks))
-        self._logger.debug("done")
+        return finished and not self._save_interrupted
 
     # TODO add debugging
     @staticmethod
@@ -383,16 +601,32 @@ class AppModel:
                     profs.update(mod.profile)
         return profs
 
-    # TODO add debugging
     @staticmethod
-    def get_controllers():
+    def get_controllers(headless: bool = False) -> dict:
+        """
+        Find each device type's controller file. The files are not imported here since they pull in the device's
+        whole view and graph stack. See _get_controller_class().
+        :param headless: Find recorder files instead. Device types without one are not supported headless.
+        :return dict: Controller file paths keyed by device type.
+        """
         controllers = {}
         for device in os.listdir('Devices'):
             if device != "AbstractDevice":
-                fpath = glob.glob("Devices/" + device + "/Controller/*controller.py")
+                fpath = glob.glob("Devices/" + device + "/Controller/*" + ("recorder" if headless else "controller")
+                                  + ".py")
                 if fpath:
-                    spec = importlib.util.spec_from_file_location(device, fpath[0])
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    controllers.update({device: mod.Controller})
+                    controllers.update({device: fpath[0]})
         return controllers
+
+    def _get_controller_class(self, dev_type: str):
+        """
+        Import a device type's controller the first time one of its devices connects.
+        :param dev_type: The type of device.
+        :return type: The device's Controller class, or its Recorder class when headless.
+        """
+        if dev_type not in self._controller_classes:
+            spec = importlib.util.spec_from_file_location(dev_type, self._controllers[dev_type])
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+            self._controller_classes[dev_type] = mod.Recorder if self._headless else mod.Controller
+        return self._controller_classes[dev_type]
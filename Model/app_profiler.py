@@ -0,0 +1,260 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import os
+import re
+import io
+import pstats
+import cProfile
+from logging import getLogger
+from time import perf_counter, thread_time
+from collections.abc import Coroutine
+from asyncio import Task, current_task, get_event_loop
+
+# Only functions in files under this folder are listed in the function report.
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+report_functions = 60  # How many functions the text report lists.
+
+
+class TaskStats:
+    """ Time spent running one name of asyncio task. """
+    __slots__ = ("tasks", "steps", "wall", "cpu", "longest")
+
+    def __init__(self):
+        self.tasks = 0
+        self.steps = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.longest = 0.0
+
+
+class _TimedCoroutine(Coroutine):
+    """
+    Wraps a task's coroutine so each step the event loop runs is timed. A step is the code between two awaits that
+    actually suspend, so wall time here is time the task held the event loop.
+    """
+    __slots__ = ("_coro", "_profiler", "_stats", "_session")
+
+    def __init__(self, coro, profiler):
+        self._coro = coro
+        self._profiler = profiler
+        self._stats = None
+        self._session = 0  # Which profiling run _stats belongs to.
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, typ, val=None, tb=None):
+        if val is None and tb is None:
+            return self._step(self._coro.throw, typ)
+        return self._step(lambda _: self._coro.throw(typ, val, tb), None)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def get_coro_name(self) -> str:
+        """
+        :return str: The wrapped coroutine's name.
+        """
+        return getattr(self._coro, "__qualname__", type(self._coro).__name__)
+
+    def _step(self, func, arg):
+        if not self._profiler.is_running():
+            return func(arg)
+        if self._session != self._profiler.get_session():
+            self._session = self._profiler.get_session()
+            self._stats = self._profiler.get_task_stats(self._get_name())
+            self._stats.tasks += 1
+        stats = self._stats
+        wall = perf_counter()
+        cpu = thread_time()
+        try:
+            return func(arg)
+        finally:
+            wall = perf_counter() - wall
+            stats.steps += 1
+            stats.wall += wall
+            stats.cpu += thread_time() - cpu
+            if wall > stats.longest:
+                stats.longest = wall
+
+    def _get_name(self) -> str:
+        """
+        :return str: The task's name if it was given one, else the coroutine's name.
+        """
+        task = current_task()
+        if task is not None and not task.get_name().startswith("Task-"):
+            return task.get_name()
+        return self.get_coro_name()
+
+
+class AppProfiler:
+    """
+    Profiles the app while it runs. Function level times come from cProfile on the event loop thread. Per task wall
+    and cpu time come from a task factory that wraps every task created while it is installed.
+    """
+    def __init__(self):
+        self._logger = getLogger(__name__)
+        self._profile = None
+        self._tasks = dict()
+        self._started = 0.0
+        self._running = False
+        self._session = 0
+        self._loops = set()
+
+    def is_running(self) -> bool:
+        """
+        :return bool: Whether profiling is on.
+        """
+        return self._running
+
+    def get_session(self) -> int:
+        """
+        :return int: Counts up each time profiling starts.
+        """
+        return self._session
+
+    def install(self) -> None:
+        """
+        Wrap every task made on the running event loop from now on so its steps can be timed. Call at startup so
+        tasks that live for the whole app are seen however late profiling is started. While profiling is off a
+        wrapped step only checks is_running().
+        :return None:
+        """
+        loop = get_event_loop()
+        if loop not in self._loops:
+            loop.set_task_factory(self._task_factory)
+            self._loops.add(loop)
+
+    def get_task_stats(self, name: str) -> TaskStats:
+        """
+        :param name: The task name.
+        :return TaskStats: The stats for tasks with this name, created if needed.
+        """
+        stats = self._tasks.get(name)
+        if stats is None:
+            stats = self._tasks[name] = TaskStats()
+        return stats
+
+    def start(self) -> None:
+        """
+        Start profiling. Tasks created before install() are only seen by the function profile.
+        :return None:
+        """
+        if self._running:
+            return
+        self._logger.info("Profiling started")
+        self.install()
+        self._session += 1
+        self._tasks = dict()
+        self._profile = cProfile.Profile()
+        self._started = perf_counter()
+        self._running = True
+        self._profile.enable()
+
+    def stop(self, base_name: str) -> [str]:
+        """
+        Stop profiling and write the reports.
+        :param base_name: Path and start of the report file names.
+        :return list: The files written.
+        """
+        if not self._running:
+            return []
+        self._profile.disable()
+        self._running = False
+        duration = perf_counter() - self._started
+        files = [base_name + "_profile.txt", base_name + "_profile_tasks.csv", base_name + "_profile.prof"]
+        stats = pstats.Stats(self._profile)
+        stats.dump_stats(files[2])
+        with open(files[0], "w") as file:
+            file.write(self._format_report(stats, duration))
+        with open(files[1], "w") as file:
+            file.write("task, count, steps, wall (ms), cpu (ms), longest step (ms)\n")
+            for name, task_stats in self._sorted_tasks():
+                file.write(name + ", " + ", ".join(self._task_row(task_stats)) + "\n")
+        self._profile = None
+        self._logger.info("Profiling stopped. Reports saved to " + files[0])
+        return files
+
+    def _task_factory(self, loop, coro, **kwargs) -> Task:
+        """
+        Make tasks whose coroutine steps are timed.
+        :param loop: The event loop.
+        :param coro: The task's coroutine.
+        :return Task: The new task.
+        """
+        return Task(_TimedCoroutine(coro, self), loop=loop, **kwargs)
+
+    def _sorted_tasks(self) -> [(str, TaskStats)]:
+        """
+        :return list: (name, stats) pairs, most cpu time first.
+        """
+        return sorted(self._tasks.items(), key=lambda item: item[1].cpu, reverse=True)
+
+    @staticmethod
+    def _task_row(stats: TaskStats) -> [str]:
+        """
+        :param stats: The stats to format.
+        :return list: The formatted count, steps, wall, cpu and longest step values.
+        """
+        return [str(stats.tasks), str(stats.steps), str(round(stats.wall * 1000, 2)), str(round(stats.cpu * 1000, 2)),
+                str(round(stats.longest * 1000, 2))]
+
+    def _format_report(self, stats: pstats.Stats, duration: float) -> str:
+        """
+        :param stats: The function profile.
+        :param duration: How long profiling ran in seconds.
+        :return str: The text report.
+        """
+        out = io.StringIO()
+        out.write("Profiled for " + str(round(duration, 2)) + " s\n\n")
+        out.write("Tasks (wall is time holding the event loop, most cpu first)\n")
+        out.write("task, count, steps, wall (ms), cpu (ms), longest step (ms)\n")
+        for name, task_stats in self._sorted_tasks():
+            out.write(name + ", " + ", ".join(self._task_row(task_stats)) + "\n")
+        out.write("\nFunctions in this app by cumulative time\n")
+        stats.stream = out
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(re.escape(project_root) + r"(?!.*app_profiler\.py)", report_functions)
+        return out.getvalue()
+
+
+_profiler = AppProfiler()
+
+
+def get_profiler() -> AppProfiler:
+    """
+    :return AppProfiler: The app wide profiler.
+    """
+    return _profiler
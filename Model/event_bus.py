@@ -0,0 +1,158 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from enum import Enum, auto
+from logging import getLogger
+from asyncio import Queue, QueueFull
+
+
+class EventTopic(Enum):
+    DEVICE_CONNECTED = auto()
+    DEVICE_LOST = auto()
+    DEVICE_CONN_ERR = auto()
+    VIEW_ADD = auto()
+    VIEW_REMOVE = auto()
+    DEVICE_DATA = auto()
+    EXP_START_ERR = auto()
+
+
+class TopicStats:
+    """ Delivery counters for a single topic. """
+    def __init__(self):
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.peak_depth = 0
+
+
+class EventBus:
+    """
+    In process publish/subscribe channels. Every subscriber gets its own bounded queue so one slow consumer
+    does not hide events from another. Events published while a topic has no subscribers are discarded.
+    """
+    def __init__(self, maxsize: int = 100):
+        """
+        Initialize the bus.
+        :param maxsize: Default queue size for new subscriptions.
+        """
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        self._maxsize = maxsize
+        self._subscribers = dict()
+        self._stats = dict()
+        for topic in EventTopic:
+            self._subscribers[topic] = []
+            self._stats[topic] = TopicStats()
+        self._logger.debug("Initialized")
+
+    def subscribe(self, topic: EventTopic, maxsize: int = None) -> Queue:
+        """
+        Get a new queue that will receive every event published to topic from now on.
+        :param topic: The topic to listen to.
+        :param maxsize: The queue size to use, default size if None.
+        :return Queue: The queue events will be put in.
+        """
+        if maxsize is None:
+            maxsize = self._maxsize
+        queue = Queue(maxsize)
+        self._subscribers[topic].append(queue)
+        return queue
+
+    def unsubscribe(self, topic: EventTopic, queue: Queue) -> None:
+        """
+        Stop delivering events from topic to queue.
+        :param topic: The topic queue is subscribed to.
+        :param queue: The queue returned by subscribe().
+        :return None:
+        """
+        if queue in self._subscribers[topic]:
+            self._subscribers[topic].remove(queue)
+
+    async def publish(self, topic: EventTopic, item) -> None:
+        """
+        Deliver item to every subscriber of topic, waiting for room if a subscriber's queue is full.
+        Nothing is dropped.
+        :param topic: The topic to publish to.
+        :param item: The event.
+        :return None:
+        """
+        stats = self._stats[topic]
+        stats.published += 1
+        for queue in list(self._subscribers[topic]):
+            await queue.put(item)
+            stats.delivered += 1
+            self._update_depth(stats, queue)
+
+    def publish_nowait(self, topic: EventTopic, item) -> bool:
+        """
+        Deliver item to every subscriber of topic without waiting. If a subscriber's queue is full the item is
+        dropped for that subscriber and counted.
+        :param topic: The topic to publish to.
+        :param item: The event.
+        :return bool: False if any subscriber missed this item.
+        """
+        stats = self._stats[topic]
+        stats.published += 1
+        ret = True
+        for queue in self._subscribers[topic]:
+            try:
+                queue.put_nowait(item)
+                stats.delivered += 1
+                self._update_depth(stats, queue)
+            except QueueFull:
+                stats.dropped += 1
+                ret = False
+                self._logger.warning("Queue full, dropped event for topic: " + topic.name)
+        return ret
+
+    def get_depth(self, topic: EventTopic) -> int:
+        """
+        :param topic: The topic to check.
+        :return int: The number of undelivered events waiting in the fullest subscriber queue.
+        """
+        depths = [queue.qsize() for queue in self._subscribers[topic]]
+        return max(depths) if depths else 0
+
+    def get_stats(self) -> [(str, int, int, int, int, int)]:
+        """
+        :return list: (topic, subscribers, depth, peak depth, published, dropped) for each topic.
+        """
+        ret = []
+        for topic in EventTopic:
+            stats = self._stats[topic]
+            ret.append((topic.name, len(self._subscribers[topic]), self.get_depth(topic), stats.peak_depth,
+                        stats.published, stats.dropped))
+        return ret
+
+    @staticmethod
+    def _update_depth(stats: TopicStats, queue: Queue) -> None:
+        """
+        Track the deepest any queue for this topic has been.
+        :param stats: The topic's stats.
+        :param queue: The queue that was just added to.
+        :return None:
+        """
+        if queue.qsize() > stats.peak_depth:
+            stats.peak_depth = queue.qsize()
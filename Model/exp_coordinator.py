@@ -0,0 +1,124 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from logging import getLogger
+from time import perf_counter
+from threading import Barrier, BrokenBarrierError
+from concurrent.futures import ThreadPoolExecutor
+from asyncio import get_running_loop, gather
+from Devices.AbstractDevice.Controller.abstract_controller import AbstractController
+from Model.tracer import trace
+
+
+class ExpCoordinator:
+    """
+    Sends experiment start and stop commands to every device at as close to the same moment as possible.
+    Each device gets its own writer thread and all writers are released together by a barrier.
+    """
+    def __init__(self, barrier_timeout: float = 1):
+        """
+        Initialize the coordinator.
+        :param barrier_timeout: How long writer threads wait for each other before giving up.
+        """
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        self._barrier_timeout = barrier_timeout
+        self._logger.debug("Initialized")
+
+    @staticmethod
+    def prepare(controllers: [AbstractController], start: bool) -> ([(AbstractController, bytes)],
+                                                                      [AbstractController]):
+        """
+        Get the encoded command for each device ahead of sending so no work is done between sends.
+        :param controllers: The devices to prepare.
+        :param start: True to prepare start commands, False for stop commands.
+        :return: (controller and command for each device with a command, controllers without a command)
+        """
+        to_send = []
+        no_cmd = []
+        for controller in controllers:
+            if start:
+                cmd = controller.get_start_cmd()
+            else:
+                cmd = controller.get_stop_cmd()
+            if cmd and controller.get_conn() and controller.get_conn().is_open:
+                to_send.append((controller, cmd))
+            else:
+                no_cmd.append(controller)
+        return to_send, no_cmd
+
+    @trace
+    async def send(self, to_send: [(AbstractController, bytes)]) -> dict:
+        """
+        Write every prepared command at once.
+        :param to_send: The output of prepare().
+        :return dict: Seconds each device's write finished after the first device's write finished, by port.
+        """
+        if len(to_send) == 0:
+            return dict()
+        loop = get_running_loop()
+        barrier = Barrier(len(to_send))
+        with ThreadPoolExecutor(max_workers=len(to_send)) as pool:
+            results = await gather(*[loop.run_in_executor(pool, self._write, controller.get_conn(), cmd, barrier)
+                                     for controller, cmd in to_send], return_exceptions=True)
+        acks = dict()
+        for i in range(len(to_send)):
+            port = to_send[i][0].get_conn().port
+            if isinstance(results[i], Exception):
+                self._logger.error("Failed sending to " + port, exc_info=results[i])
+            else:
+                acks[port] = results[i]
+        offsets = dict()
+        if acks:
+            first = min(acks.values())
+            for port in acks:
+                offsets[port] = acks[port] - first
+        return offsets
+
+    def _write(self, conn, cmd: bytes, barrier: Barrier) -> float:
+        """
+        Wait for every writer to be ready then write cmd and wait for it to leave the output buffer.
+        :param conn: The device connection.
+        :param cmd: The encoded command.
+        :param barrier: Releases all writers together.
+        :return float: perf_counter time the device accepted the write.
+        """
+        try:
+            barrier.wait(self._barrier_timeout)
+        except BrokenBarrierError:
+            self._logger.warning("Not all devices were ready, sending anyway.")
+        conn.write(cmd)
+        conn.flush()
+        return perf_counter()
+
+
+def get_skew(offsets: dict) -> float:
+    """
+    :param offsets: The output of ExpCoordinator.send().
+    :return float: Seconds between the first and last device accepting the command.
+    """
+    if len(offsets) == 0:
+        return 0.0
+    return max(offsets.values()) - min(offsets.values())
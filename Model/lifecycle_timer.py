@@ -0,0 +1,140 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from enum import Enum, auto
+from time import perf_counter
+from logging import getLogger
+
+
+class TimingPhase(Enum):
+    ENUMERATE = auto()
+    OPEN = auto()
+    CONTROLLER_INIT = auto()
+    VIEW_CREATION = auto()
+    FIRST_CONFIG = auto()
+    FIRST_TRIAL = auto()
+
+
+class TimingSpan:
+    """ A single timed phase of a device's discovery or lifecycle. """
+    def __init__(self, device: str, phase: TimingPhase, start: float):
+        self.device = device
+        self.phase = phase
+        self.start = start
+        self.end = None
+
+    def get_duration(self) -> float:
+        """
+        :return float: The length of this span in seconds, or -1 if it has not finished.
+        """
+        if self.end is None:
+            return -1.0
+        return self.end - self.start
+
+
+class LifecycleTimer:
+    """ Records how long each device takes to get from being plugged in to showing data. """
+    def __init__(self):
+        self._logger = getLogger(__name__)
+        self._origin = perf_counter()
+        self._spans = dict()
+
+    def start(self, device: str, phase: TimingPhase, start: float = None) -> None:
+        """
+        Begin timing a phase for a device. Restarting a phase replaces the old span.
+        :param device: The device identifier, usually the port name.
+        :param phase: The phase being timed.
+        :param start: Optional perf_counter value to use as the start time.
+        :return None:
+        """
+        if start is None:
+            start = perf_counter()
+        self._spans[(device, phase)] = TimingSpan(device, phase, start)
+
+    def stop(self, device: str, phase: TimingPhase) -> None:
+        """
+        Finish timing a phase for a device. Does nothing if the phase was not started or already stopped.
+        :param device: The device identifier, usually the port name.
+        :param phase: The phase being timed.
+        :return None:
+        """
+        span = self._spans.get((device, phase))
+        if span is None or span.end is not None:
+            return
+        span.end = perf_counter()
+        self._logger.info(device + " " + phase.name + " took " + str(round(span.get_duration() * 1000, 2)) + " ms")
+
+    def has_span(self, device: str, phase: TimingPhase) -> bool:
+        """
+        :param device: The device identifier.
+        :param phase: The phase to look for.
+        :return bool: Whether this phase has been started for this device.
+        """
+        return (device, phase) in self._spans
+
+    def get_spans(self) -> [TimingSpan]:
+        """
+        :return list: All recorded spans ordered by start time.
+        """
+        return sorted(self._spans.values(), key=lambda span: span.start)
+
+    def get_origin(self) -> float:
+        """
+        :return float: The perf_counter value all span start times are relative to.
+        """
+        return self._origin
+
+    def clear_device(self, device: str) -> None:
+        """
+        Forget all spans for a device.
+        :param device: The device identifier.
+        :return None:
+        """
+        for key in [k for k in self._spans if k[0] == device]:
+            del self._spans[key]
+
+    def export_csv(self, filename: str) -> None:
+        """
+        Write all recorded spans to a csv file.
+        :param filename: The file to write to.
+        :return None:
+        """
+        with open(filename, "w") as file:
+            file.write("device, phase, start (ms), duration (ms)\n")
+            for span in self.get_spans():
+                duration = span.get_duration()
+                file.write(span.device + ", " + span.phase.name + ", "
+                           + str(round((span.start - self._origin) * 1000, 2)) + ", "
+                           + (str(round(duration * 1000, 2)) if duration >= 0 else "") + "\n")
+
+
+_timer = LifecycleTimer()
+
+
+def get_lifecycle_timer() -> LifecycleTimer:
+    """
+    :return LifecycleTimer: The app wide lifecycle timer.
+    """
+    return _timer
@@ -0,0 +1,220 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import sys
+import traceback
+from bisect import bisect_left
+from datetime import datetime
+from logging import getLogger
+from threading import Thread, Event, get_ident
+from time import perf_counter
+from asyncio import sleep, current_task, get_running_loop
+
+check_interval = 0.05  # How often the event loop is checked, in seconds.
+slow_threshold = 0.1  # Lag in seconds that counts as a stall and gets a stack sample.
+lag_buckets_ms = [1, 2, 5, 10, 20, 50, 100, 200, 500]  # Upper edges of the lag histogram. The last bucket is open.
+max_stalls = 1000  # Stalls kept per experiment.
+stack_depth = 12  # Frames kept in each stack sample.
+
+
+class Stall:
+    """ A time the event loop did not get back to the monitor within slow_threshold. """
+    __slots__ = ("time", "lag", "task", "stack")
+
+    def __init__(self, time: datetime, task: str, stack: [str]):
+        self.time = time
+        self.lag = 0.0
+        self.task = task
+        self.stack = stack
+
+    def get_where(self) -> str:
+        """
+        :return str: The innermost sampled frame, which is usually the code holding the event loop.
+        """
+        return self.stack[-1] if self.stack else ""
+
+
+class LoopMonitor:
+    """
+    Measures how late the event loop is at running a sleeping coroutine. Serial reads, disk writes, graph draws and
+    the ui all share one loop, so lag here is timestamp jitter for every device. A watchdog thread samples the loop
+    thread's stack while a stall is happening so the code causing it can be found.
+    """
+    def __init__(self, interval: float = check_interval, threshold: float = slow_threshold):
+        """
+        :param interval: How often to check the loop, in seconds.
+        :param threshold: Lag in seconds that counts as a stall.
+        """
+        self._logger = getLogger(__name__)
+        self._interval = interval
+        self._threshold = threshold
+        self._heartbeat = perf_counter()
+        self._sampled_beat = None
+        self._pending = None
+        self._loop = None
+        self._loop_thread = None
+        self._stop = Event()
+        self._watchdog = None
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all measurements, for example when a new experiment is created.
+        :return None:
+        """
+        self._current = 0.0
+        self._worst = 0.0
+        self._total = 0.0
+        self._checks = 0
+        self._counts = [0] * (len(lag_buckets_ms) + 1)
+        self._stalls = list()
+        self._since = datetime.now()
+
+    async def run(self) -> None:
+        """
+        Check the event loop lag until cancelled.
+        :return None:
+        """
+        self._loop = get_running_loop()
+        self._loop_thread = get_ident()
+        self._stop.clear()
+        self._watchdog = Thread(target=self._watch, name="loop watchdog", daemon=True)
+        self._watchdog.start()
+        try:
+            while True:
+                before = perf_counter()
+                self._heartbeat = before
+                await sleep(self._interval)
+                self._record(max(perf_counter() - before - self._interval, 0.0))
+        finally:
+            self._stop.set()
+
+    def get_current(self) -> float:
+        """
+        :return float: The last measured lag in seconds.
+        """
+        return self._current
+
+    def get_worst(self) -> float:
+        """
+        :return float: The worst lag in seconds since the last reset.
+        """
+        return self._worst
+
+    def get_mean(self) -> float:
+        """
+        :return float: The mean lag in seconds since the last reset.
+        """
+        return self._total / self._checks if self._checks else 0.0
+
+    def get_histogram(self) -> [(str, int)]:
+        """
+        :return list: (bucket label, count) for each lag bucket.
+        """
+        labels = ["<=" + str(edge) for edge in lag_buckets_ms] + [">" + str(lag_buckets_ms[-1])]
+        return list(zip(labels, self._counts))
+
+    def get_slow_bucket(self) -> int:
+        """
+        :return int: Index of the first histogram bucket holding only stalls.
+        """
+        return bisect_left(lag_buckets_ms, self._threshold * 1000) + 1
+
+    def get_stalls(self) -> [Stall]:
+        """
+        :return list: Stalls since the last reset, oldest first.
+        """
+        return list(self._stalls)
+
+    def get_report(self) -> str:
+        """
+        :return str: Csv text with the summary, histogram and every stall since the last reset.
+        """
+        lines = ["since, checks, interval (ms), threshold (ms), mean lag (ms), worst lag (ms), stalls",
+                 ", ".join([self._since.strftime("%Y-%m-%d %H:%M:%S"), str(self._checks),
+                            str(round(self._interval * 1000)), str(round(self._threshold * 1000)),
+                            str(round(self.get_mean() * 1000, 2)), str(round(self._worst * 1000, 2)),
+                            str(len(self._stalls))]),
+                 "",
+                 "lag (ms), count"]
+        lines += [label + ", " + str(count) for label, count in self.get_histogram()]
+        lines += ["", "time, lag (ms), task, stack (outermost first)"]
+        for stall in self._stalls:
+            lines.append(", ".join([stall.time.strftime("%Y-%m-%d %H:%M:%S.%f"), str(round(stall.lag * 1000, 2)),
+                                    stall.task, " | ".join(stall.stack)]))
+        return "\n".join(lines) + "\n"
+
+    def _record(self, lag: float) -> None:
+        """
+        Add one lag measurement and finish the stall it belongs to, if any.
+        :param lag: The measured lag in seconds.
+        :return None:
+        """
+        self._current = lag
+        self._total += lag
+        self._checks += 1
+        if lag > self._worst:
+            self._worst = lag
+        self._counts[bisect_left(lag_buckets_ms, lag * 1000)] += 1
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            pending.lag = lag
+            if len(self._stalls) < max_stalls:
+                self._stalls.append(pending)
+            self._logger.warning("Event loop stalled for " + str(round(lag * 1000)) + " ms in "
+                                 + pending.task + " at " + pending.get_where())
+
+    def _watch(self) -> None:
+        """
+        Watchdog thread. Samples the loop thread's stack once per stall.
+        :return None:
+        """
+        while not self._stop.wait(self._threshold / 2):
+            beat = self._heartbeat
+            if beat == self._sampled_beat or perf_counter() - beat < self._interval + self._threshold:
+                continue
+            self._sampled_beat = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            # Commas are swapped out so the stack stays one csv field.
+            stack = [(frame_summary.filename + ":" + str(frame_summary.lineno) + " " + frame_summary.name)
+                     .replace(",", ";") for frame_summary in traceback.extract_stack(frame, stack_depth)]
+            try:
+                task = current_task(self._loop)
+            except RuntimeError:
+                task = None
+            self._pending = Stall(datetime.now(), task.get_name() if task else "callback", stack)
+
+
+_monitor = LoopMonitor()
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """
+    :return LoopMonitor: The app wide event loop monitor.
+    """
+    return _monitor
@@ -0,0 +1,352 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import json
+from math import log2, floor
+from time import perf_counter
+from logging import getLogger
+from asyncio import start_server, StreamReader, StreamWriter, wait_for, TimeoutError, IncompleteReadError, \
+    LimitOverrunError
+
+# Histogram bucket resolution. Each doubling of value is split into this many buckets, so recorded values are
+# accurate to about 1 / histogram_sub_buckets (9% with 8).
+histogram_sub_buckets = 8
+histogram_min = 0.001  # Smallest value a histogram tells apart from 0.
+quantiles = [0.5, 0.9, 0.99]
+
+
+class Counter:
+    """ A value that only goes up, such as messages received. """
+    kind = "counter"
+
+    def __init__(self):
+        self._value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        :param amount: How much to add.
+        :return None:
+        """
+        self._value += amount
+
+    def get_value(self) -> float:
+        """
+        :return float: The current count.
+        """
+        return self._value
+
+
+class Gauge:
+    """ A value that goes up and down, such as a queue depth. It can read its value from a function instead. """
+    kind = "gauge"
+
+    def __init__(self):
+        self._value = 0
+        self._func = None
+
+    def set(self, value: float) -> None:
+        """
+        :param value: The new value.
+        :return None:
+        """
+        self._value = value
+
+    def set_function(self, func) -> None:
+        """
+        Read the value from func each time it is asked for.
+        :param func: Callable taking nothing and returning a number.
+        :return None:
+        """
+        self._func = func
+
+    def get_value(self) -> float:
+        """
+        :return float: The current value.
+        """
+        if self._func is not None:
+            return self._func()
+        return self._value
+
+
+class Histogram:
+    """
+    Distribution of values, such as latencies in ms. Buckets are spaced logarithmically like an HDR histogram, so
+    memory stays small and relative error is the same at every scale.
+    """
+    kind = "histogram"
+
+    def __init__(self):
+        self._buckets = dict()
+        self._count = 0
+        self._sum = 0.0
+        self._min = None
+        self._max = None
+
+    def observe(self, value: float) -> None:
+        """
+        :param value: The value to record.
+        :return None:
+        """
+        self._count += 1
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+        index = floor(log2(value / histogram_min) * histogram_sub_buckets) if value > histogram_min else -1
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def get_count(self) -> int:
+        """
+        :return int: How many values were recorded.
+        """
+        return self._count
+
+    def get_value(self) -> int:
+        """
+        :return int: How many values were recorded. Used for rates.
+        """
+        return self._count
+
+    def get_sum(self) -> float:
+        """
+        :return float: The sum of recorded values.
+        """
+        return self._sum
+
+    def get_max(self) -> float:
+        """
+        :return float: The largest recorded value, or 0 if there are none.
+        """
+        return self._max or 0.0
+
+    def get_quantile(self, q: float) -> float:
+        """
+        :param q: The quantile, from 0 to 1.
+        :return float: The upper edge of the bucket holding the quantile, capped at the largest value seen.
+        """
+        if not self._count:
+            return 0.0
+        rank = q * self._count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self._bucket_edge(index), self._max)
+        return self._max
+
+    def get_cumulative_buckets(self) -> [(float, int)]:
+        """
+        :return list: (upper edge, count of values at or below it) for each bucket in use.
+        """
+        ret = []
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            ret.append((self._bucket_edge(index), seen))
+        return ret
+
+    @staticmethod
+    def _bucket_edge(index: int) -> float:
+        """
+        :param index: The bucket index.
+        :return float: The largest value that goes in this bucket.
+        """
+        if index < 0:
+            return histogram_min
+        return histogram_min * 2 ** ((index + 1) / histogram_sub_buckets)
+
+
+class MetricsRegistry:
+    """ Holds every metric in the app by name and labels. Metrics are made the first time they are asked for. """
+    def __init__(self):
+        self._logger = getLogger(__name__)
+        self._metrics = dict()
+        self._help = dict()
+        self._last_rates = dict()
+        self._last_time = perf_counter()
+
+    def counter(self, name: str, help_text: str, **labels) -> Counter:
+        """
+        :param name: The metric name.
+        :param help_text: What this metric measures.
+        :param labels: Labels telling this series apart from others with the same name, like device="COM3".
+        :return Counter: The counter.
+        """
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, **labels) -> Gauge:
+        """
+        :param name: The metric name.
+        :param help_text: What this metric measures.
+        :param labels: Labels telling this series apart from others with the same name.
+        :return Gauge: The gauge.
+        """
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str, **labels) -> Histogram:
+        """
+        :param name: The metric name.
+        :param help_text: What this metric measures.
+        :param labels: Labels telling this series apart from others with the same name.
+        :return Histogram: The histogram.
+        """
+        return self._get(Histogram, name, help_text, labels)
+
+    def get_rows(self) -> [(str, str, str, str)]:
+        """
+        Summaries for display. Rates are per second since the last call.
+        :return list: (name, labels, value, rate) for every metric.
+        """
+        now = perf_counter()
+        elapsed = now - self._last_time
+        self._last_time = now
+        rows = []
+        for key, metric in sorted(self._metrics.items(), key=lambda item: item[0]):
+            name, labels = key
+            value = metric.get_value()
+            last = self._last_rates.get(key)
+            self._last_rates[key] = value
+            rate = "-"
+            if metric.kind != "gauge" and last is not None and elapsed > 0:
+                rate = str(round((value - last) / elapsed, 2))
+            if metric.kind == "histogram":
+                text = "n=" + str(metric.get_count()) + " " + " ".join(
+                    "p" + str(round(q * 100)) + "=" + str(round(metric.get_quantile(q), 2)) for q in quantiles) \
+                    + " max=" + str(round(metric.get_max(), 2))
+            else:
+                text = str(round(value, 3))
+            rows.append((name, ", ".join(k + "=" + v for k, v in labels), text, rate))
+        return rows
+
+    def to_prometheus(self) -> str:
+        """
+        :return str: Every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        done = set()
+        for (name, labels), metric in sorted(self._metrics.items(), key=lambda item: item[0]):
+            if name not in done:
+                done.add(name)
+                lines.append("# HELP " + name + " " + self._help[name])
+                lines.append("# TYPE " + name + " " + metric.kind)
+            if metric.kind == "histogram":
+                for edge, count in metric.get_cumulative_buckets():
+                    lines.append(name + "_bucket" + _format_labels(labels + (("le", repr(edge)),)) + " " + str(count))
+                lines.append(name + "_bucket" + _format_labels(labels + (("le", "+Inf"),)) + " "
+                             + str(metric.get_count()))
+                lines.append(name + "_sum" + _format_labels(labels) + " " + repr(float(metric.get_sum())))
+                lines.append(name + "_count" + _format_labels(labels) + " " + str(metric.get_count()))
+            else:
+                lines.append(name + _format_labels(labels) + " " + repr(float(metric.get_value())))
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        """
+        :return str: Every metric as JSON, with histogram quantiles.
+        """
+        out = []
+        for (name, labels), metric in sorted(self._metrics.items(), key=lambda item: item[0]):
+            entry = {"name": name, "type": metric.kind, "labels": dict(labels)}
+            if metric.kind == "histogram":
+                entry["count"] = metric.get_count()
+                entry["sum"] = metric.get_sum()
+                entry["max"] = metric.get_max()
+                entry["quantiles"] = {str(q): metric.get_quantile(q) for q in quantiles}
+            else:
+                entry["value"] = metric.get_value()
+            out.append(entry)
+        return json.dumps(out, indent=1)
+
+    def _get(self, cls, name: str, help_text: str, labels: dict):
+        """
+        :return: The metric with this name and labels, made if needed.
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = self._metrics[key] = cls()
+            self._help.setdefault(name, help_text)
+        return metric
+
+
+def _format_labels(labels: tuple) -> str:
+    """
+    :param labels: (name, value) pairs.
+    :return str: Labels in Prometheus syntax, or nothing if there are none.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(k + '="' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for k, v in labels) + "}"
+
+
+class MetricsServer:
+    """ Serves the registry in Prometheus text format over http on localhost only. """
+    def __init__(self, registry: MetricsRegistry, port: int):
+        self._logger = getLogger(__name__)
+        self._registry = registry
+        self._port = port
+
+    async def run(self) -> None:
+        """
+        Serve until cancelled.
+        :return None:
+        """
+        server = await start_server(self._handle, "127.0.0.1", self._port)
+        self._logger.info("Serving metrics on http://127.0.0.1:" + str(self._port) + "/metrics")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """
+        Answer one http request.
+        :param reader: The request stream.
+        :param writer: The response stream.
+        :return None:
+        """
+        try:
+            request = await wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+            path = request.split(b" ")[1] if request.count(b" ") >= 2 else b""
+            if path.split(b"?")[0] in (b"/", b"/metrics"):
+                status, body = b"200 OK", self._registry.to_prometheus().encode()
+            else:
+                status, body = b"404 Not Found", b"Not found\n"
+            writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Type: text/plain; version=0.0.4\r\nContent-Length: "
+                         + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body)
+            await writer.drain()
+        except (TimeoutError, ConnectionError, IncompleteReadError, LimitOverrunError, IndexError) as e:
+            self._logger.debug("Bad metrics request: " + str(e))
+        finally:
+            writer.close()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    :return MetricsRegistry: The app wide metrics registry.
+    """
+    return _registry
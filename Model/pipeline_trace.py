@@ -0,0 +1,155 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+import json
+from enum import Enum
+from time import perf_counter
+from collections import deque
+
+default_capacity = 10000  # Messages kept. Older ones are dropped.
+
+
+class Stage(Enum):
+    READ = "read"  # readline returned.
+    PARSED = "parsed"  # The line was turned into values.
+    SAVE_QUEUED = "save queued"  # The save line was handed to the save queue.
+    ON_DISK = "on disk"  # The save line was written and its file closed.
+    SHOWN = "shown"  # The graph holding the point finished drawing.
+
+
+# Spans drawn in the trace viewer, as (name, lane, from stage, to stage). Each lane is its own row per device so
+# spans that overlap in time do not hide each other.
+trace_spans = [("parse", "read", Stage.READ, Stage.PARSED),
+               ("wait for save", "save", Stage.PARSED, Stage.SAVE_QUEUED),
+               ("write", "save", Stage.SAVE_QUEUED, Stage.ON_DISK),
+               ("draw", "display", Stage.PARSED, Stage.SHOWN)]
+
+
+class MessageTrace:
+    """ When one message from a device reached each stage of the app. """
+    __slots__ = ("device", "number", "stamps")
+
+    def __init__(self, device: str, number: int, read: float):
+        self.device = device
+        self.number = number
+        self.stamps = {Stage.READ: read}
+
+    def mark(self, stage: Stage) -> None:
+        """
+        Record that this message reached stage now. Only the first time is kept.
+        :param stage: The stage reached.
+        :return None:
+        """
+        if stage not in self.stamps:
+            self.stamps[stage] = perf_counter()
+
+
+class PipelineTracer:
+    """
+    Samples messages from devices and records when each reached each stage, from being read off the serial port to
+    being on disk and on screen. Exports as Chrome trace event JSON for chrome://tracing or ui.perfetto.dev.
+    """
+    def __init__(self, capacity: int = default_capacity):
+        self._origin = perf_counter()
+        self._traces = deque(maxlen=capacity)
+        self._sample_every = 1
+        self._seen = 0
+
+    def set_sample_every(self, count: int) -> None:
+        """
+        :param count: Trace one of every count messages. 0 turns tracing off.
+        :return None:
+        """
+        self._sample_every = max(0, count)
+
+    def begin(self, device: str, read: float):
+        """
+        Start tracing a message if it is sampled.
+        :param device: The device the message came from.
+        :param read: perf_counter value when the message was read.
+        :return MessageTrace: The new trace, or None if this message is not sampled.
+        """
+        self._seen += 1
+        if not self._sample_every or self._seen % self._sample_every:
+            return None
+        trace = MessageTrace(device, self._seen, read)
+        self._traces.append(trace)
+        return trace
+
+    def get_traces(self) -> [MessageTrace]:
+        """
+        :return list: The kept traces, oldest first.
+        """
+        return list(self._traces)
+
+    def clear(self) -> None:
+        """
+        Forget all traces.
+        :return None:
+        """
+        self._traces.clear()
+
+    def to_chrome_trace(self) -> str:
+        """
+        :return str: The kept traces as Chrome trace event JSON.
+        """
+        events = []
+        threads = dict()
+        for trace in list(self._traces):
+            for name, lane, start_stage, end_stage in trace_spans:
+                start = trace.stamps.get(start_stage)
+                end = trace.stamps.get(end_stage)
+                if start is None or end is None:
+                    continue
+                key = (trace.device, lane)
+                if key not in threads:
+                    threads[key] = len(threads) + 1
+                    events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": threads[key],
+                                   "args": {"name": trace.device + " " + lane}})
+                events.append({"name": name, "cat": lane, "ph": "X", "pid": 1, "tid": threads[key],
+                               "ts": round((start - self._origin) * 1e6, 1),
+                               "dur": round((end - start) * 1e6, 1),
+                               "args": {"message": trace.number}})
+        events.insert(0, {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "RS Companion"}})
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def export_json(self, filename: str) -> None:
+        """
+        Write the kept traces to a Chrome trace event JSON file.
+        :param filename: The file to write to.
+        :return None:
+        """
+        with open(filename, "w") as file:
+            file.write(self.to_chrome_trace())
+
+
+_tracer = PipelineTracer()
+
+
+def get_pipeline_tracer() -> PipelineTracer:
+    """
+    :return PipelineTracer: The app wide pipeline tracer.
+    """
+    return _tracer
@@ -24,135 +24,95 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
-from asyncio import Event, get_running_loop, create_task, futures, sleep
+from logging import getLogger
+from time import perf_counter
+from asyncio import get_running_loop, sleep
 from serial.serialutil import SerialException
 from serial.tools.list_ports import comports
 from serial.tools.list_ports_common import ListPortInfo
 from aioserial import AioSerial
-from Model.app_helpers import await_event, end_tasks
+from Model.event_bus import EventBus, EventTopic
+from Model.task_supervisor import get_supervisor, TaskKind
+from Model.lifecycle_timer import get_lifecycle_timer, TimingPhase
+from Model.tracer import trace
 
 
 class RSDeviceCommScanner:
-    def __init__(self, device_ids: dict, log_handlers: [StreamHandler]):
+    def __init__(self, device_ids: dict, bus: EventBus):
         """
         Initialize scanner and prep for run.
         :param device_ids: The list of devices to look for.
+        :param bus: Where to publish connect, disconnect and connection error events.
         """
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         self._device_ids = device_ids
-        self._connect_event = Event()
-        self._disconnect_event = Event()
-        self._connect_err_event = Event()
-        self._new_coms = []
-        self._lost_coms = []
+        self._bus = bus
         self._known_ports = []
         self._serials = {}
         self._tasks = []
         self._loop = get_running_loop()
+        self._timer = get_lifecycle_timer()
         self._logger.debug("Initialized")
 
+    @trace
     def start(self) -> None:
         """
         Begin working.
         :return None:
         """
-        self._logger.debug("running")
-        self._tasks.append(create_task(self._scan_ports()))
-        self._logger.debug("done")
+        self._tasks.append(get_supervisor().spawn(TaskKind.LOOP, self._scan_ports))
 
+    @trace
     def cleanup(self) -> None:
         """
         Cleanup this class and prep for app closure.
         :return None:
         """
-        self._logger.debug("running")
-        create_task(end_tasks(self._tasks))
-        self._logger.debug("done")
-
-    def get_next_new_com(self) -> (bool, AioSerial):
-        """
-        Return the next new view if there is one.
-        :return bool, AioSerial: If there is an element to return, The next element to return.
-        """
-        self._logger.debug("running")
-        if len(self._new_coms) > 0:
-            self._logger.debug("done with true")
-            return True, self._new_coms.pop(0)
-        self._logger.debug("done with false")
-        return False, None
-
-    def get_next_lost_com(self) -> (bool, AioSerial):
-        """
-        Return the next new view if there is one.
-        :return bool, AioSerial: If there is an element to return, The next element to return.
-        """
-        self._logger.debug("running")
-        if len(self._lost_coms) > 0:
-            self._logger.debug("done with true")
-            return True, self._lost_coms.pop(0)
-        self._logger.debug("done with false")
-        return False, None
-
-    def await_connect(self) -> futures:
-        """
-        Signal when there is a connect event.
-        :return futures: If the flag is set.
-        """
-        return await_event(self._connect_event)
-
-    def await_disconnect(self) -> futures:
-        """
-        Signal when there is a disconnect event.
-        :return futures: If the flag is set.
-        """
-        return await_event(self._disconnect_event)
-
-    def await_err(self) -> futures:
-        """
-        Signal when there is an error with device connection.
-        :return futures: If the flag is set.
-        """
-        return await_event(self._connect_err_event)
+        for task in self._tasks:
+            task.cancel()
 
+    @trace
     async def _scan_ports(self) -> None:
         """
         Check number of ports being used. If different than last checked, check for plug or unplug events.
         :return None:
         """
-        self._logger.debug("running")
         while True:
+            scan_start = perf_counter()
             ports = await self._loop.run_in_executor(None, comports)
             if len(ports) > len(self._known_ports):
-                create_task(self._check_for_new_devices(ports))
+                get_supervisor().spawn(TaskKind.PORT, self._check_for_new_devices, ports, scan_start)
             elif len(ports) < len(self._known_ports):
-                create_task(self._check_for_disconnects(ports))
+                get_supervisor().spawn(TaskKind.PORT, self._check_for_disconnects, ports)
             await sleep(1)
 
-    async def _check_for_new_devices(self, ports: [ListPortInfo]) -> None:
+    @trace
+    async def _check_for_new_devices(self, ports: [ListPortInfo], scan_start: float) -> None:
         """
         Check plug events for supported Devices.
         :param ports: The list of ports to check.
+        :param scan_start: When the scan that found these ports began.
         :return None:
         """
-        self._logger.debug("running")
         for port in ports:
             if port not in self._known_ports:
                 self._known_ports.append(port)
                 for device_type in self._device_ids:
                     if self._verify_port(port, self._device_ids[device_type]):
-                        ret_val, connection = await create_task(self._try_open_port(port))
+                        self._timer.clear_device(port.device)
+                        self._timer.start(port.device, TimingPhase.ENUMERATE, scan_start)
+                        self._timer.stop(port.device, TimingPhase.ENUMERATE)
+                        self._timer.start(port.device, TimingPhase.OPEN)
+                        ret_val, connection = await self._try_open_port(port)
                         if ret_val:
-                            self._new_coms.append((device_type, connection))
-                            self._connect_event.set()
+                            self._timer.stop(port.device, TimingPhase.OPEN)
+                            await self._bus.publish(EventTopic.DEVICE_CONNECTED, (device_type, connection))
                         else:
-                            self._connect_err_event.set()
+                            await self._bus.publish(EventTopic.DEVICE_CONN_ERR, port)
                         break
-        self._logger.debug("done")
 
+    @trace
     async def _check_for_disconnects(self, ports: [ListPortInfo]) -> None:
         """
         Check the list of ports against list of known ports for any ports that are no longer in use
@@ -160,16 +120,13 @@ class RSDeviceCommScanner:
         :param ports: List of ports to check
         :return None:
         """
-        self._logger.debug("running")
         for known_port in self._known_ports:
             if known_port not in ports:
                 self._known_ports.remove(known_port)
                 for device_type in self._device_ids:
                     if self._verify_port(known_port, self._device_ids[device_type]):
-                        self._lost_coms.append(known_port)
-                        self._disconnect_event.set()
+                        await self._bus.publish(EventTopic.DEVICE_LOST, known_port)
                         break
-        self._logger.debug("done")
 
     @staticmethod
     def _verify_port(port: ListPortInfo, profile: dict) -> bool:
@@ -0,0 +1,223 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from enum import Enum, auto
+from logging import getLogger
+from asyncio import Task, Semaphore, create_task, gather, wait, wait_for, TimeoutError
+from Model.tracer import trace
+
+
+class TaskKind(Enum):
+    LOOP = auto()
+    SAVE = auto()
+    PORT = auto()
+    EXP = auto()
+    NET = auto()
+    PACKAGE = auto()
+
+
+# How many tasks of each kind may run at once. None means no limit.
+# Saves are limited to one so lines are written to file in the order they were queued.
+# Experiment starts and stops are limited to one so devices never get them out of order.
+# Network requests are limited to one so a slow site is only waited on once.
+# Packaging experiments into .rs files is limited to one and kept apart from SAVE so a long zip never holds up
+# the line writes of the next experiment.
+task_limits = {TaskKind.LOOP: None,
+               TaskKind.SAVE: 1,
+               TaskKind.PORT: 1,
+               TaskKind.EXP: 1,
+               TaskKind.NET: 1,
+               TaskKind.PACKAGE: 1}
+
+
+class KindStats:
+    """ Counters for a single kind of task. """
+    def __init__(self):
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.coalesced = 0
+
+
+class TaskSupervisor:
+    """
+    Owns background tasks for the app. Keeps a reference to every task until it finishes, limits how many tasks
+    of each kind run at once, skips work that is already waiting to run and logs any exception a task raises.
+    """
+    def __init__(self, limits: dict = None):
+        """
+        Initialize the supervisor.
+        :param limits: Concurrency limit for each TaskKind.
+        """
+        self._logger = getLogger(__name__)
+        if limits is None:
+            limits = task_limits
+        self._limits = limits
+        self._semaphores = dict()
+        self._tasks = dict()
+        self._pending = dict()
+        self._stats = dict()
+        for kind in TaskKind:
+            self._tasks[kind] = set()
+            self._stats[kind] = KindStats()
+        self._closing = False
+
+    def spawn(self, kind: TaskKind, func, *args, key=None) -> Task:
+        """
+        Run func(*args) as a supervised task.
+        :param kind: The kind of work this is.
+        :param func: The coroutine function to run.
+        :param args: Arguments for func.
+        :param key: If given and a task with this key is still waiting to run, return that task instead of
+                    making a new one.
+        :return Task: The task doing the work, or None if the supervisor is shutting down.
+        """
+        if self._closing:
+            return None
+        if key is not None and key in self._pending:
+            self._stats[kind].coalesced += 1
+            return self._pending[key]
+        task = create_task(self._run(kind, key, func, args),
+                           name=kind.name + " " + getattr(func, "__qualname__", type(func).__name__))
+        if key is not None:
+            self._pending[key] = task
+        self._tasks[kind].add(task)
+        task.add_done_callback(lambda t: self._task_done(kind, key, t))
+        return task
+
+    def get_count(self, kind: TaskKind) -> int:
+        """
+        :param kind: The kind of task to count.
+        :return int: How many tasks of this kind are waiting or running.
+        """
+        return len(self._tasks[kind])
+
+    def get_stats(self) -> [(str, int, int, int, int, int)]:
+        """
+        :return list: (kind, active, started, completed, failed, coalesced) for each kind.
+        """
+        ret = []
+        for kind in TaskKind:
+            stats = self._stats[kind]
+            ret.append((kind.name, len(self._tasks[kind]), stats.started, stats.completed, stats.failed,
+                        stats.coalesced))
+        return ret
+
+    async def drain(self, kind: TaskKind, timeout: float = None) -> bool:
+        """
+        Wait for every task of kind that exists now or is spawned while waiting to finish.
+        :param kind: The kind of task to wait for.
+        :param timeout: Give up after this many seconds. None waits forever.
+        :return bool: True if all tasks finished in time.
+        """
+        try:
+            await wait_for(self._wait_kind(kind), timeout)
+            return True
+        except TimeoutError:
+            self._logger.warning("Timed out waiting for " + kind.name + " tasks to finish.")
+            return False
+
+    @trace
+    async def shutdown(self, timeout: float = 5) -> None:
+        """
+        Stop accepting new work, cancel every task and wait for them to finish.
+        :param timeout: How long to wait for cancelled tasks to finish.
+        :return None:
+        """
+        self._closing = True
+        tasks = [task for kind in TaskKind for task in self._tasks[kind]]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await wait(tasks, timeout=timeout)
+
+    async def _wait_kind(self, kind: TaskKind) -> None:
+        """
+        Wait until there are no tasks of kind left.
+        :param kind: The kind of task to wait for.
+        :return None:
+        """
+        while self._tasks[kind]:
+            await gather(*self._tasks[kind], return_exceptions=True)
+
+    async def _run(self, kind: TaskKind, key, func, args) -> None:
+        """
+        Wait for a free slot for this kind of task then do the work.
+        :param kind: The kind of work.
+        :param key: The coalescing key, if any.
+        :param func: The coroutine function to run.
+        :param args: Arguments for func.
+        :return: Whatever func returns.
+        """
+        limit = self._limits.get(kind)
+        if limit is None:
+            self._start(kind, key)
+            return await func(*args)
+        if kind not in self._semaphores:
+            self._semaphores[kind] = Semaphore(limit)
+        async with self._semaphores[kind]:
+            self._start(kind, key)
+            return await func(*args)
+
+    def _start(self, kind: TaskKind, key) -> None:
+        """
+        Mark a task as running so new work with the same key is no longer merged into it.
+        :param kind: The kind of work.
+        :param key: The coalescing key, if any.
+        :return None:
+        """
+        self._stats[kind].started += 1
+        if key is not None:
+            self._pending.pop(key, None)
+
+    def _task_done(self, kind: TaskKind, key, task: Task) -> None:
+        """
+        Forget a finished task and report any exception it raised.
+        :param kind: The kind of work.
+        :param key: The coalescing key, if any.
+        :param task: The finished task.
+        :return None:
+        """
+        self._tasks[kind].discard(task)
+        if key is not None and self._pending.get(key) is task:
+            del self._pending[key]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            self._stats[kind].failed += 1
+            self._logger.error(kind.name + " task failed.", exc_info=(type(exc), exc, exc.__traceback__))
+        else:
+            self._stats[kind].completed += 1
+
+
+_supervisor = TaskSupervisor()
+
+
+def get_supervisor() -> TaskSupervisor:
+    """
+    :return TaskSupervisor: The app wide task supervisor.
+    """
+    return _supervisor
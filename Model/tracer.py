@@ -0,0 +1,204 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from time import perf_counter
+from functools import wraps
+from threading import get_ident
+from collections import deque
+from inspect import iscoroutinefunction
+
+# How many spans are kept. Older spans are dropped once this is reached.
+default_capacity = 65536
+
+
+class TraceSpan:
+    """ A single traced call. """
+    __slots__ = ("name", "start", "end", "thread")
+
+    def __init__(self, name: str, start: float, end: float, thread: int):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.thread = thread
+
+    def get_duration(self) -> float:
+        """
+        :return float: The length of this span in seconds.
+        """
+        return self.end - self.start
+
+
+class _NullSpan:
+    """ Context manager that does nothing, used when tracing is off. """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _Span:
+    """ Context manager that records a span on exit. """
+    __slots__ = ("_tracer", "_name", "_start")
+
+    def __init__(self, tracer, name: str):
+        self._tracer = tracer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self._tracer.record(self._name, self._start, perf_counter())
+        return False
+
+
+_null_span = _NullSpan()
+
+
+class Tracer:
+    """
+    Records enter and exit times of traced calls. Off by default. While off, traced calls only pay for one
+    attribute check.
+    """
+    def __init__(self, capacity: int = default_capacity):
+        self.enabled = False
+        self._origin = perf_counter()
+        self._spans = deque(maxlen=capacity)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Turn tracing on or off.
+        :param enabled: Whether to record spans.
+        :return None:
+        """
+        self.enabled = bool(enabled)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Store a finished span.
+        :param name: The name of the traced code.
+        :param start: perf_counter value at entry.
+        :param end: perf_counter value at exit.
+        :return None:
+        """
+        self._spans.append(TraceSpan(name, start, end, get_ident()))
+
+    def span(self, name: str):
+        """
+        Context manager that traces the code inside it.
+        :param name: The name to record the span under.
+        :return: A context manager.
+        """
+        if not self.enabled:
+            return _null_span
+        return _Span(self, name)
+
+    def get_spans(self) -> [TraceSpan]:
+        """
+        :return list: All recorded spans, oldest first.
+        """
+        return list(self._spans)
+
+    def get_stats(self) -> [tuple]:
+        """
+        :return list: (name, calls, total ms, max ms) for each traced name, slowest total first.
+        """
+        stats = dict()
+        for span in self._spans:
+            duration = span.get_duration()
+            calls, total, longest = stats.get(span.name, (0, 0.0, 0.0))
+            stats[span.name] = (calls + 1, total + duration, max(longest, duration))
+        rows = [(name, calls, round(total * 1000, 3), round(longest * 1000, 3))
+                for name, (calls, total, longest) in stats.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def clear(self) -> None:
+        """
+        Forget all recorded spans.
+        :return None:
+        """
+        self._spans.clear()
+
+    def export_csv(self, filename: str) -> None:
+        """
+        Write all recorded spans to a csv file.
+        :param filename: The file to write to.
+        :return None:
+        """
+        with open(filename, "w") as file:
+            file.write("name, thread, start (ms), duration (ms)\n")
+            for span in self.get_spans():
+                file.write(span.name + ", " + str(span.thread) + ", "
+                           + str(round((span.start - self._origin) * 1000, 3)) + ", "
+                           + str(round(span.get_duration() * 1000, 3)) + "\n")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    :return Tracer: The app wide tracer.
+    """
+    return _tracer
+
+
+def trace(func):
+    """
+    Decorator that records a span for each call to func while tracing is on. Works on plain and async functions.
+    :param func: The function to trace.
+    :return: The wrapped function.
+    """
+    name = func.__module__ + "." + func.__qualname__
+    tracer = _tracer
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                tracer.record(name, start, perf_counter())
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            tracer.record(name, start, perf_counter())
+    return wrapper
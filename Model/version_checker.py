@@ -25,66 +25,137 @@ https://redscientific.com/index.html
 """
 
 
-from logging import getLogger, StreamHandler
-from urllib3 import PoolManager
-from Model.app_defs import version_url, current_version
+import os
+import json
+import tempfile
+from time import time
+from logging import getLogger
+from asyncio import get_running_loop, wait_for, TimeoutError
+from Model.app_defs import version_url, current_version, version_cache_filename, version_cache_ttl, \
+    version_check_timeout
+from Model.tracer import trace
 
 
 class VersionChecker:
     """
-    Checks version number against latest version from the site
+    Checks version number against latest version from the site. The check runs off the event loop with a timeout
+    and its result is cached on disk so most launches never touch the network.
     """
 
-    def __init__(self, log_handlers: [StreamHandler]):
+    def __init__(self, url: str = version_url, cache_file: str = None, ttl: float = version_cache_ttl,
+                 timeout: float = version_check_timeout):
         """
         Initialize the version checker
+        :param url: Where to get the latest version from.
+        :param cache_file: Where to cache the latest version. Defaults to a file in the temp folder.
+        :param ttl: How long in seconds a cached version is used before asking the site again.
+        :param timeout: Longest time in seconds to wait on the site.
         :return None:
         """
         self.logger = getLogger(__name__)
-        for h in log_handlers:
-            self.logger.addHandler(h)
         self.logger.debug("Initializing")
-        self.latest_version = self.get_latest_version()
+        self._url = url
+        if cache_file is None:
+            cache_file = os.path.join(tempfile.gettempdir(), version_cache_filename)
+        self._cache_file = cache_file
+        self._ttl = ttl
+        self._timeout = timeout
+        self.latest_version = None  # None until update() has run.
         self.logger.debug("Initialized")
 
+    @trace
     def check_version(self) -> int:
         """
-        Compare version numbers.
+        Compare version numbers. Uses the result of the last update().
         :return int:
             return -1 if unable to get the latest version
             return 1 if the latest version is newer than the app current version
             return 0 otherwise
         """
-        self.logger.debug("running")
-        if self.latest_version < 0:
-            self.logger.debug("done")
+        if self.latest_version is None or self.latest_version < 0:
             return -1
         elif self.latest_version > current_version:
-            self.logger.debug("done")
             return 1
-        self.logger.debug("done")
         return 0
 
-    # TODO: Figure out if urllib3 is blocking. Check out https://docs.aiohttp.org/en/stable/ for ideas.
-    #  This is probably overkill since this function is only called once at app startup.
+    @trace
+    async def update(self, use_cache: bool = True) -> float:
+        """
+        Get the latest version number, from the cache if it is fresh enough, otherwise from the site. Failures
+        are not cached so the next update tries the site again.
+        :param use_cache: Whether a fresh cached version may be used.
+        :return float: The latest version number, or -1.0 if it could not be found.
+        """
+        if use_cache:
+            cached = self._read_cache()
+            if cached is not None:
+                self.latest_version = cached
+                return cached
+        try:
+            latest_version = await wait_for(get_running_loop().run_in_executor(None, self.get_latest_version),
+                                            self._timeout)
+        except TimeoutError:
+            self.logger.warning("timed out after " + str(self._timeout) + " seconds")
+            latest_version = -1.0
+        if latest_version >= 0:
+            self._write_cache(latest_version)
+        self.latest_version = latest_version
+        return latest_version
+
     def get_latest_version(self) -> float:
         """
-        Connect to site at version_url and retrieve latest version number.
+        Connect to the site and retrieve latest version number. Blocks, so run it in an executor.
         :return float:
             return -1.0 if unable to get version
             return version number otherwise
         """
-        self.logger.debug("running")
-        mgr = PoolManager()
+        from urllib3 import PoolManager, Timeout  # Imported here since urllib3 is slow to load and only used once.
+        mgr = PoolManager(timeout=Timeout(total=self._timeout), retries=False)
         try:
-            r = mgr.request("GET", version_url)
-        except Exception:
-            self.logger.exception("failed, could not connect to url")
+            r = mgr.request("GET", self._url)
+        except Exception as e:
+            self.logger.warning("failed, could not connect to url: " + repr(e))
             return -1.0
-        data = str(r.data)
-        if "Companion App Version:" in data:
-            latest_version = data[data.index(":") + 1:].rstrip("\\n'")
-            self.logger.debug("done, found version")
-            return float(latest_version)
-        self.logger.debug("done, didn't find version")
+        finally:
+            mgr.clear()
+        return parse_version(r.data.decode(errors="replace")) if r.status == 200 else -1.0
+
+    def _read_cache(self) -> float:
+        """
+        :return float: The cached version number, or None if there is none or it is older than the ttl.
+        """
+        try:
+            with open(self._cache_file, "r") as file:
+                cache = json.load(file)
+            age = time() - cache["checked"]
+            if cache["url"] == self._url and 0 <= age < self._ttl:
+                return float(cache["version"])
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self.logger.exception("failed reading version cache")
+        return None
+
+    def _write_cache(self, latest_version: float) -> None:
+        """
+        :param latest_version: The version number to cache.
+        :return None:
+        """
+        try:
+            with open(self._cache_file, "w") as file:
+                json.dump({"url": self._url, "version": latest_version, "checked": time()}, file)
+        except OSError:
+            self.logger.exception("failed writing version cache")
+
+
+def parse_version(text: str) -> float:
+    """
+    :param text: The version file, which looks like "Companion App Version: 2.0".
+    :return float: The version number, or -1.0 if text is not a version file.
+    """
+    if "Companion App Version:" not in text:
+        return -1.0
+    try:
+        return float(text[text.index(":") + 1:].strip())
+    except ValueError:
         return -1.0
@@ -39,6 +39,7 @@ class StringsEnum(Enum):
     NO_UPDATE = auto()
     ERR_UPDATE_CHECK = auto()
     DEV_CON_ERR = auto()
+    EXP_START_ERR = auto()
     LOG_OUT_NAME = auto()
     RESTART_PROG = auto()
     UPDATE_HDR = auto()
@@ -82,6 +83,8 @@ english = {StringsEnum.COMPANY_NAME: company_name,
                                          " https://redscientific.com/downloads.html manually or contact Red Scientific"
                                          " directly.",
            StringsEnum.DEV_CON_ERR: "There was a problem connecting the device, please retry connection.",
+           StringsEnum.EXP_START_ERR: "A device could not be started, so the experiment was not started. Check the"
+                                      " device connections and try again.",
            StringsEnum.RESTART_PROG: "This app must restart for changes to take effect."
            }
 
@@ -122,6 +125,8 @@ french = {StringsEnum.COMPANY_NAME: company_name,
                                         " Veuillez vérifier https://redscientific.com/downloads.html manuellement"
                                         " ou contacter directement Red Scientific.",
           StringsEnum.DEV_CON_ERR: "Un problème est survenu lors de la connexion de l'appareil. Veuillez réessayer.",
+          StringsEnum.EXP_START_ERR: "Un appareil n'a pas pu être démarré, l'expérience n'a donc pas démarré."
+                                     " Vérifiez les connexions des appareils et réessayez.",
           StringsEnum.RESTART_PROG: "Cette application doit redémarrer pour que les modifications prennent effet."
           }
 
@@ -162,6 +167,8 @@ german = {StringsEnum.COMPANY_NAME: company_name,
                                         " manuell oder wenden Sie sich direkt an Red Scientific.",
           StringsEnum.DEV_CON_ERR: "Beim Anschließen des Geräts ist ein Problem aufgetreten. Versuchen Sie erneut,"
                                    " die Verbindung herzustellen.",
+          StringsEnum.EXP_START_ERR: "Ein Gerät konnte nicht gestartet werden, daher wurde das Experiment nicht"
+                                     " gestartet. Überprüfen Sie die Geräteverbindungen und versuchen Sie es erneut.",
           StringsEnum.RESTART_PROG: "Diese App muss neu gestartet werden, damit die Änderungen wirksam werden."
           }
 
@@ -201,6 +208,8 @@ spanish = {StringsEnum.COMPANY_NAME: company_name,
                                          " Consulte https://redscientific.com/downloads.html manualmente o comuníquese"
                                          " directamente con Red Scientific.",
            StringsEnum.DEV_CON_ERR: "Hubo un problema al conectar el dispositivo. Vuelva a intentar la conexión.",
+           StringsEnum.EXP_START_ERR: "No se pudo iniciar un dispositivo, por lo que el experimento no se inició."
+                                      " Revise las conexiones de los dispositivos y vuelva a intentarlo.",
            StringsEnum.RESTART_PROG: "Esta aplicación debe reiniciarse para que los cambios surtan efecto."
            }
 
@@ -231,6 +240,7 @@ chinese = {StringsEnum.COMPANY_NAME: company_name,
            StringsEnum.ERR_UPDATE_CHECK: "连接到存储库时发生意外错误。 请手动检查"
                                          "https://redscientific.com/downloads.html或直接联系Red Scientific。",
            StringsEnum.DEV_CON_ERR: "连接设备时出现问题，请重试连接。",
+           StringsEnum.EXP_START_ERR: "有设备无法启动，因此实验未开始。请检查设备连接后重试。",
            StringsEnum.RESTART_PROG: "此应用必须重新启动才能使更改生效。"
            }
 
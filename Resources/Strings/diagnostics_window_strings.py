@@ -0,0 +1,213 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from Model.app_defs import LangEnum
+from enum import Enum, auto
+
+
+class StringsEnum(Enum):
+    TITLE = auto()
+    TIMING_TAB = auto()
+    DEVICE_COL = auto()
+    PHASE_COL = auto()
+    START_COL = auto()
+    DURATION_COL = auto()
+    EVENTS_TAB = auto()
+    TOPIC_COL = auto()
+    SUBSCRIBERS_COL = auto()
+    DEPTH_COL = auto()
+    PEAK_DEPTH_COL = auto()
+    PUBLISHED_COL = auto()
+    DROPPED_COL = auto()
+    TASKS_TAB = auto()
+    KIND_COL = auto()
+    ACTIVE_COL = auto()
+    STARTED_COL = auto()
+    COMPLETED_COL = auto()
+    FAILED_COL = auto()
+    COALESCED_COL = auto()
+    METRICS_TAB = auto()
+    METRIC_COL = auto()
+    LABELS_COL = auto()
+    VALUE_COL = auto()
+    RATE_COL = auto()
+    REFRESH = auto()
+    EXPORT = auto()
+
+
+english = {StringsEnum.TITLE: "Diagnostics",
+           StringsEnum.TIMING_TAB: "Device timing",
+           StringsEnum.DEVICE_COL: "Device",
+           StringsEnum.PHASE_COL: "Phase",
+           StringsEnum.START_COL: "Start (ms)",
+           StringsEnum.DURATION_COL: "Duration (ms)",
+           StringsEnum.EVENTS_TAB: "Event queues",
+           StringsEnum.TOPIC_COL: "Topic",
+           StringsEnum.SUBSCRIBERS_COL: "Subscribers",
+           StringsEnum.DEPTH_COL: "Depth",
+           StringsEnum.PEAK_DEPTH_COL: "Peak depth",
+           StringsEnum.PUBLISHED_COL: "Published",
+           StringsEnum.DROPPED_COL: "Dropped",
+           StringsEnum.TASKS_TAB: "Background tasks",
+           StringsEnum.KIND_COL: "Kind",
+           StringsEnum.ACTIVE_COL: "Active",
+           StringsEnum.STARTED_COL: "Started",
+           StringsEnum.COMPLETED_COL: "Completed",
+           StringsEnum.FAILED_COL: "Failed",
+           StringsEnum.COALESCED_COL: "Merged",
+           StringsEnum.METRICS_TAB: "Metrics",
+           StringsEnum.METRIC_COL: "Metric",
+           StringsEnum.LABELS_COL: "Labels",
+           StringsEnum.VALUE_COL: "Value",
+           StringsEnum.RATE_COL: "Rate (/s)",
+           StringsEnum.REFRESH: "Refresh",
+           StringsEnum.EXPORT: "Export",
+           }
+
+# TODO: Verify French
+french = {StringsEnum.TITLE: "Diagnostics",
+          StringsEnum.TIMING_TAB: "Chronométrage des appareils",
+          StringsEnum.DEVICE_COL: "Appareil",
+          StringsEnum.PHASE_COL: "Phase",
+          StringsEnum.START_COL: "Début (ms)",
+          StringsEnum.DURATION_COL: "Durée (ms)",
+          StringsEnum.EVENTS_TAB: "Files d'événements",
+          StringsEnum.TOPIC_COL: "Sujet",
+          StringsEnum.SUBSCRIBERS_COL: "Abonnés",
+          StringsEnum.DEPTH_COL: "Profondeur",
+          StringsEnum.PEAK_DEPTH_COL: "Profondeur max",
+          StringsEnum.PUBLISHED_COL: "Publiés",
+          StringsEnum.DROPPED_COL: "Perdus",
+          StringsEnum.TASKS_TAB: "Tâches de fond",
+          StringsEnum.KIND_COL: "Type",
+          StringsEnum.ACTIVE_COL: "Actives",
+          StringsEnum.STARTED_COL: "Démarrées",
+          StringsEnum.COMPLETED_COL: "Terminées",
+          StringsEnum.FAILED_COL: "Échouées",
+          StringsEnum.COALESCED_COL: "Fusionnées",
+          StringsEnum.METRICS_TAB: "Métriques",
+          StringsEnum.METRIC_COL: "Métrique",
+          StringsEnum.LABELS_COL: "Étiquettes",
+          StringsEnum.VALUE_COL: "Valeur",
+          StringsEnum.RATE_COL: "Débit (/s)",
+          StringsEnum.REFRESH: "Actualiser",
+          StringsEnum.EXPORT: "Exporter",
+          }
+
+# TODO: Verify German
+german = {StringsEnum.TITLE: "Diagnose",
+          StringsEnum.TIMING_TAB: "Gerätezeitmessung",
+          StringsEnum.DEVICE_COL: "Gerät",
+          StringsEnum.PHASE_COL: "Phase",
+          StringsEnum.START_COL: "Beginn (ms)",
+          StringsEnum.DURATION_COL: "Dauer (ms)",
+          StringsEnum.EVENTS_TAB: "Ereigniswarteschlangen",
+          StringsEnum.TOPIC_COL: "Thema",
+          StringsEnum.SUBSCRIBERS_COL: "Abonnenten",
+          StringsEnum.DEPTH_COL: "Tiefe",
+          StringsEnum.PEAK_DEPTH_COL: "Maximale Tiefe",
+          StringsEnum.PUBLISHED_COL: "Veröffentlicht",
+          StringsEnum.DROPPED_COL: "Verworfen",
+          StringsEnum.TASKS_TAB: "Hintergrundaufgaben",
+          StringsEnum.KIND_COL: "Art",
+          StringsEnum.ACTIVE_COL: "Aktiv",
+          StringsEnum.STARTED_COL: "Gestartet",
+          StringsEnum.COMPLETED_COL: "Abgeschlossen",
+          StringsEnum.FAILED_COL: "Fehlgeschlagen",
+          StringsEnum.COALESCED_COL: "Zusammengeführt",
+          StringsEnum.METRICS_TAB: "Metriken",
+          StringsEnum.METRIC_COL: "Metrik",
+          StringsEnum.LABELS_COL: "Labels",
+          StringsEnum.VALUE_COL: "Wert",
+          StringsEnum.RATE_COL: "Rate (/s)",
+          StringsEnum.REFRESH: "Aktualisieren",
+          StringsEnum.EXPORT: "Exportieren",
+          }
+
+# TODO: Verify Spanish
+spanish = {StringsEnum.TITLE: "Diagnóstico",
+           StringsEnum.TIMING_TAB: "Tiempos de dispositivos",
+           StringsEnum.DEVICE_COL: "Dispositivo",
+           StringsEnum.PHASE_COL: "Fase",
+           StringsEnum.START_COL: "Inicio (ms)",
+           StringsEnum.DURATION_COL: "Duración (ms)",
+           StringsEnum.EVENTS_TAB: "Colas de eventos",
+           StringsEnum.TOPIC_COL: "Tema",
+           StringsEnum.SUBSCRIBERS_COL: "Suscriptores",
+           StringsEnum.DEPTH_COL: "Profundidad",
+           StringsEnum.PEAK_DEPTH_COL: "Profundidad máxima",
+           StringsEnum.PUBLISHED_COL: "Publicados",
+           StringsEnum.DROPPED_COL: "Descartados",
+           StringsEnum.TASKS_TAB: "Tareas en segundo plano",
+           StringsEnum.KIND_COL: "Tipo",
+           StringsEnum.ACTIVE_COL: "Activas",
+           StringsEnum.STARTED_COL: "Iniciadas",
+           StringsEnum.COMPLETED_COL: "Completadas",
+           StringsEnum.FAILED_COL: "Fallidas",
+           StringsEnum.COALESCED_COL: "Combinadas",
+           StringsEnum.METRICS_TAB: "Métricas",
+           StringsEnum.METRIC_COL: "Métrica",
+           StringsEnum.LABELS_COL: "Etiquetas",
+           StringsEnum.VALUE_COL: "Valor",
+           StringsEnum.RATE_COL: "Tasa (/s)",
+           StringsEnum.REFRESH: "Actualizar",
+           StringsEnum.EXPORT: "Exportar",
+           }
+
+# TODO: Verify Chinese (simplified)
+chinese = {StringsEnum.TITLE: "诊断",
+           StringsEnum.TIMING_TAB: "设备计时",
+           StringsEnum.DEVICE_COL: "设备",
+           StringsEnum.PHASE_COL: "阶段",
+           StringsEnum.START_COL: "开始 (ms)",
+           StringsEnum.DURATION_COL: "持续时间 (ms)",
+           StringsEnum.EVENTS_TAB: "事件队列",
+           StringsEnum.TOPIC_COL: "主题",
+           StringsEnum.SUBSCRIBERS_COL: "订阅者",
+           StringsEnum.DEPTH_COL: "深度",
+           StringsEnum.PEAK_DEPTH_COL: "最大深度",
+           StringsEnum.PUBLISHED_COL: "已发布",
+           StringsEnum.DROPPED_COL: "已丢弃",
+           StringsEnum.TASKS_TAB: "后台任务",
+           StringsEnum.KIND_COL: "类型",
+           StringsEnum.ACTIVE_COL: "活动",
+           StringsEnum.STARTED_COL: "已开始",
+           StringsEnum.COMPLETED_COL: "已完成",
+           StringsEnum.FAILED_COL: "失败",
+           StringsEnum.COALESCED_COL: "已合并",
+           StringsEnum.METRICS_TAB: "指标",
+           StringsEnum.METRIC_COL: "指标",
+           StringsEnum.LABELS_COL: "标签",
+           StringsEnum.VALUE_COL: "数值",
+           StringsEnum.RATE_COL: "速率 (/s)",
+           StringsEnum.REFRESH: "刷新",
+           StringsEnum.EXPORT: "导出",
+           }
+
+strings = {LangEnum.ENG: english,
+           LangEnum.FRE: french,
+           LangEnum.GER: german,
+           LangEnum.SPA: spanish,
+           LangEnum.CHI: chinese}
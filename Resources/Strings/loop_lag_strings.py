@@ -0,0 +1,81 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from Model.app_defs import LangEnum
+from enum import Enum, auto
+
+
+class StringsEnum(Enum):
+    TITLE = auto()
+    CURRENT = auto()
+    WORST = auto()
+    STALLS = auto()
+    HIST_TIP = auto()
+
+
+english = {StringsEnum.TITLE: "Responsiveness",
+           StringsEnum.CURRENT: "Lag (ms):",
+           StringsEnum.WORST: "Worst (ms):",
+           StringsEnum.STALLS: "Stalls:",
+           StringsEnum.HIST_TIP: "Lag histogram (ms)",
+           }
+
+# TODO: Verify French
+french = {StringsEnum.TITLE: "Réactivité",
+          StringsEnum.CURRENT: "Retard actuel (ms):",
+          StringsEnum.WORST: "Pire retard (ms):",
+          StringsEnum.STALLS: "Blocages:",
+          StringsEnum.HIST_TIP: "Histogramme du retard (ms)",
+          }
+
+# TODO: Verify German
+german = {StringsEnum.TITLE: "Reaktionsfähigkeit",
+          StringsEnum.CURRENT: "Verzögerung jetzt (ms):",
+          StringsEnum.WORST: "Größte Verzögerung (ms):",
+          StringsEnum.STALLS: "Blockaden:",
+          StringsEnum.HIST_TIP: "Verzögerungshistogramm (ms)",
+          }
+
+# TODO: Verify Spanish
+spanish = {StringsEnum.TITLE: "Capacidad de respuesta",
+           StringsEnum.CURRENT: "Retraso actual (ms):",
+           StringsEnum.WORST: "Peor retraso (ms):",
+           StringsEnum.STALLS: "Bloqueos:",
+           StringsEnum.HIST_TIP: "Histograma de retraso (ms)",
+           }
+
+# TODO: Verify Chinese (simplified)
+chinese = {StringsEnum.TITLE: "响应性",
+           StringsEnum.CURRENT: "当前延迟 (ms):",
+           StringsEnum.WORST: "最大延迟 (ms):",
+           StringsEnum.STALLS: "卡顿:",
+           StringsEnum.HIST_TIP: "延迟直方图 (ms)",
+           }
+
+strings = {LangEnum.ENG: english,
+           LangEnum.FRE: french,
+           LangEnum.GER: german,
+           LangEnum.SPA: spanish,
+           LangEnum.CHI: chinese}
@@ -33,35 +33,53 @@ class StringsEnum(Enum):
     TITLE = auto()
     CLOSE_TITLE = auto()
     CLOSE_APP_CONFIRM = auto()
+    SAVING_TITLE = auto()
+    SAVING_TEXT = auto()
+    FORCE_QUIT = auto()
 
 
 english = {StringsEnum.TITLE: app_name,
            StringsEnum.CLOSE_TITLE: "Close " + company_name,
-           StringsEnum.CLOSE_APP_CONFIRM: "Close app? Any unsaved progress will be lost!",
+           StringsEnum.CLOSE_APP_CONFIRM: "Close app? The current experiment will be ended and saved.",
+           StringsEnum.SAVING_TITLE: "Saving",
+           StringsEnum.SAVING_TEXT: "Saving experiment data before closing...",
+           StringsEnum.FORCE_QUIT: "Quit now",
            }
 
 # TODO: Verify French
 french = {StringsEnum.TITLE: app_name,
           StringsEnum.CLOSE_TITLE: "Fermer " + company_name,
-          StringsEnum.CLOSE_APP_CONFIRM: "Fermer l'application? Tout progrès non enregistré sera perdu!",
+          StringsEnum.CLOSE_APP_CONFIRM: "Fermer l'application? L'expérience en cours sera terminée et enregistrée.",
+          StringsEnum.SAVING_TITLE: "Enregistrement",
+          StringsEnum.SAVING_TEXT: "Enregistrement des données de l'expérience avant la fermeture...",
+          StringsEnum.FORCE_QUIT: "Quitter maintenant",
           }
 
 # TODO: Verify German
 german = {StringsEnum.TITLE: app_name,
           StringsEnum.CLOSE_TITLE: "Schließen " + company_name,
-          StringsEnum.CLOSE_APP_CONFIRM: "App schließen? Jeder nicht gespeicherte Fortschritt geht verloren!",
+          StringsEnum.CLOSE_APP_CONFIRM: "App schließen? Das aktuelle Experiment wird beendet und gespeichert.",
+          StringsEnum.SAVING_TITLE: "Speichern",
+          StringsEnum.SAVING_TEXT: "Experimentdaten werden vor dem Schließen gespeichert...",
+          StringsEnum.FORCE_QUIT: "Jetzt beenden",
           }
 
 # TODO: Verify Spanish
 spanish = {StringsEnum.TITLE: app_name,
            StringsEnum.CLOSE_TITLE: "Cerrar " + company_name,
-           StringsEnum.CLOSE_APP_CONFIRM: "¿Cerrar app? ¡Cualquier progreso no guardado se perderá!",
+           StringsEnum.CLOSE_APP_CONFIRM: "¿Cerrar app? El experimento actual se terminará y se guardará.",
+           StringsEnum.SAVING_TITLE: "Guardando",
+           StringsEnum.SAVING_TEXT: "Guardando los datos del experimento antes de cerrar...",
+           StringsEnum.FORCE_QUIT: "Salir ahora",
            }
 
 # TODO: Verify Chinese (simplified)
 chinese = {StringsEnum.TITLE: app_name,
            StringsEnum.CLOSE_TITLE: "关闭 " + company_name,
-           StringsEnum.CLOSE_APP_CONFIRM: "关闭应用程式？ 任何未保存的进度将丢失！",
+           StringsEnum.CLOSE_APP_CONFIRM: "关闭应用程式？ 当前实验将被结束并保存。",
+           StringsEnum.SAVING_TITLE: "正在保存",
+           StringsEnum.SAVING_TEXT: "正在关闭前保存实验数据...",
+           StringsEnum.FORCE_QUIT: "立即退出",
            }
 
 strings = {LangEnum.ENG: english,
@@ -36,6 +36,8 @@ class StringsEnum(Enum):
     ABOUT_COMPANY = auto()
     UPDATE_CHECK = auto()
     SHOW_LOG_WINDOW = auto()
+    SHOW_DIAGNOSTICS = auto()
+    PROFILE = auto()
     USE_CAMS = auto
     ATTACHED_CAMS = auto()
     SETTINGS = auto()
@@ -64,6 +66,8 @@ english = {StringsEnum.FILE: "File",
            StringsEnum.ABOUT_COMPANY: "About " + company_name,
            StringsEnum.UPDATE_CHECK: "Check For Updates",
            StringsEnum.SHOW_LOG_WINDOW: "Show log window",
+           StringsEnum.SHOW_DIAGNOSTICS: "Show diagnostics",
+           StringsEnum.PROFILE: "Profile app",
            StringsEnum.USE_CAMS: "Use cameras",
            StringsEnum.ATTACHED_CAMS: "Attached Camera",
            StringsEnum.SETTINGS: "Settings",
@@ -86,6 +90,8 @@ french = {StringsEnum.FILE: "Fichier",
           StringsEnum.ABOUT_COMPANY: "À propos de " + company_name,
           StringsEnum.UPDATE_CHECK: "Vérifier les mises à jour",
           StringsEnum.SHOW_LOG_WINDOW: "Afficher la fenêtre du journal",
+          StringsEnum.SHOW_DIAGNOSTICS: "Afficher les diagnostics",
+          StringsEnum.PROFILE: "Profiler l'application",
           StringsEnum.USE_CAMS: "Utiliser des caméras",
           StringsEnum.ATTACHED_CAMS: "Caméra attachée",
           StringsEnum.SETTINGS: "Réglages",
@@ -108,6 +114,8 @@ german = {StringsEnum.FILE: "Datei",
           StringsEnum.ABOUT_COMPANY: "Über " + company_name,
           StringsEnum.UPDATE_CHECK: "Auf Updates prüfen",
           StringsEnum.SHOW_LOG_WINDOW: "Protokollfenster anzeigen",
+          StringsEnum.SHOW_DIAGNOSTICS: "Diagnose anzeigen",
+          StringsEnum.PROFILE: "App profilieren",
           StringsEnum.USE_CAMS: "Verwenden Sie Kameras",
           StringsEnum.ATTACHED_CAMS: "Angebrachte Kamera",
           StringsEnum.SETTINGS: "die Einstellungen",
@@ -130,6 +138,8 @@ spanish = {StringsEnum.FILE: "Expediente",
            StringsEnum.ABOUT_COMPANY: "Acerca de " + company_name,
            StringsEnum.UPDATE_CHECK: "Buscar actualizaciones",
            StringsEnum.SHOW_LOG_WINDOW: "Mostrar ventana de registro",
+           StringsEnum.SHOW_DIAGNOSTICS: "Mostrar diagnóstico",
+           StringsEnum.PROFILE: "Perfilar la aplicación",
            StringsEnum.USE_CAMS: "Usar cámaras",
            StringsEnum.ATTACHED_CAMS: "Cámara adjunta",
            StringsEnum.SETTINGS: "Configuraciones",
@@ -152,6 +162,8 @@ chinese = {StringsEnum.FILE: "文件",
            StringsEnum.ABOUT_COMPANY: "关于 " + company_name,
            StringsEnum.UPDATE_CHECK: "检查更新",
            StringsEnum.SHOW_LOG_WINDOW: "显示日志窗口",
+           StringsEnum.SHOW_DIAGNOSTICS: "显示诊断",
+           StringsEnum.PROFILE: "分析应用性能",
            StringsEnum.USE_CAMS: "使用相机",
            StringsEnum.ATTACHED_CAMS: "附属相机",
            StringsEnum.SETTINGS: "应用程式设定",
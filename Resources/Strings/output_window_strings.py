@@ -31,17 +31,38 @@ from enum import Enum, auto
 
 class StringsEnum(Enum):
     TITLE = auto()
+    LEVEL = auto()
+    MODULE = auto()
 
 
-english = {StringsEnum.TITLE: app_name}
+english = {StringsEnum.TITLE: app_name,
+           StringsEnum.LEVEL: "Level",
+           StringsEnum.MODULE: "Module filter",
+           }
 
-french = {StringsEnum.TITLE: app_name}
+# TODO: Verify French
+french = {StringsEnum.TITLE: app_name,
+          StringsEnum.LEVEL: "Niveau",
+          StringsEnum.MODULE: "Filtre de module",
+          }
 
-german = {StringsEnum.TITLE: app_name}
+# TODO: Verify German
+german = {StringsEnum.TITLE: app_name,
+          StringsEnum.LEVEL: "Stufe",
+          StringsEnum.MODULE: "Modulfilter",
+          }
 
-spanish = {StringsEnum.TITLE: app_name}
+# TODO: Verify Spanish
+spanish = {StringsEnum.TITLE: app_name,
+           StringsEnum.LEVEL: "Nivel",
+           StringsEnum.MODULE: "Filtro de módulo",
+           }
 
-chinese = {StringsEnum.TITLE: app_name}
+# TODO: Verify Chinese (simplified)
+chinese = {StringsEnum.TITLE: app_name,
+           StringsEnum.LEVEL: "级别",
+           StringsEnum.MODULE: "模块筛选",
+           }
 
 strings = {LangEnum.ENG: english,
            LangEnum.FRE: french,
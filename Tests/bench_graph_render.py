@@ -0,0 +1,177 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+# Measures how long graphs take to draw as their data grows, without a display.
+# Run from the project root, for example:
+#   python -m Tests.bench_graph_render --backends painter matplotlib --devices 1 8 --history 100 10000
+# Frame times are measured without tracemalloc. Memory is then measured over a second set of frames that carries on
+# from the first. retained_blocks_per_frame is the net number of memory blocks still held after those frames, divided
+# by the frame count. It shows growth, not how many allocations were made.
+
+import os
+import sys
+import asyncio
+import argparse
+import tracemalloc
+import numpy as np
+from time import perf_counter
+from datetime import datetime, timedelta
+from PySide2.QtWidgets import QApplication
+from Devices.AbstractDevice.View.graph_backend import MATPLOTLIB, PAINTER, THREADED_MATPLOTLIB
+from Devices.AbstractDevice.Model.time_series_buffer import to_epoch
+from Devices.DRT.View.drt_graph import DRTGraph
+from Devices.DRT.Resources.drt_strings import LangEnum
+
+trial_seconds = 4  # Average time between synthetic trials.
+block_trials = 50  # Synthetic trials per block. Each block ends with a gap and a marker.
+
+
+def parse_args(args: [str]) -> argparse.Namespace:
+    """
+    :param args: Command line arguments.
+    :return Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark device graph drawing offscreen.")
+    parser.add_argument("--backends", nargs="+", default=[PAINTER, MATPLOTLIB, THREADED_MATPLOTLIB],
+                        choices=[PAINTER, MATPLOTLIB, THREADED_MATPLOTLIB])
+    parser.add_argument("--devices", nargs="+", type=int, default=[1, 8], help="Graph counts to try.")
+    parser.add_argument("--history", nargs="+", type=int, default=[0, 1000, 10000],
+                        help="Trials already in each graph before measuring.")
+    parser.add_argument("--frames", type=int, default=50, help="Frames to measure per run.")
+    parser.add_argument("--width", type=int, default=600)
+    parser.add_argument("--height", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(args)
+
+
+def fill_history(graph: DRTGraph, trials: int, start: datetime, rng: np.random.Generator) -> datetime:
+    """
+    Put synthetic trials into a graph's data without drawing.
+    :param graph: The graph to fill.
+    :param trials: How many trials to add.
+    :param start: When the first trial happens.
+    :param rng: Where random values come from.
+    :return datetime: When the last trial happened.
+    """
+    names = [x[0] for x in graph._data]
+    timestamp = start
+    for i in range(trials):
+        timestamp += timedelta(seconds=rng.uniform(trial_seconds * 0.75, trial_seconds * 1.25))
+        graph.get_series(names[0]).append(to_epoch(timestamp), rng.normal(500, 120))
+        graph.get_series(names[1]).append(to_epoch(timestamp), rng.integers(0, 3))
+        if i % block_trials == block_trials - 1:
+            graph.add_empty_point(timestamp)
+            graph.add_vert_lines(timestamp)
+    graph.set_new(trials == 0)
+    return timestamp
+
+
+async def run_frames(graphs: [DRTGraph], frames: int, timestamp: datetime,
+                     rng: np.random.Generator) -> ([float], datetime):
+    """
+    Add one trial to every graph then draw every graph, frames times.
+    :param graphs: The graphs to draw.
+    :param frames: How many frames.
+    :param timestamp: When the last trial happened. Graph data must not go back in time.
+    :param rng: Where random values come from.
+    :return tuple: Seconds each frame took, when the last trial added happened.
+    """
+    names = [x[0] for x in graphs[0]._data]
+    times = list()
+    for frame in range(frames):
+        timestamp += timedelta(seconds=trial_seconds)
+        start = perf_counter()
+        for graph in graphs:
+            graph.add_data([[names[0], timestamp, rng.normal(500, 120)], [names[1], timestamp, rng.integers(0, 3)]])
+            await graph.plot()
+            graph.repaint()
+        times.append(perf_counter() - start)
+    return times, timestamp
+
+
+async def bench(backend: str, num_devices: int, history: int, args: argparse.Namespace) -> dict:
+    """
+    Measure one combination of backend, device count and history length.
+    :return dict: The results.
+    """
+    rng = np.random.default_rng(args.seed)
+    start = perf_counter()
+    graphs = list()
+    for i in range(num_devices):
+        graph = DRTGraph(None, "DRT_" + str(i), backend)
+        graph.resize(args.width, args.height)
+        graph.show()
+        graph.set_lang(LangEnum.ENG)
+        graphs.append(graph)
+    QApplication.processEvents()  # Windows are not painted until shown.
+    build = (perf_counter() - start) * 1000
+    timestamp = datetime.now() - timedelta(seconds=history * trial_seconds)
+    last = timestamp
+    for graph in graphs:
+        last = max(last, fill_history(graph, history, timestamp, rng))
+    last = (await run_frames(graphs, 1, last, rng))[1]  # Layout and first full draw are not counted.
+    times, last = await run_frames(graphs, args.frames, last, rng)
+    times = np.array(times) * 1000
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    await run_frames(graphs, args.frames, last, rng)
+    after = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    for graph in graphs:
+        graph.close()
+        graph.deleteLater()
+    QApplication.processEvents()
+    return {"backend": backend, "devices": num_devices, "history": history, "build_ms": build, "mean_ms": times.mean(),
+            "p95_ms": np.percentile(times, 95), "max_ms": times.max(),
+            "retained_blocks_per_frame": retained / args.frames, "peak_kb": peak / 1024}
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Measure every combination asked for and print a table.
+    :param args: The parsed arguments.
+    :return None:
+    """
+    columns = ["backend", "devices", "history", "build_ms", "mean_ms", "p95_ms", "max_ms", "retained_blocks_per_frame",
+               "peak_kb"]
+    print(", ".join(columns))
+    for backend in args.backends:
+        for num_devices in args.devices:
+            for history in args.history:
+                result = await bench(backend, num_devices, history, args)
+                print(", ".join([str(round(result[c], 2)) if isinstance(result[c], float) else str(result[c])
+                                 for c in columns]), flush=True)
+
+
+def main(args: [str]) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication([])
+    asyncio.run(run(parse_args(args)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,156 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+# Measures app startup. Prints an -X importtime summary of the app's imports, then launches the app a few times and
+# reports how long it took from process start to the end of imports, to the controller being built and to the
+# main window's first paint.
+# Run from the project root: python -m Tests.bench_startup --runs 5
+
+import os
+import sys
+import argparse
+import subprocess
+from time import time
+from statistics import median
+
+# Modules that should not be loaded until something needs them.
+deferred_modules = ("cv2", "matplotlib", "urllib3", "View.HelpWidgets.diagnostics_window")
+
+
+def parse_args(args: [str]) -> argparse.Namespace:
+    """
+    :param args: Command line arguments.
+    :return Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark app startup.")
+    parser.add_argument("--runs", type=int, default=5, help="App launches to time. The median is reported.")
+    parser.add_argument("--top", type=int, default=15, help="Modules to list in the import report.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(args)
+
+
+def parse_importtime(output: str) -> [(str, int, int, int)]:
+    """
+    :param output: stderr of a python -X importtime run.
+    :return list: (module, depth, self us, cumulative us) for each import.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def import_report(top: int) -> None:
+    """
+    Import the app the way main.py does with -X importtime and print where the time went.
+    :param top: How many modules to list in each table.
+    :return None:
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    rows = parse_importtime(result.stderr)
+    loaded = {row[0] for row in rows}
+    total = sum(row[3] for row in rows if row[1] == 0)
+    print("total import time (ms), " + str(round(total / 1000, 1)))
+    print()
+    print("module, cumulative (ms), self (ms)")
+    shallow = [row for row in rows if row[1] <= 2]  # Deeper rows are mostly the internals of other libraries.
+    for name, depth, self_us, cumulative_us in sorted(shallow, key=lambda row: -row[3])[:top]:
+        print("  " * depth + name + ", " + str(round(cumulative_us / 1000, 1)) + ", " + str(round(self_us / 1000, 1)))
+    print()
+    print("module, self (ms)")
+    for name, depth, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[:top]:
+        print(name + ", " + str(round(self_us / 1000, 1)))
+    print()
+    print("deferred module, loaded at startup")
+    for name in deferred_modules:
+        print(name + ", " + str(name in loaded))
+
+
+def run_child() -> None:
+    """
+    Start the app like main.py does, print the wall clock times of each startup step then exit at the first paint.
+    :return None:
+    """
+    imports_start = time()
+    from asyncio import set_event_loop
+    from asyncqt import QEventLoop
+    from PySide2.QtWidgets import QApplication, QMainWindow
+    from PySide2.QtCore import QObject, QEvent
+    from main import AppController
+    imports_done = time()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event) -> bool:
+            if event.type() == QEvent.Paint and isinstance(obj.window(), QMainWindow):
+                print(imports_start, imports_done, controller_done, time(), flush=True)
+                os._exit(0)
+            return False
+
+    app = QApplication(sys.argv[:1])
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    loop = QEventLoop(app)
+    set_event_loop(loop)
+    controller = AppController()
+    controller_done = time()
+    with loop:
+        loop.run_forever()
+
+
+def launch() -> (float, float, float, float):
+    """
+    Launch the app once.
+    :return tuple: Milliseconds from launch to interpreter ready, imports done, controller built and first paint.
+    """
+    start = time()
+    result = subprocess.run([sys.executable, "-m", "Tests.bench_startup", "--child"], stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, universal_newlines=True, timeout=120)
+    times = [float(x) for x in result.stdout.split()]
+    if len(times) != 4:
+        raise RuntimeError("The app did not reach its first paint:\n" + result.stderr)
+    return tuple((t - start) * 1000 for t in times)
+
+
+def main(args: [str] = None) -> None:
+    args = parse_args(args)
+    if args.child:
+        run_child()
+        return
+    import_report(args.top)
+    print()
+    launches = [launch() for _ in range(args.runs)]
+    print("step, median (ms), min (ms)")
+    for i, step in enumerate(("interpreter ready", "imports done", "controller built", "first paint")):
+        values = [run[i] for run in launches]
+        print(step + ", " + str(round(median(values), 1)) + ", " + str(round(min(values), 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+# Measures the cost of tracing on the per trial path of a DRT: reading and parsing a message, then formatting
+# its save line. Compares the paired "running"/"done" debug logs the code used to have, the same calls without
+# tracing wrappers, and tracing off and on.
+# Run from the project root: python -m Tests.bench_tracing --trials 20000
+
+import os
+import asyncio
+import logging
+import argparse
+import tempfile
+from time import perf_counter
+from Devices.DRT.Model import drt_model
+from Devices.DRT.Model.drt_model import DRTModel
+from Model.app_defs import log_format
+from Model.tracer import get_tracer
+
+trial_line = b"trl>12345678, 17, 1, 432\r\n"
+
+
+class TrialPort:
+    """ Stands in for a DRT's serial port, answering every read with the same trial. """
+    port = "bench"
+    is_open = False
+
+    async def readline_async(self) -> bytes:
+        return trial_line
+
+
+def parse_args(args: [str]) -> argparse.Namespace:
+    """
+    :param args: Command line arguments.
+    :return Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark per trial tracing overhead.")
+    parser.add_argument("--trials", type=int, default=20000, help="Trials per mode.")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per mode. The fastest is reported.")
+    return parser.parse_args(args)
+
+
+async def run_trials(model: DRTModel, trials: int, raw: bool, logger: logging.Logger = None) -> float:
+    """
+    Push trials through the model.
+    :param model: The model to use.
+    :param trials: How many trials to run.
+    :param raw: Call the functions without their tracing wrappers.
+    :param logger: If given, log "running" and "done" around each traced function, like the old code did.
+    :return float: Seconds taken.
+    """
+    traced_format = drt_model.format_current_time
+    if raw:
+        get_msg = DRTModel.get_msg.__wrapped__.__get__(model)
+        drt_model.format_current_time = traced_format.__wrapped__
+    else:
+        get_msg = model.get_msg
+    format_save = model._format_save_data
+    start = perf_counter()
+    if logger:
+        for _ in range(trials):
+            logger.debug("running")
+            msg, timestamp = await get_msg()
+            logger.debug("done")
+            logger.debug("running")  # format_current_time, called by _format_save_data.
+            format_save(msg['values'], timestamp)
+            logger.debug("done")
+    else:
+        for _ in range(trials):
+            msg, timestamp = await get_msg()
+            format_save(msg['values'], timestamp)
+    taken = perf_counter() - start
+    drt_model.format_current_time = traced_format
+    return taken
+
+
+async def bench(args: argparse.Namespace) -> None:
+    """
+    Run each mode and print microseconds per trial.
+    :param args: Parsed command line arguments.
+    :return None:
+    """
+    model = DRTModel("bench", TrialPort())
+    log_file = os.path.join(tempfile.gettempdir(), "bench_tracing.log")
+    handler = logging.FileHandler(log_file, mode="w")
+    handler.setFormatter(logging.Formatter(log_format))
+    logger = logging.getLogger("bench_tracing")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    tracer = get_tracer()
+
+    results = dict()
+    for mode in ("debug logs", "untraced", "tracing off", "tracing on"):
+        best = None
+        for _ in range(args.repeats):
+            tracer.set_enabled(mode == "tracing on")
+            tracer.clear()
+            taken = await run_trials(model, args.trials, mode in ("debug logs", "untraced"),
+                                     logger if mode == "debug logs" else None)
+            best = taken if best is None else min(best, taken)
+        results[mode] = best / args.trials * 1e6
+    tracer.set_enabled(False)
+    handler.close()
+    os.remove(log_file)
+
+    print("mode, us_per_trial")
+    for mode, per_trial in results.items():
+        print(mode + ", " + str(round(per_trial, 2)))
+
+
+def main(args: [str] = None) -> None:
+    asyncio.run(bench(parse_args(args)))
+
+
+if __name__ == "__main__":
+    main()
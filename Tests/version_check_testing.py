@@ -0,0 +1,130 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+# Runs the version checker against a local stand-in for the version site: a fresh fetch, a cached launch, an expired
+# cache, a slow site, a site that is down and a page that is not a version file.
+# Run from the project root: python -m Tests.version_check_testing
+
+import os
+import asyncio
+import tempfile
+from time import perf_counter, sleep
+from threading import Thread
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from Model.version_checker import VersionChecker
+
+
+class StandIn(HTTPServer):
+    """ Serves body for every GET after waiting delay seconds, and counts the requests. """
+    def __init__(self, body: bytes, delay: float = 0):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.body = body
+        self.delay = delay
+        self.requests = 0
+        Thread(target=self.serve_forever, daemon=True).start()
+
+    def get_url(self) -> str:
+        return "http://127.0.0.1:" + str(self.server_port) + "/Version.txt"
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        sleep(self.server.delay)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+async def timed_update(checker: VersionChecker, use_cache: bool = True) -> (float, float):
+    """
+    :return (float, float): The version found and milliseconds taken.
+    """
+    start = perf_counter()
+    version = await checker.update(use_cache)
+    return version, (perf_counter() - start) * 1000
+
+
+def report(name: str, version: float, taken: float, requests: int) -> None:
+    print(name + ": version " + str(version) + ", " + str(round(taken, 1)) + " ms, " + str(requests) + " requests")
+
+
+async def main() -> None:
+    cache_file = os.path.join(tempfile.mkdtemp(), "version_cache.json")
+
+    site = StandIn(b"Companion App Version: 2.1\n")
+    checker = VersionChecker(site.get_url(), cache_file, timeout=1)
+    version, taken = await timed_update(checker)
+    report("fresh", version, taken, site.requests)
+    assert version == 2.1 and checker.check_version() == 1 and site.requests == 1
+
+    checker = VersionChecker(site.get_url(), cache_file, timeout=1)
+    version, taken = await timed_update(checker)
+    report("cached", version, taken, site.requests)
+    assert version == 2.1 and site.requests == 1
+
+    checker = VersionChecker(site.get_url(), cache_file, ttl=0, timeout=1)
+    version, taken = await timed_update(checker)
+    report("expired", version, taken, site.requests)
+    assert version == 2.1 and site.requests == 2
+
+    version, taken = await timed_update(checker, use_cache=False)
+    report("uncached", version, taken, site.requests)
+    assert version == 2.1 and site.requests == 3
+    site.stop()
+
+    os.remove(cache_file)
+    site = StandIn(b"Companion App Version: 2.1\n", delay=3)
+    checker = VersionChecker(site.get_url(), cache_file, timeout=0.5)
+    version, taken = await timed_update(checker)
+    report("slow", version, taken, site.requests)
+    assert version == -1 and checker.check_version() == -1 and taken < 1000 and not os.path.exists(cache_file)
+    url = site.get_url()
+    site.stop()
+
+    checker = VersionChecker(url, cache_file, timeout=1)
+    version, taken = await timed_update(checker)
+    report("down", version, taken, 0)
+    assert version == -1 and not os.path.exists(cache_file)
+
+    site = StandIn(b"<html>Captive portal</html>")
+    checker = VersionChecker(site.get_url(), cache_file, timeout=1)
+    version, taken = await timed_update(checker)
+    report("not a version file", version, taken, site.requests)
+    assert version == -1 and not os.path.exists(cache_file)
+    site.stop()
+    print("all passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -24,21 +24,20 @@ https://redscientific.com/index.html
 """
 
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLineEdit, QProgressBar, QLabel
 from PySide2.QtGui import QIcon
 from PySide2.QtCore import QSize
-from Model.app_helpers import ClickAnimationButton
+from View.view_helpers import ClickAnimationButton
 from Model.app_defs import button_box_start_image_filepath, button_box_pause_image_filepath
 from Resources.Strings.button_box_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class ButtonBox(QGroupBox):
     """ This code is to contain the overall controls which govern running experiments. """
-    def __init__(self, parent, size: QSize, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, size: QSize, lang: LangEnum):
         self.logger = getLogger(__name__)
-        for h in log_handlers:
-            self.logger.addHandler(h)
         self.logger.debug("Initializing")
         super().__init__(parent)
         self.setLayout(QVBoxLayout())
@@ -91,35 +90,32 @@ class ButtonBox(QGroupBox):
         """
         return self._text_entry.text()
 
+    @trace
     def add_create_button_handler(self, func: classmethod) -> None:
         """
         Add handler for the create button click event.
         :param func: The handler.
         :return: None.
         """
-        self.logger.debug("running")
         self._create_button.clicked.connect(func)
-        self.logger.debug("done")
 
+    @trace
     def add_start_button_handler(self, func: classmethod) -> None:
         """
         Add handler for the start button click event.
         :param func: The handler
         :return: None.
         """
-        self.logger.debug("running")
         self._start_button.clicked.connect(func)
-        self.logger.debug("done")
 
+    @trace
     def set_condition_name_box_enabled(self, is_active: bool) -> None:
         """
         Set whether this text entry is enabled.
         :param is_active: Whether this button is active.
         :return: None
         """
-        self.logger.debug("running")
         self._text_entry.setEnabled(is_active)
-        self.logger.debug("done")
 
     def set_create_button_enabled(self, is_active: bool) -> None:
         """
@@ -129,20 +125,19 @@ class ButtonBox(QGroupBox):
         """
         self._create_button.setEnabled(is_active)
 
+    @trace
     def set_create_button_state(self, button_state: int) -> None:
         """
         Set create button state to given state. 0: Create. 1: End.
         :param button_state: The state to show on this button.
         :return: None.
         """
-        self.logger.debug("running")
         if button_state == 0:
             self._create_button.setText(self._strings[StringsEnum.CREATE])
             self._create_button.setToolTip(self._strings[StringsEnum.CREATE_TT])
         elif button_state == 1:
             self._create_button.setText(self._strings[StringsEnum.END])
             self._create_button.setToolTip(self._strings[StringsEnum.END_TT])
-        self.logger.debug("done")
 
     def set_start_button_enabled(self, is_active: bool) -> None:
         """
@@ -152,13 +147,13 @@ class ButtonBox(QGroupBox):
         """
         self._start_button.setEnabled(is_active)
 
+    @trace
     def set_start_button_state(self, button_state: int = 0) -> None:
         """
         Set start button state to given state. 0: Start. 1: Pause. 2: Resume.
         :param button_state: The state to show on this button.
         :return: None.
         """
-        self.logger.debug("running")
         if button_state == 0:
             self._start_button.setIcon(self._play_icon)
             self._start_button.setIconSize(QSize(26, 26))
@@ -171,7 +166,6 @@ class ButtonBox(QGroupBox):
             self._start_button.setIcon(self._play_icon)
             self._start_button.setIconSize(QSize(26, 26))
             self._start_button.setToolTip(self._strings[StringsEnum.RESUME_TT])
-        self.logger.debug("done")
 
     def toggle_show_prog_bar(self, is_visible: bool) -> None:
         """
@@ -196,12 +190,12 @@ class ButtonBox(QGroupBox):
         pass
         # self.prog_bar.setValue(value)
 
+    @trace
     def _set_texts(self) -> None:
         """
         Set the texts of this view item.
         :return: None.
         """
-        self.logger.debug("running")
         self.setTitle(self._strings[StringsEnum.TITLE])
         self._text_entry.setPlaceholderText(self._strings[StringsEnum.COND_NAME_SHADOW])
         if self._create_button_state == 0:
@@ -216,23 +210,21 @@ class ButtonBox(QGroupBox):
             self._start_button.setIconSize(QSize(36, 36))
         # self.prog_bar_label.setText(button_box_prog_bar_label)
         # self.prog_bar.setValue(0)
-        self.logger.debug("done")
 
+    @trace
     def _set_button_states(self) -> None:
         """
         Set default button states.
         :return: None.
         """
-        self.logger.debug("running")
         self._start_button.setEnabled(False)
-        self.logger.debug("done")
 
+    @trace
     def _set_tooltips(self) -> None:
         """
         Set the text for the tooltips in this view item.
         :return: None.
         """
-        self.logger.debug("running")
         if self._create_button_state == 0:
             self._create_button.setToolTip(self._strings[StringsEnum.CREATE_TT])
         if self._create_button_state == 1:
@@ -243,4 +235,3 @@ class ButtonBox(QGroupBox):
             self._start_button.setToolTip(self._strings[StringsEnum.PAUSE_TT])
         elif self._start_button_state == 2:
             self._start_button.setToolTip(self._strings[StringsEnum.RESUME_TT])
-        self.logger.debug("done")
@@ -23,18 +23,17 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler, DEBUG, WARNING
+from logging import getLogger, DEBUG, WARNING
 from PySide2.QtWidgets import QMenuBar, QMenu, QAction
 from PySide2.QtCore import QRect, Signal
 from Resources.Strings.menu_bar_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class AppMenuBar(QMenuBar):
     """ This code is for the menu bar at the top of the main window. File, help, etc. """
-    def __init__(self, parent, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, lang: LangEnum):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         self.setGeometry(QRect(0, 0, 840, 22))
@@ -124,6 +123,13 @@ class AppMenuBar(QMenuBar):
         self._log_window_action = QAction(self)
         self._help_menu.addAction(self._log_window_action)
 
+        self._diagnostics_action = QAction(self)
+        self._help_menu.addAction(self._diagnostics_action)
+
+        self._profile_action = QAction(self)
+        self._profile_action.setCheckable(True)
+        self._help_menu.addAction(self._profile_action)
+
         self._cam_actions = {}
 
         self._debug_callback = None
@@ -198,15 +204,14 @@ class AppMenuBar(QMenuBar):
         self._use_cams_action.setChecked(is_active)
         self.empty_cam_actions()
 
+    @trace
     def add_cam_bool_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._use_cams_action.toggled.connect(func)
-        self._logger.debug("done")
 
     def set_use_cams_action_active(self, is_active: bool) -> None:
         """
@@ -217,55 +222,75 @@ class AppMenuBar(QMenuBar):
 
         self._use_cams_action.setEnabled(is_active)
 
+    @trace
     def add_open_last_save_dir_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._open_last_save_dir_action.triggered.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def add_about_app_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._about_app_action.triggered.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def add_about_company_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._about_company_action.triggered.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def add_update_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._update_action.triggered.connect(func)
-        self._logger.debug("done")
 
+    @trace
     def add_log_window_handler(self, func: classmethod) -> None:
         """
         Add handler to this selectable.
         :param func: The handler.
         :return None:
         """
-        self._logger.debug("running")
         self._log_window_action.triggered.connect(func)
-        self._logger.debug("done")
+
+    @trace
+    def add_diagnostics_window_handler(self, func: classmethod) -> None:
+        """
+        Add handler to this selectable.
+        :param func: The handler.
+        :return None:
+        """
+        self._diagnostics_action.triggered.connect(func)
+
+    def add_profile_handler(self, func: classmethod) -> None:
+        """
+        Add handler to this selectable. Handler must take a bool, whether profiling should be on.
+        :param func: The handler.
+        :return None:
+        """
+        self._profile_action.triggered.connect(func)
+
+    def set_profile_checked(self, is_checked: bool) -> None:
+        """
+        Set whether the profile action is checked.
+        :param is_checked: Whether profiling is on.
+        :return None:
+        """
+        self._profile_action.setChecked(is_checked)
 
     def add_cam_action(self, name: str, handler: classmethod, is_active: bool = True) -> None:
         """
@@ -373,12 +398,12 @@ class AppMenuBar(QMenuBar):
             action.setChecked(False)
         keep_checked.setChecked(True)
 
+    @trace
     def _set_texts(self) -> None:
         """
         Set the texts of this view object.
         :return None:
         """
-        self._logger.debug("running")
         self._file_menu.setTitle(self._strings[StringsEnum.FILE])
         self._open_last_save_dir_action.setText(self._strings[StringsEnum.LAST_DIR])
         self._settings_menu.setTitle(self._strings[StringsEnum.SETTINGS])
@@ -398,7 +423,8 @@ class AppMenuBar(QMenuBar):
         self._about_company_action.setText(self._strings[StringsEnum.ABOUT_COMPANY])
         self._update_action.setText(self._strings[StringsEnum.UPDATE_CHECK])
         self._log_window_action.setText(self._strings[StringsEnum.SHOW_LOG_WINDOW])
-        self._logger.debug("done")
+        self._diagnostics_action.setText(self._strings[StringsEnum.SHOW_DIAGNOSTICS])
+        self._profile_action.setText(self._strings[StringsEnum.PROFILE])
 
     def empty_cam_actions(self) -> None:
         """
@@ -24,18 +24,17 @@ https://redscientific.com/index.html
 """
 
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QGroupBox, QGridLayout, QTextEdit
-from Model.app_helpers import ClickAnimationButton
+from View.view_helpers import ClickAnimationButton
 from Resources.Strings.note_box_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class NoteBox(QGroupBox):
     """ This code is for the user to input notes as desired. """
-    def __init__(self, parent, size, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, size, lang: LangEnum):
         self.logger = getLogger(__name__)
-        for h in log_handlers:
-            self.logger.addHandler(h)
         self.logger.debug("Initializing")
         super().__init__(parent)
         self.setLayout(QGridLayout())
@@ -63,39 +62,32 @@ class NoteBox(QGroupBox):
     def get_note(self):
         return self._text_edit.toPlainText()
 
+    @trace
     def clear_note(self):
-        self.logger.debug("running")
         self._text_edit.clear()
-        self.logger.debug("done")
 
+    @trace
     def set_post_button_enabled(self, is_active):
-        self.logger.debug("running")
         self._post_button.setEnabled(is_active)
-        self.logger.debug("done")
 
+    @trace
     def add_post_handler(self, func):
-        self.logger.debug("running")
         self._post_button.clicked.connect(func)
-        self.logger.debug("done")
 
+    @trace
     def add_note_box_changed_handler(self, func):
-        self.logger.debug("running")
         self._text_edit.textChanged.connect(func)
-        self.logger.debug("done")
 
+    @trace
     def _set_texts(self):
-        self.logger.debug("running")
         self.setTitle(self._strings[StringsEnum.TITLE])
         self._post_button.setText(self._strings[StringsEnum.POST])
         self._text_edit.setPlaceholderText(self._strings[StringsEnum.SHADOW])
-        self.logger.debug("done")
 
+    @trace
     def _set_button_state(self):
-        self.logger.debug("running")
         self._post_button.setEnabled(False)
-        self.logger.debug("done")
 
+    @trace
     def _set_tooltips(self):
-        self.logger.debug("running")
         self._post_button.setToolTip(self._strings[StringsEnum.POST_TT])
-        self.logger.debug("done")
@@ -23,18 +23,17 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QMdiArea
 from PySide2.QtCore import QSize, Qt
 from Devices.AbstractDevice.View.abstract_view import AbstractView
+from Model.tracer import trace
 
 
 class MDIArea(QMdiArea):
     """ The area to show device specific views. """
-    def __init__(self, parent, size: QSize, log_handlers: [StreamHandler]):
+    def __init__(self, parent, size: QSize):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         self.setMinimumSize(size)
@@ -42,27 +41,25 @@ class MDIArea(QMdiArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
+    @trace
     def add_window(self, window: AbstractView) -> None:
         """
         Add given window to the MDI Area.
         :param window: The window to add.
         :return: None.
         """
-        self._logger.debug("running")
         window.setParent(self)
         self.addSubWindow(window)
         window.show()
-        self._logger.debug("done")
 
+    @trace
     def remove_window(self, window: AbstractView) -> None:
         """
         Remove the given window from the MDI Area.
         :param window: The window to remove.
         :return: None.
         """
-        self._logger.debug("running")
         self.removeSubWindow(window)
-        self._logger.debug("done")
 
     # TODO: Implement this
     def set_window_order(self):
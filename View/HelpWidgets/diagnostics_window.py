@@ -0,0 +1,178 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from logging import getLogger
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem, \
+    QHeaderView, QPushButton
+from Resources.Strings.diagnostics_window_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
+
+
+class DiagnosticsWindow(QWidget):
+    """ This is to display timing and performance information about the app and its devices. """
+    def __init__(self, lang: LangEnum):
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__()
+        self.resize(600, 400)
+        self.move(100, 100)
+        self.setLayout(QVBoxLayout())
+        self._tabs = QTabWidget(self)
+        self.layout().addWidget(self._tabs)
+
+        self._timing_table = self._add_table_tab(4)
+        self._event_table = self._add_table_tab(6)
+        self._task_table = self._add_table_tab(6)
+        self._metrics_table = self._add_table_tab(4)
+
+        self._button_layout = QHBoxLayout()
+        self._refresh_button = QPushButton(self)
+        self._button_layout.addWidget(self._refresh_button)
+        self._export_button = QPushButton(self)
+        self._button_layout.addWidget(self._export_button)
+        self.layout().addLayout(self._button_layout)
+
+        self._strings = dict()
+        self.set_lang(lang)
+        self._logger.debug("Initialized")
+
+    def set_lang(self, lang: LangEnum) -> None:
+        """
+        Set the language for this view object.
+        :param lang: The enum for the language.
+        :return None:
+        """
+        self._strings = strings[lang]
+        self._set_texts()
+
+    @trace
+    def add_refresh_handler(self, func: classmethod) -> None:
+        """
+        Add handler for the refresh button.
+        :param func: The handler.
+        :return None:
+        """
+        self._refresh_button.clicked.connect(func)
+
+    @trace
+    def add_export_handler(self, func: classmethod) -> None:
+        """
+        Add handler for the export button.
+        :param func: The handler.
+        :return None:
+        """
+        self._export_button.clicked.connect(func)
+
+    def set_timing_rows(self, rows: [(str, str, str, str)]) -> None:
+        """
+        Replace the contents of the timing table.
+        :param rows: (device, phase, start, duration) for each span.
+        :return None:
+        """
+        self._set_rows(self._timing_table, rows)
+
+    def set_event_rows(self, rows: [(str, str, str, str, str, str)]) -> None:
+        """
+        Replace the contents of the event queue table.
+        :param rows: (topic, subscribers, depth, peak depth, published, dropped) for each topic.
+        :return None:
+        """
+        self._set_rows(self._event_table, rows)
+
+    def set_task_rows(self, rows: [(str, str, str, str, str, str)]) -> None:
+        """
+        Replace the contents of the background task table.
+        :param rows: (kind, active, started, completed, failed, coalesced) for each kind of task.
+        :return None:
+        """
+        self._set_rows(self._task_table, rows)
+
+    def set_metric_rows(self, rows: [(str, str, str, str)]) -> None:
+        """
+        Replace the contents of the metrics table.
+        :param rows: (metric, labels, value, rate) for each metric.
+        :return None:
+        """
+        self._set_rows(self._metrics_table, rows)
+
+    def _add_table_tab(self, columns: int) -> QTableWidget:
+        """
+        Add a tab containing a read only table.
+        :param columns: The number of columns in the table.
+        :return QTableWidget: The new table.
+        """
+        table = QTableWidget(0, columns, self._tabs)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._tabs.addTab(table, "")
+        return table
+
+    @trace
+    def _set_rows(self, table: QTableWidget, rows: [tuple]) -> None:
+        """
+        Replace the contents of a table.
+        :param table: The table to fill.
+        :param rows: The rows to show.
+        :return None:
+        """
+        table.setRowCount(len(rows))
+        for i in range(len(rows)):
+            for j in range(len(rows[i])):
+                table.setItem(i, j, QTableWidgetItem(rows[i][j]))
+
+    @trace
+    def _set_texts(self) -> None:
+        """
+        Set the texts of this view object.
+        :return None:
+        """
+        self.setWindowTitle(self._strings[StringsEnum.TITLE])
+        self._tabs.setTabText(self._tabs.indexOf(self._timing_table), self._strings[StringsEnum.TIMING_TAB])
+        self._timing_table.setHorizontalHeaderLabels([self._strings[StringsEnum.DEVICE_COL],
+                                                      self._strings[StringsEnum.PHASE_COL],
+                                                      self._strings[StringsEnum.START_COL],
+                                                      self._strings[StringsEnum.DURATION_COL]])
+        self._tabs.setTabText(self._tabs.indexOf(self._event_table), self._strings[StringsEnum.EVENTS_TAB])
+        self._event_table.setHorizontalHeaderLabels([self._strings[StringsEnum.TOPIC_COL],
+                                                     self._strings[StringsEnum.SUBSCRIBERS_COL],
+                                                     self._strings[StringsEnum.DEPTH_COL],
+                                                     self._strings[StringsEnum.PEAK_DEPTH_COL],
+                                                     self._strings[StringsEnum.PUBLISHED_COL],
+                                                     self._strings[StringsEnum.DROPPED_COL]])
+        self._tabs.setTabText(self._tabs.indexOf(self._task_table), self._strings[StringsEnum.TASKS_TAB])
+        self._task_table.setHorizontalHeaderLabels([self._strings[StringsEnum.KIND_COL],
+                                                    self._strings[StringsEnum.ACTIVE_COL],
+                                                    self._strings[StringsEnum.STARTED_COL],
+                                                    self._strings[StringsEnum.COMPLETED_COL],
+                                                    self._strings[StringsEnum.FAILED_COL],
+                                                    self._strings[StringsEnum.COALESCED_COL]])
+        self._tabs.setTabText(self._tabs.indexOf(self._metrics_table), self._strings[StringsEnum.METRICS_TAB])
+        self._metrics_table.setHorizontalHeaderLabels([self._strings[StringsEnum.METRIC_COL],
+                                                       self._strings[StringsEnum.LABELS_COL],
+                                                       self._strings[StringsEnum.VALUE_COL],
+                                                       self._strings[StringsEnum.RATE_COL]])
+        self._refresh_button.setText(self._strings[StringsEnum.REFRESH])
+        self._export_button.setText(self._strings[StringsEnum.EXPORT])
@@ -23,12 +23,17 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from PySide2.QtWidgets import QWidget, QVBoxLayout, QTextEdit
-from PySide2.QtGui import QTextCursor
+from collections import deque
+from logging import DEBUG, INFO, WARNING, ERROR, CRITICAL, getLevelName
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QComboBox, QLineEdit, QLabel
 from Resources.Strings.output_window_strings import strings, StringsEnum, LangEnum
 
+max_records = 20000  # Records kept in memory for filtering.
+max_lines = 5000  # Lines kept in the text box.
+filter_levels = [DEBUG, INFO, WARNING, ERROR, CRITICAL]
 
-# TODO: Proper logging for this file?
+
+# No logger in this file. It displays the log, so logging here would feed back into itself.
 class OutputWindow(QWidget):
     """ This is to display small messages to the user. """
     def __init__(self, lang: LangEnum):
@@ -36,11 +41,30 @@ class OutputWindow(QWidget):
         self.resize(400, 200)
         self.move(100, 100)
         self.setLayout(QVBoxLayout())
-        self._textBox = QTextEdit()
+        self._filter_layout = QHBoxLayout()
+        self._level_label = QLabel(self)
+        self._filter_layout.addWidget(self._level_label)
+        self._level_box = QComboBox(self)
+        for level in filter_levels:
+            self._level_box.addItem(getLevelName(level), level)
+        self._filter_layout.addWidget(self._level_box)
+        self._module_box = QLineEdit(self)
+        self._module_box.setClearButtonEnabled(True)
+        self._filter_layout.addWidget(self._module_box)
+        self.layout().addLayout(self._filter_layout)
+        self._textBox = QPlainTextEdit()
+        self._textBox.setReadOnly(True)
+        self._textBox.setUndoRedoEnabled(False)
+        self._textBox.setMaximumBlockCount(max_lines)
         self.layout().addWidget(self._textBox)
+        self._records = deque(maxlen=max_records)
+        self._min_level = DEBUG
+        self._module = str()
+        self._stale = False
         self._strings = dict()
         self.set_lang(lang)
-        self._textBox.setReadOnly(True)
+        self._level_box.currentIndexChanged.connect(self._filter_changed_handler)
+        self._module_box.textChanged.connect(self._filter_changed_handler)
 
     def set_lang(self, lang: LangEnum) -> None:
         """
@@ -50,13 +74,63 @@ class OutputWindow(QWidget):
         """
         self._strings = strings[lang]
         self.setWindowTitle(self._strings[StringsEnum.TITLE])
+        self._level_label.setText(self._strings[StringsEnum.LEVEL])
+        self._module_box.setPlaceholderText(self._strings[StringsEnum.MODULE])
+
+    def add_records(self, records: [tuple]) -> None:
+        """
+        Add a batch of log records. They are only drawn while this window is visible.
+        :param records: List of (level, logger name, formatted message).
+        :return None:
+        """
+        self._records.extend(records)
+        if not self.isVisible():
+            self._stale = True
+            return
+        lines = self._filter(records)
+        if not lines:
+            return
+        bar = self._textBox.verticalScrollBar()
+        at_end = bar.value() == bar.maximum()
+        self._textBox.appendPlainText("\n".join(lines[-max_lines:]))
+        if at_end:
+            bar.setValue(bar.maximum())
 
-    def write(self, message) -> None:
+    def showEvent(self, event) -> None:
         """
-        Add text to output window.
-        :param message: The text to add.
-        :return: None.
+        Catch up on records that came in while hidden.
+        :param event: The show event.
+        :return None:
+        """
+        if self._stale:
+            self._redraw()
+        super().showEvent(event)
+
+    def _filter_changed_handler(self) -> None:
+        """
+        Apply the level and module filters to every record in memory.
+        :return None:
+        """
+        self._min_level = self._level_box.currentData()
+        self._module = self._module_box.text().strip()
+        self._redraw()
+
+    def _filter(self, records) -> [str]:
+        """
+        :param records: The records to filter.
+        :return list: The messages of records passing the level and module filters.
+        """
+        min_level = self._min_level
+        module = self._module
+        return [msg for level, name, msg in records if level >= min_level and (not module or module in name)]
+
+    def _redraw(self) -> None:
+        """
+        Replace the text box contents with the newest filtered records.
+        :return None:
         """
-        self._textBox.moveCursor(QTextCursor.End)
-        self._textBox.insertPlainText(message)
-        self._textBox.moveCursor(QTextCursor.End)
+        self._stale = False
+        lines = self._filter(self._records)
+        self._textBox.setPlainText("\n".join(lines[-max_lines:]))
+        bar = self._textBox.verticalScrollBar()
+        bar.setValue(bar.maximum())
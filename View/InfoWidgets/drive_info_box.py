@@ -24,24 +24,22 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QLabel, QGridLayout, QGroupBox
 from PySide2.QtCore import Qt
 from Resources.Strings.drive_info_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class DriveInfoBox(QGroupBox):
     """ This code is for displaying information about storage usage. """
-    def __init__(self, parent, size: (int, int), log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, size: (int, int), lang: LangEnum):
         """
         Initialize this view module.
         :param parent: parent of this view module.
         :param size: size this view module should occupy
-        :param log_handlers:
         """
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         self.setFixedSize(size)
@@ -124,12 +122,12 @@ class DriveInfoBox(QGroupBox):
         """
         self._drive_mb_val.setText(value)
 
+    @trace
     def _set_texts(self) -> None:
         """
         Set the text for each element in this view module
         :return: None
         """
-        self._logger.debug("running")
         self.setTitle(self._strings[StringsEnum.TITLE])
         self._drive_name_label.setText(self._strings[StringsEnum.STORAGE_ID])
         self._drive_percent_label.setText(self._strings[StringsEnum.PERC_USED])
@@ -24,19 +24,18 @@ https://redscientific.com/index.html
 """
 
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QGroupBox, QVBoxLayout, QLabel
 from PySide2.QtGui import QFont
 from PySide2.QtCore import Qt, QSize
 from Resources.Strings.flag_box_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class FlagBox(QGroupBox):
     """ This code is for showing and storing the keyflag which in this case is the last letter key the user pressed. """
-    def __init__(self, parent, size: QSize, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, size: QSize, lang: LangEnum):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__(parent)
         self.setLayout(QVBoxLayout())
@@ -61,21 +60,18 @@ class FlagBox(QGroupBox):
         self._set_texts()
         self._set_tooltips()
 
+    @trace
     def set_flag(self, text):
-        self._logger.debug("running")
         self._flag.setText(text)
-        self._logger.debug("done")
 
     def get_flag(self):
         return self._flag.text()
 
+    @trace
     def _set_texts(self):
-        self._logger.debug("running")
         self.setTitle(self._strings[StringsEnum.TITLE])
         self._flag.setText("")
-        self._logger.debug("done")
 
+    @trace
     def _set_tooltips(self):
-        self._logger.debug("running")
         self._flag.setToolTip(self._strings[StringsEnum.FLAG_TT])
-        self._logger.debug("done")
@@ -25,18 +25,17 @@ https://redscientific.com/index.html
 """
 
 
-from logging import getLogger, StreamHandler
+from logging import getLogger
 from PySide2.QtWidgets import QLabel, QGridLayout, QGroupBox
 from PySide2.QtCore import Qt, QSize
 from Resources.Strings.info_box_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 
 class InfoBox(QGroupBox):
     """ This code is for displaying information about the current experiment. """
-    def __init__(self, parent, size: QSize, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, parent, size: QSize, lang: LangEnum):
         self.logger = getLogger(__name__)
-        for h in log_handlers:
-            self.logger.addHandler(h)
         self.logger.debug("Initializing")
         super().__init__(parent)
         self.setFixedSize(size)
@@ -71,29 +70,25 @@ class InfoBox(QGroupBox):
         self._strings = strings[lang]
         self._set_texts()
 
+    @trace
     def set_start_time(self, time):
-        self.logger.debug("running")
         self.__start_time_val.setText(time)
-        self.logger.debug("done")
 
+    @trace
     def reset_start_time(self):
-        self.logger.debug("running")
         self.__start_time_val.setText("00:00:00")
-        self.logger.debug("done")
 
+    @trace
     def set_block_num(self, num):
-        self.logger.debug("running")
         self.__block_num_val.setText(str(num))
-        self.logger.debug("done")
 
     def get_block_num(self):
         return self.__block_num_val.text()
 
+    @trace
     def _set_texts(self):
-        self.logger.debug("running")
         self.setTitle(self._strings[StringsEnum.TITLE])
         self.__start_time_label.setText(self._strings[StringsEnum.START_TIME])
         self.__block_num_label.setText(self._strings[StringsEnum.BLOCK_NO])
         self.__block_num_val.setText("0")
         self.reset_start_time()
-        self.logger.debug("done")
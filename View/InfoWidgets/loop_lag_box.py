@@ -0,0 +1,157 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from math import log1p
+from logging import getLogger
+from PySide2.QtWidgets import QLabel, QGridLayout, QGroupBox, QWidget
+from PySide2.QtGui import QPainter, QColor
+from PySide2.QtCore import Qt, QSize
+from Resources.Strings.loop_lag_strings import strings, StringsEnum, LangEnum
+
+
+class LagHistogram(QWidget):
+    """ Small bar chart of lag bucket counts. Bar heights are log scaled so rare stalls still show. """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._counts = list()
+        self._normal_color = QColor(60, 140, 60)
+        self._slow_color = QColor(200, 60, 60)
+        self._slow_from = 0
+
+    def set_counts(self, counts: [int], slow_from: int) -> None:
+        """
+        Set the bucket counts to show.
+        :param counts: Count for each bucket, smallest lag first.
+        :param slow_from: Index of the first bucket drawn as a stall.
+        :return None:
+        """
+        if counts == self._counts:
+            return
+        self._counts = list(counts)
+        self._slow_from = slow_from
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        if not self._counts:
+            return
+        painter = QPainter(self)
+        width = self.width() / len(self._counts)
+        height = self.height()
+        top = log1p(max(self._counts)) or 1
+        for i, count in enumerate(self._counts):
+            if not count:
+                continue
+            bar = max(1, round(log1p(count) / top * height))
+            color = self._slow_color if i >= self._slow_from else self._normal_color
+            painter.fillRect(round(i * width) + 1, height - bar, max(1, round(width) - 2), bar, color)
+        painter.end()
+
+
+class LoopLagBox(QGroupBox):
+    """ This code is for displaying how responsive the app's event loop is. """
+    def __init__(self, parent, size: QSize, lang: LangEnum):
+        """
+        Initialize this view module.
+        :param parent: parent of this view module.
+        :param size: size this view module should occupy
+        :param lang: The language to use.
+        """
+        self._logger = getLogger(__name__)
+        self._logger.debug("Initializing")
+        super().__init__(parent)
+        self.setFixedSize(size)
+        self.setLayout(QGridLayout())
+
+        self._current_label = QLabel()
+        self._current_label.setAlignment(Qt.AlignLeft)
+        self.layout().addWidget(self._current_label, 0, 0, 1, 1)
+
+        self._current_val = QLabel()
+        self._current_val.setAlignment(Qt.AlignRight)
+        self.layout().addWidget(self._current_val, 0, 1, 1, 1)
+
+        self._worst_label = QLabel()
+        self._worst_label.setAlignment(Qt.AlignLeft)
+        self.layout().addWidget(self._worst_label, 1, 0, 1, 1)
+
+        self._worst_val = QLabel()
+        self._worst_val.setAlignment(Qt.AlignRight)
+        self.layout().addWidget(self._worst_val, 1, 1, 1, 1)
+
+        self._stalls_label = QLabel()
+        self._stalls_label.setAlignment(Qt.AlignLeft)
+        self.layout().addWidget(self._stalls_label, 2, 0, 1, 1)
+
+        self._stalls_val = QLabel()
+        self._stalls_val.setAlignment(Qt.AlignRight)
+        self.layout().addWidget(self._stalls_val, 2, 1, 1, 1)
+
+        self._histogram = LagHistogram(self)
+        self._histogram.setMinimumHeight(16)
+        self.layout().addWidget(self._histogram, 3, 0, 1, 2)
+        self.layout().setVerticalSpacing(2)
+
+        self._strings = dict()
+        self.set_lang(lang)
+        self._logger.debug("Initialized")
+
+    def set_lang(self, lang: LangEnum) -> None:
+        """
+        Set the language for this view object.
+        :param lang: The enum for the language.
+        :return None:
+        """
+        self._strings = strings[lang]
+        self._set_texts()
+
+    def set_values(self, current: float, worst: float, stalls: int, histogram: [(str, int)], slow_from: int) -> None:
+        """
+        Show the latest lag measurements.
+        :param current: The last lag in ms.
+        :param worst: The worst lag in ms.
+        :param stalls: How many stalls there have been.
+        :param histogram: (bucket label, count) for each lag bucket.
+        :param slow_from: Index of the first bucket that counts as a stall.
+        :return None:
+        """
+        self._current_val.setText(str(round(current, 1)))
+        self._worst_val.setText(str(round(worst, 1)))
+        self._stalls_val.setText(str(stalls))
+        self._histogram.set_counts([count for label, count in histogram], slow_from)
+        self._histogram.setToolTip(self._strings[StringsEnum.HIST_TIP] + "\n"
+                                   + "\n".join(label + ": " + str(count) for label, count in histogram))
+
+    def _set_texts(self) -> None:
+        """
+        Set the text for each element in this view module
+        :return: None
+        """
+        self.setTitle(self._strings[StringsEnum.TITLE])
+        self._current_label.setText(self._strings[StringsEnum.CURRENT])
+        self._worst_label.setText(self._strings[StringsEnum.WORST])
+        self._stalls_label.setText(self._strings[StringsEnum.STALLS])
+        self._current_val.setText("0")
+        self._worst_val.setText("0")
+        self._stalls_val.setText("0")
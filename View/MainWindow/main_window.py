@@ -24,8 +24,8 @@ Company: Red Scientific
 https://redscientific.com/index.html
 """
 
-from logging import getLogger, StreamHandler
-from PySide2.QtWidgets import QMainWindow, QHBoxLayout, QMessageBox, QMdiArea, QSplitter, QFrame
+from logging import getLogger
+from PySide2.QtWidgets import QMainWindow, QHBoxLayout, QMessageBox, QMdiArea, QSplitter, QFrame, QProgressDialog
 from PySide2.QtGui import QFont, QIcon, QCloseEvent
 from PySide2.QtCore import QSize, Qt, QSettings
 from View.HelpWidgets.help_window import HelpWindow
@@ -33,6 +33,7 @@ from View.MainWindow.central_widget import CentralWidget
 from Model.app_defs import image_file_path
 from Resources.Strings.app_strings import company_name, app_name
 from Resources.Strings.main_window_strings import strings, StringsEnum, LangEnum
+from Model.tracer import trace
 
 window_geometry = "mw_geo"
 window_state = "mw_state"
@@ -40,10 +41,8 @@ window_state = "mw_state"
 
 class AppMainWindow(QMainWindow):
     """ The main window the app will be displayed in. """
-    def __init__(self, min_size: QSize, log_handlers: [StreamHandler], lang: LangEnum):
+    def __init__(self, min_size: QSize, lang: LangEnum):
         self._logger = getLogger(__name__)
-        for h in log_handlers:
-            self._logger.addHandler(h)
         self._logger.debug("Initializing")
         super().__init__()
         self._icon = QIcon(image_file_path + "rs_icon.png")
@@ -65,7 +64,14 @@ class AppMainWindow(QMainWindow):
         self.close_check = False
         self._checker = QMessageBox()
         self._close_callback = None
+        self._force_quit_callback = None
+        self._closing = False
         self._help_window = None
+        self._save_progress = QProgressDialog(self)
+        self._save_progress.setWindowModality(Qt.WindowModal)
+        self._save_progress.setMinimumDuration(0)
+        self._save_progress.canceled.connect(self._force_quit_clicked)
+        self._save_progress.reset()
 
         self._strings = dict()
         self.set_lang(lang)
@@ -90,13 +96,17 @@ class AppMainWindow(QMainWindow):
         """
         self.close_check = check
 
+    @trace
     def closeEvent(self, event: QCloseEvent) -> None:
         """
-        Check if user really wants to close the app and only if so alert close and close.
+        Check if user really wants to close the app and only if so alert close. The window stays open until the
+        close handler calls close_now() so shutdown can finish without blocking.
         :param event: The close event.
         :return: None.
         """
-        self._logger.debug("running")
+        if self._closing:
+            event.accept()
+            return
         if self.close_check:
             user_input = self._checker.exec_() == QMessageBox.Yes
             if not user_input:
@@ -106,20 +116,68 @@ class AppMainWindow(QMainWindow):
         settings.setValue(window_geometry, self.saveGeometry())
         settings.setValue(window_state, self.saveState())
         if self._close_callback:
+            event.ignore()
             self._close_callback()
-        event.accept()
-        self._logger.debug("done")
+        else:
+            event.accept()
 
+    @trace
+    def close_now(self) -> None:
+        """
+        Close the window without asking the user or calling the close handler.
+        :return: None.
+        """
+        self._closing = True
+        self.close_save_progress()
+        self.close()
+
+    @trace
+    def show_save_progress(self) -> None:
+        """
+        Show the save progress dialog.
+        :return: None.
+        """
+        self._save_progress.setRange(0, 0)
+        self._save_progress.show()
+
+    def set_save_progress(self, done: int, total: int) -> None:
+        """
+        Update the save progress dialog.
+        :param done: How many files have been saved.
+        :param total: How many files need to be saved.
+        :return: None.
+        """
+        if total > 0:
+            self._save_progress.setMaximum(total)
+            self._save_progress.setValue(done)
+
+    def close_save_progress(self) -> None:
+        """
+        Hide the save progress dialog.
+        :return: None.
+        """
+        self._save_progress.reset()
+        self._save_progress.hide()
+
+    @trace
+    def add_force_quit_handler(self, func: classmethod) -> None:
+        """
+        Add handler for when the user does not want to wait for saving to finish.
+        :param func: The handler.
+        :return: None.
+        """
+        self._force_quit_callback = func
+
+    @trace
     def add_mdi_area(self, mdi_area: QMdiArea) -> None:
         """
         Add MDI area to the main window.
         :param mdi_area: The MDI area to add.
         :return: None.
         """
-        self._logger.debug("running")
         self._splitter.addWidget(mdi_area)
-        self._logger.debug("done")
 
+    @trace
     def add_control_bar_widget(self, widget, stretch: int=0) -> None:
         """
         Add widget to the control layout.
@@ -127,39 +185,35 @@ class AppMainWindow(QMainWindow):
         :param stretch: stretch factor
         :return: None.
         """
-        self._logger.debug("running")
         self._control_layout.addWidget(widget, stretch)
-        self._logger.debug("done")
 
+    @trace
     def add_spacer_item(self, stretch) -> None:
         """
         Add spacer item to maintain control bar format.
         :return: None.
         """
-        self._logger.debug("running")
         self._control_layout.addStretch(stretch)
-        self._logger.debug("done")
 
+    @trace
     def add_close_handler(self, func: classmethod) -> None:
         """
         Add handler to handle close events.
         :param func: The handler.
         :return: None.
         """
-        self._logger.debug("running")
         self._close_callback = func
-        self._logger.debug("done")
 
+    @trace
     def add_menu_bar(self, widget) -> None:
         """
         Add menu bar to main window.
         :param widget: The menu bar.
         :return: None.
         """
-        self._logger.debug("running")
         self.setMenuBar(widget)
-        self._logger.debug("done")
 
+    @trace
     def show_help_window(self, title, msg) -> None:
         """
         Show a pop up message window.
@@ -167,11 +221,9 @@ class AppMainWindow(QMainWindow):
         :param msg: The message to be shown.
         :return: None
         """
-        self._logger.debug("running")
         self._help_window = HelpWindow(title, msg)
         self._help_window.setWindowIcon(self._icon)
         self._help_window.show()
-        self._logger.debug("done")
 
     def _restore_window(self) -> None:
         """
@@ -186,24 +238,33 @@ class AppMainWindow(QMainWindow):
         self.restoreGeometry(settings.value(window_geometry))
         self.restoreState(settings.value(window_state))
 
+    @trace
     def _set_texts(self) -> None:
         """
         Set the texts for the main window.
         :return: None.
         """
-        self._logger.debug("running")
         self.setWindowTitle(self._strings[StringsEnum.TITLE])
         self._checker.setWindowTitle(self._strings[StringsEnum.CLOSE_TITLE])
         self._checker.setText(self._strings[StringsEnum.CLOSE_APP_CONFIRM])
-        self._logger.debug("done")
+        self._save_progress.setWindowTitle(self._strings[StringsEnum.SAVING_TITLE])
+        self._save_progress.setLabelText(self._strings[StringsEnum.SAVING_TEXT])
+        self._save_progress.setCancelButtonText(self._strings[StringsEnum.FORCE_QUIT])
+
+    def _force_quit_clicked(self) -> None:
+        """
+        Private handler for self._save_progress cancel button.
+        :return: None.
+        """
+        if self._force_quit_callback and self._save_progress.isVisible():
+            self._force_quit_callback()
 
+    @trace
     def _setup_checker_buttons(self) -> None:
         """
         Setup window for close check.
         :return: None.
         """
-        self._logger.debug("running")
         self._checker.setStandardButtons(QMessageBox.Yes | QMessageBox.Cancel)
         self._checker.setDefaultButton(QMessageBox.Cancel)
         self._checker.setEscapeButton(QMessageBox.Cancel)
-        self._logger.debug("done")
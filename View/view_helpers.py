@@ -0,0 +1,72 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+from logging import getLogger
+from PySide2.QtWidgets import QPushButton, QFrame
+from Model.app_defs import button_normal_style, button_pressed_style
+
+
+class ClickAnimationButton(QPushButton):
+    """ A button that shows better click and release animation. """
+    def __init__(self, parent=None):
+        self.logger = getLogger(__name__)
+        self.logger.debug("Initializing")
+        super().__init__(parent)
+        self.pressed.connect(self.pressed_color)
+        self.released.connect(self.released_state)
+        self.setStyleSheet(button_normal_style)
+        self.logger.debug("Initialized")
+
+    def pressed_color(self) -> None:
+        """
+        Set this button style to clicked.
+        :return None:
+        """
+        self.setStyleSheet(button_pressed_style)
+
+    def released_state(self) -> None:
+        """
+        Set this button style to normal.
+        :return None:
+        """
+        self.setStyleSheet(button_normal_style)
+
+
+class EasyFrame(QFrame):
+    """ Creates a frame for display purposes depending on bools. """
+    def __init__(self, line=False, vert=False):
+        self.logger = getLogger(__name__)
+        self.logger.debug("Initializing")
+        super().__init__()
+        if line:
+            if vert:
+                self.setFrameShape(QFrame.VLine)
+            else:
+                self.setFrameShape(QFrame.HLine)
+            self.setFrameShadow(QFrame.Sunken)
+        else:
+            self.setFrameShape(QFrame.StyledPanel)
+            self.setFrameShadow(QFrame.Raised)
+        self.logger.debug("Initialized")
@@ -0,0 +1,89 @@
+"""
+Licensed under GNU GPL-3.0-or-later
+
+This file is part of RS Companion.
+
+RS Companion is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RS Companion is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with RS Companion.  If not, see <https://www.gnu.org/licenses/>.
+
+Author: Phillip Riskin
+Date: 2020
+Project: Companion App
+Company: Red Scientific
+https://redscientific.com/index.html
+"""
+
+# Records from connected devices without a window. Options can also be given in a JSON config file whose keys are
+# the option names, for example {"save_dir": "/data", "devices": 2, "duration": 3600}. Command line options win.
+# Run from the project root: python headless.py --save-dir /data --devices 2 --duration 3600
+
+import os
+import sys
+import json
+import logging
+import argparse
+from asyncio import run
+from datetime import datetime
+from Model.app_helpers import format_current_time
+from Controller.headless_controller import HeadlessController
+
+
+def parse_args(args: [str]) -> argparse.Namespace:
+    """
+    :param args: Command line arguments, without the program name.
+    :return Namespace: The parsed arguments, with defaults filled from the config file if one was given.
+    """
+    parser = argparse.ArgumentParser(description="RS Companion headless recorder")
+    parser.add_argument("--config", help="JSON file of option values.")
+    parser.add_argument("--save-dir", default=os.getcwd(), help="Folder to save the experiment in.")
+    parser.add_argument("--name", help="Experiment file name. Defaults to the start time.")
+    parser.add_argument("--devices", type=int, default=1, help="Devices that must connect before recording starts.")
+    parser.add_argument("--wait", type=float, default=0, help="Most seconds to wait for devices. 0 waits forever.")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="Seconds to record for. 0 records until interrupted.")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    parser.add_argument("--metrics-port", type=int, default=0, help="Serve metrics on this port. 0 means off.")
+    parser.add_argument("--uvloop", action="store_true", help="Run on uvloop. It must be installed.")
+    config = parser.parse_known_args(args)[0].config
+    if config:
+        try:
+            with open(config, "r") as file:
+                values = json.load(file)
+        except (OSError, ValueError) as e:
+            parser.error("could not read config file: " + str(e))
+        values = {key.replace("-", "_"): value for key, value in values.items()}
+        unknown = [key for key in values if key not in vars(parser.parse_args([]))]
+        if unknown:
+            parser.error("unknown config options: " + ", ".join(unknown))
+        parser.set_defaults(**values)
+    parsed = parser.parse_args(args)
+    if parsed.uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            parser.error("--uvloop given but uvloop is not installed")
+        uvloop.install()
+    return parsed
+
+
+async def main(args: argparse.Namespace) -> int:
+    name = args.name or format_current_time(datetime.now(), save=True)
+    if not name.endswith(".rs"):
+        name = name + ".rs"
+    controller = HeadlessController(os.path.join(args.save_dir, name), args.devices, args.wait, args.duration,
+                                    logging.getLevelName(args.log_level), args.metrics_port)
+    return 0 if await controller.run() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run(main(parse_args(sys.argv[1:]))))
@@ -24,10 +24,7 @@ https://redscientific.com/index.html
 """
 
 import sys
-import tempfile
-import cProfile  # TODO: Remove this before release.
-import pstats
-from os import remove
+import argparse
 from asyncio import set_event_loop, run
 from asyncqt import QEventLoop
 from PySide2.QtWidgets import QApplication
@@ -35,31 +32,27 @@ from PySide2.QtCore import Qt
 from Controller.app_controller import AppController
 
 
-async def main():
+def parse_args(args: [str]) -> (argparse.Namespace, [str]):
+    """
+    :param args: Command line arguments, without the program name.
+    :return (Namespace, list): The app's arguments and the rest, which are left for Qt.
+    """
+    parser = argparse.ArgumentParser(description="RS Companion")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile from launch. Reports are saved next to the experiment, or in the temp folder.")
+    return parser.parse_known_args(args)
+
+
+async def main(args: argparse.Namespace, qt_args: [str]):
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app = QApplication(sys.argv)
+    app = QApplication(qt_args)
     app_loop = QEventLoop(app)
     set_event_loop(app_loop)
-    controller = AppController()  # Need reference else garbage collector has too much fun
+    controller = AppController(args.profile)  # Need reference else garbage collector has too much fun
     with app_loop:
         sys.exit(app_loop.run_forever())
 
 
 if __name__ == '__main__':
-    profile = False  # True: Profile code. False: Run normally.
-    if profile:
-        filename = tempfile.gettempdir() + "/companion_app_profile.stats"
-        cProfile.run('run(main())', filename)
-        stats = pstats.Stats(filename)
-
-        # Pick sorting order for stat output.
-        stats.sort_stats(pstats.SortKey.CALLS)  # Sort by total calls to code.
-        # stats.sort_stats(pstats.SortKey.CUMULATIVE)  # Sort by time spent in code.
-
-        # Pick print filter
-        stats.print_stats("asyncCompanion")  # Only show project files.
-        # stats.print_stats()  # Show all files.
-
-        remove(filename)  # cleanup
-    else:
-        run(main())
+    app_args, other_args = parse_args(sys.argv[1:])
+    run(main(app_args, sys.argv[:1] + other_args))